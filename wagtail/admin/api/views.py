@@ -68,6 +68,9 @@ class PagesAdminAPIViewSet(PagesAPIViewSet):
     # Allow the parent field to appear on listings
     detail_only_fields = []
 
+    # Responses depend on the user's permissions and on unpublished changes
+    cache_responses = False
+
     known_query_parameters = PagesAPIViewSet.known_query_parameters.union(
         ["for_explorer", "has_children"]
     )
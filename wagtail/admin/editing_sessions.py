@@ -0,0 +1,334 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from wagtail.admin.models import EditingSession
+from wagtail.coreutils import safe_md5
+
+DEFAULT_EDITING_SESSIONS_BACKEND = {
+    "BACKEND": "wagtail.admin.editing_sessions.DatabaseEditingSessionsBackend"
+}
+
+
+def get_editing_sessions_backend():
+    """
+    Return an instance of the backend given by the WAGTAIL_EDITING_SESSIONS_BACKEND
+    setting, used to keep track of the users that are viewing or editing an object.
+    """
+    backend_settings = getattr(
+        settings, "WAGTAIL_EDITING_SESSIONS_BACKEND", DEFAULT_EDITING_SESSIONS_BACKEND
+    )
+    backend_cls = import_string(backend_settings["BACKEND"])
+    return backend_cls(**backend_settings.get("OPTIONS", {}))
+
+
+class BaseEditingSessionsBackend:
+    """
+    Keeps track of the editing sessions of each object. Sessions are represented by
+    (possibly unsaved) ``EditingSession`` instances.
+    """
+
+    # How long a session is shown to other users after its last ping
+    active_session_timeout = timezone.timedelta(minutes=1)
+
+    def create_session(self, user, content_type, object_id):
+        """
+        Start a new session for the user on the given object.
+        """
+        raise NotImplementedError
+
+    def ping(self, session_id, user, content_type, object_id, is_editing):
+        """
+        Record that the session is still active, starting a new one if the session
+        no longer exists. Returns the session, and raises ``ValidationError`` if the
+        data is invalid.
+        """
+        raise NotImplementedError
+
+    def get_other_sessions(self, session):
+        """
+        Return the other active sessions on the session's object, most recently seen
+        first, with their users loaded.
+        """
+        raise NotImplementedError
+
+    def release(self, session_id, user):
+        """
+        End the session, if it belongs to the user.
+        """
+        raise NotImplementedError
+
+    def get_cached_permission(self, user, content_type, object_id):
+        """
+        Return whether the user was recently found to have permission to edit the
+        object, or None if not known.
+        """
+        return None
+
+    def set_cached_permission(self, user, content_type, object_id, can_edit):
+        pass
+
+
+class DatabaseEditingSessionsBackend(BaseEditingSessionsBackend):
+    """
+    Stores the sessions in the database, as ``EditingSession`` records.
+    """
+
+    def create_session(self, user, content_type, object_id):
+        EditingSession.cleanup()
+        return EditingSession.objects.create(
+            user=user,
+            content_type=content_type,
+            object_id=object_id,
+            last_seen_at=timezone.now(),
+        )
+
+    def ping(self, session_id, user, content_type, object_id, is_editing):
+        try:
+            session = EditingSession.objects.get(
+                id=session_id,
+                user=user,
+                content_type=content_type,
+                object_id=object_id,
+            )
+        except EditingSession.DoesNotExist:
+            session = EditingSession(
+                content_type=content_type,
+                object_id=object_id,
+                user=user,
+            )
+
+        session.last_seen_at = timezone.now()
+        session.is_editing = is_editing
+        session.full_clean()
+        session.save()
+        return session
+
+    def get_other_sessions(self, session):
+        return (
+            EditingSession.objects.filter(
+                content_type=session.content_type,
+                object_id=session.object_id,
+                last_seen_at__gte=timezone.now() - self.active_session_timeout,
+            )
+            .exclude(id=session.id)
+            .select_related("user", "user__wagtail_userprofile")
+            .order_by("-last_seen_at")
+        )
+
+    def release(self, session_id, user):
+        EditingSession.objects.filter(id=session_id, user=user).delete()
+
+
+class CacheEditingSessionsBackend(BaseEditingSessionsBackend):
+    """
+    Stores the sessions in a Django cache backend, so that pings don't write to the
+    database. Each session is held in its own key, which expires if the session
+    stops pinging, and each object has a key listing the IDs of its sessions. The
+    list is only changed while holding a lock (taken with the cache's atomic ``add``),
+    so that sessions started at the same time don't overwrite each other's IDs.
+
+    The cache must be shared between all processes, for example Redis or Memcached.
+    """
+
+    # How long a session is kept for after its last ping
+    session_timeout = 60 * 60
+
+    # How long the lock on an object's list of sessions is held for at most, and how
+    # often another process waiting for the lock tries to take it
+    lock_timeout = 5
+    lock_retry_interval = 0.01
+
+    def __init__(self, cache_alias=DEFAULT_CACHE_ALIAS, permission_timeout=30):
+        self.cache = caches[cache_alias]
+        self.permission_timeout = permission_timeout
+
+    def get_object_key(self, content_type, object_id):
+        object_hash = safe_md5(
+            f"{content_type.pk}:{object_id}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return f"wagtail-editing-sessions-{object_hash}"
+
+    def get_session_key(self, session_id):
+        return f"wagtail-editing-session-{session_id}"
+
+    def get_permission_key(self, user, content_type, object_id):
+        return f"{self.get_object_key(content_type, object_id)}-can-edit-{user.pk}"
+
+    def get_next_session_id(self):
+        # Start the counter from the current time in milliseconds, so that IDs keep
+        # increasing (and don't clash with sessions still in the cache) if the
+        # counter is ever evicted
+        counter_key = "wagtail-editing-sessions-counter"
+        self.cache.add(counter_key, int(time.time() * 1000), None)
+        return self.cache.incr(counter_key)
+
+    def update_session_ids(self, content_type, object_id, update):
+        """
+        Replace the list of session IDs held for the object with the result of
+        calling ``update`` on it, while holding the lock on the list.
+        """
+        object_key = self.get_object_key(content_type, object_id)
+        lock_key = f"{object_key}-lock"
+
+        # If the lock can't be taken, its holder most likely died before releasing
+        # it; carry on without it rather than failing the request
+        for _attempt in range(int(self.lock_timeout / self.lock_retry_interval)):
+            if self.cache.add(lock_key, True, self.lock_timeout):
+                is_locked = True
+                break
+            time.sleep(self.lock_retry_interval)
+        else:
+            is_locked = False
+
+        try:
+            session_ids = self.cache.get(object_key, [])
+            new_session_ids = update(session_ids)
+            if new_session_ids != session_ids:
+                self.cache.set(object_key, new_session_ids, self.session_timeout)
+            return new_session_ids
+        finally:
+            if is_locked:
+                self.cache.delete(lock_key)
+
+    def save_session(self, session):
+        self.cache.set(
+            self.get_session_key(session.id),
+            {
+                "user_id": session.user_id,
+                "content_type_id": session.content_type_id,
+                "object_id": session.object_id,
+                "last_seen_at": session.last_seen_at,
+                "is_editing": session.is_editing,
+            },
+            self.session_timeout,
+        )
+
+    def create_session(self, user, content_type, object_id):
+        session = EditingSession(
+            id=self.get_next_session_id(),
+            user=user,
+            content_type=content_type,
+            object_id=str(object_id),
+            last_seen_at=timezone.now(),
+        )
+        self.save_session(session)
+
+        self.update_session_ids(
+            content_type,
+            session.object_id,
+            lambda session_ids: session_ids + [session.id],
+        )
+        return session
+
+    def ping(self, session_id, user, content_type, object_id, is_editing):
+        is_editing = EditingSession._meta.get_field("is_editing").to_python(is_editing)
+        data = self.cache.get(self.get_session_key(session_id))
+        if (
+            data is None
+            or data["user_id"] != user.pk
+            or data["content_type_id"] != content_type.pk
+            or data["object_id"] != str(object_id)
+        ):
+            session = self.create_session(user, content_type, object_id)
+        else:
+            session = EditingSession(
+                id=session_id,
+                user=user,
+                content_type=content_type,
+                object_id=data["object_id"],
+            )
+
+        session.last_seen_at = timezone.now()
+        session.is_editing = is_editing
+        self.save_session(session)
+        return session
+
+    def get_other_sessions(self, session):
+        object_key = self.get_object_key(session.content_type, session.object_id)
+        session_ids = self.cache.get(object_key, [])
+        sessions_data = self.cache.get_many(
+            [self.get_session_key(session_id) for session_id in session_ids]
+        )
+
+        # Drop the IDs of sessions that have expired, and add back the current session
+        # if the list was evicted from the cache
+        def get_live_session_ids(session_ids):
+            live_session_ids = [
+                session_id
+                for session_id in session_ids
+                if session_id == session.id
+                or self.get_session_key(session_id) in sessions_data
+            ]
+            if session.id not in live_session_ids:
+                live_session_ids.append(session.id)
+            return live_session_ids
+
+        live_session_ids = get_live_session_ids(session_ids)
+        if live_session_ids != session_ids:
+            # Sessions may have been added since the list was read
+            live_session_ids = self.update_session_ids(
+                session.content_type, session.object_id, get_live_session_ids
+            )
+
+        active_since = timezone.now() - self.active_session_timeout
+        other_sessions = [
+            EditingSession(
+                id=session_id,
+                user_id=data["user_id"],
+                content_type_id=data["content_type_id"],
+                object_id=data["object_id"],
+                last_seen_at=data["last_seen_at"],
+                is_editing=data["is_editing"],
+            )
+            for session_id in live_session_ids
+            if session_id != session.id
+            and (data := sessions_data.get(self.get_session_key(session_id)))
+            and data["last_seen_at"] >= active_since
+        ]
+        if not other_sessions:
+            return []
+
+        users = get_user_model().objects.select_related("wagtail_userprofile")
+        users = users.in_bulk({other.user_id for other in other_sessions})
+        other_sessions = [other for other in other_sessions if other.user_id in users]
+        for other_session in other_sessions:
+            other_session.user = users[other_session.user_id]
+
+        return sorted(
+            other_sessions,
+            key=lambda other_session: other_session.last_seen_at,
+            reverse=True,
+        )
+
+    def release(self, session_id, user):
+        session_key = self.get_session_key(session_id)
+        data = self.cache.get(session_key)
+        if data is not None and data["user_id"] == user.pk:
+            self.cache.delete(session_key)
+            content_type = ContentType.objects.get_for_id(data["content_type_id"])
+            self.update_session_ids(
+                content_type,
+                data["object_id"],
+                lambda session_ids: [
+                    other_id for other_id in session_ids if other_id != session_id
+                ],
+            )
+
+    def get_cached_permission(self, user, content_type, object_id):
+        if not self.permission_timeout:
+            return None
+        return self.cache.get(self.get_permission_key(user, content_type, object_id))
+
+    def set_cached_permission(self, user, content_type, object_id, can_edit):
+        if self.permission_timeout:
+            self.cache.set(
+                self.get_permission_key(user, content_type, object_id),
+                can_edit,
+                self.permission_timeout,
+            )
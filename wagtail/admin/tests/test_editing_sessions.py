@@ -1,14 +1,18 @@
 import datetime
+import threading
+import time
 
 from django.conf import settings
 from django.contrib.admin.utils import quote
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from freezegun import freeze_time
 
+from wagtail.admin.editing_sessions import get_editing_sessions_backend
 from wagtail.admin.models import EditingSession
 from wagtail.models import GroupPagePermission, Page, Workflow, WorkflowContentType
 from wagtail.test.testapp.models import (
@@ -1254,6 +1258,7 @@ class TestReleaseView(WagtailTestUtils, TestCase):
             last_seen_at=TIMESTAMP_1,
         )
 
+    @freeze_time(TIMESTAMP_NOW)
     def test_release(self):
         response = self.client.post(
             reverse("wagtailadmin_editing_sessions:release", args=(self.session.id,))
@@ -1433,3 +1438,224 @@ class TestModuleInEditViewWithNonRevisableSnippet(TestModuleInEditView):
     def assertRevisionInput(self, soup):
         revision_input = soup.select_one('input[name="revision_id"]')
         self.assertIsNone(revision_input)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+    WAGTAIL_EDITING_SESSIONS_BACKEND={
+        "BACKEND": "wagtail.admin.editing_sessions.CacheEditingSessionsBackend",
+    },
+)
+class TestCacheEditingSessionsBackend(WagtailTestUtils, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = self.create_superuser(
+            "bob", password="password", first_name="Bob", last_name="Testuser"
+        )
+        self.other_user = self.create_superuser(
+            "vic", password="password", first_name="Vic", last_name="Otheruser"
+        )
+        self.login(user=self.user)
+        self.root_page = Page.get_first_root_node()
+
+        self.page = SimplePage(title="Test page", slug="test-page", content="test page")
+        self.root_page.add_child(instance=self.page)
+
+        self.backend = get_editing_sessions_backend()
+        self.content_type = ContentType.objects.get_for_model(Page)
+
+        with freeze_time(TIMESTAMP_PAST):
+            self.old_session = self.backend.create_session(
+                self.other_user, self.content_type, self.page.id
+            )
+        with freeze_time(TIMESTAMP_1):
+            self.session = self.backend.create_session(
+                self.user, self.content_type, self.page.id
+            )
+        with freeze_time(TIMESTAMP_2):
+            self.other_session = self.backend.create_session(
+                self.other_user, self.content_type, self.page.id
+            )
+
+    def ping(self, session_id, data=None):
+        return self.client.post(
+            reverse(
+                "wagtailadmin_editing_sessions:ping",
+                args=("wagtailcore", "page", self.page.id, session_id),
+            ),
+            data or {},
+        )
+
+    def test_session_ids_increase(self):
+        self.assertGreater(self.session.id, self.old_session.id)
+        self.assertGreater(self.other_session.id, self.session.id)
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_ping_existing_session(self):
+        response = self.ping(self.session.id, {"is_editing": "1"})
+        self.assertEqual(response.status_code, 200)
+        response_json = response.json()
+        self.assertEqual(response_json["session_id"], self.session.id)
+        self.assertEqual(
+            response_json["other_sessions"],
+            [
+                {
+                    "session_id": self.other_session.id,
+                    "user": "Vic Otheruser",
+                    "last_seen_at": TIMESTAMP_2.isoformat(),
+                    "is_editing": False,
+                    "revision_id": None,
+                },
+            ],
+        )
+
+        # The session is updated in the cache, not the database
+        self.assertFalse(EditingSession.objects.exists())
+        other_sessions = self.backend.get_other_sessions(self.other_session)
+        self.assertEqual(len(other_sessions), 1)
+        self.assertEqual(other_sessions[0].id, self.session.id)
+        self.assertEqual(other_sessions[0].user, self.user)
+        self.assertEqual(other_sessions[0].last_seen_at, TIMESTAMP_NOW)
+        self.assertTrue(other_sessions[0].is_editing)
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_ping_new_session(self):
+        response = self.ping(999999)
+        self.assertEqual(response.status_code, 200)
+        response_json = response.json()
+
+        new_session_id = response_json["session_id"]
+        self.assertNotIn(
+            new_session_id,
+            [self.old_session.id, self.session.id, self.other_session.id, 999999],
+        )
+        self.assertEqual(
+            response_json["ping_url"],
+            reverse(
+                "wagtailadmin_editing_sessions:ping",
+                args=("wagtailcore", "page", self.page.id, new_session_id),
+            ),
+        )
+        self.assertEqual(
+            [other["session_id"] for other in response_json["other_sessions"]],
+            [self.other_session.id],
+        )
+        self.assertFalse(EditingSession.objects.exists())
+
+    def test_ping_session_of_other_user(self):
+        response = self.ping(self.other_session.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()["session_id"], self.other_session.id)
+
+    def test_invalid_data(self):
+        response = self.ping(self.session.id, {"is_editing": "invalid"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid data"})
+
+    def test_permission_is_cached(self):
+        with freeze_time(TIMESTAMP_NOW):
+            response = self.ping(self.session.id)
+            self.assertEqual(response.status_code, 200)
+
+            self.user.is_superuser = False
+            self.user.save()
+            group = Group.objects.create(name="Admin access only")
+            group.permissions.add(
+                Permission.objects.get(
+                    content_type__app_label="wagtailadmin", codename="access_admin"
+                )
+            )
+            self.user.groups.add(group)
+
+            # The result of the permission check is reused for a short time
+            response = self.ping(self.session.id)
+            self.assertEqual(response.status_code, 200)
+
+        with freeze_time(TIMESTAMP_NOW + datetime.timedelta(minutes=1)):
+            response = self.ping(self.session.id)
+            self.assertEqual(response.status_code, 404)
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_release(self):
+        response = self.client.post(
+            reverse("wagtailadmin_editing_sessions:release", args=(self.session.id,))
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.backend.get_other_sessions(self.other_session), [])
+
+    def get_session_ids(self):
+        return cache.get(self.backend.get_object_key(self.content_type, self.page.id))
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_concurrent_session_creation(self):
+        lock_key = (
+            self.backend.get_object_key(self.content_type, self.page.id) + "-lock"
+        )
+        # Another process is adding a session to the list
+        self.assertTrue(cache.add(lock_key, True))
+
+        sessions = []
+        thread = threading.Thread(
+            target=lambda: sessions.append(
+                self.backend.create_session(self.user, self.content_type, self.page.id)
+            )
+        )
+        thread.start()
+        try:
+            # The new session waits for the lock before adding itself to the list
+            time.sleep(0.1)
+            self.assertTrue(thread.is_alive())
+            cache.set(
+                self.backend.get_object_key(self.content_type, self.page.id),
+                self.get_session_ids() + [999999],
+            )
+        finally:
+            cache.delete(lock_key)
+            thread.join()
+
+        self.assertEqual(
+            self.get_session_ids(),
+            [self.session.id, self.other_session.id, 999999, sessions[0].id],
+        )
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_release_removes_session_from_object(self):
+        self.backend.release(self.session.id, self.user)
+        self.assertNotIn(self.session.id, self.get_session_ids())
+        self.assertIn(self.other_session.id, self.get_session_ids())
+
+    @freeze_time(TIMESTAMP_NOW)
+    def test_cannot_release_other_users_session(self):
+        response = self.client.post(
+            reverse(
+                "wagtailadmin_editing_sessions:release", args=(self.other_session.id,)
+            )
+        )
+        self.assertEqual(response.status_code, 200)
+
+        other_sessions = self.backend.get_other_sessions(self.session)
+        self.assertEqual(
+            [other_session.id for other_session in other_sessions],
+            [self.other_session.id],
+        )
+
+    def test_edit_view(self):
+        response = self.client.get(
+            reverse("wagtailadmin_pages:edit", args=(self.page.id,))
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(EditingSession.objects.exists())
+
+        soup = self.get_soup(response.content)
+        module = soup.select_one('form[data-controller~="w-session"]')
+        ping_url = module.get("data-w-swap-src-value")
+        new_session_id = int(ping_url.rstrip("/").rsplit("/", 1)[1])
+
+        response = self.client.post(ping_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["session_id"], new_session_id)
@@ -2,6 +2,15 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext
 
 from wagtail.admin.ui.tables import BaseColumn, BulkActionsCheckboxColumn, Column, Table
+from wagtail.permissions import page_permission_policy
+
+
+def get_page_perms(instance, parent_context):
+    table = parent_context.get("table")
+    user = parent_context["request"].user
+    if isinstance(table, PageTable):
+        return table.get_page_perms(instance, user)
+    return instance.permissions_for_user(user)
 
 
 class PageTitleColumn(BaseColumn):
@@ -42,9 +51,7 @@ class PageTitleColumn(BaseColumn):
 
     def get_cell_context_data(self, instance, parent_context):
         context = super().get_cell_context_data(instance, parent_context)
-        context["page_perms"] = instance.permissions_for_user(
-            parent_context["request"].user
-        )
+        context["page_perms"] = get_page_perms(instance, parent_context)
         context["parent_page"] = getattr(instance, "annotated_parent_page", None)
         context["show_locale_labels"] = parent_context.get("show_locale_labels")
         context["perms"] = parent_context.get("perms")
@@ -88,9 +95,7 @@ class NavigateToChildrenColumn(BaseColumn):
     def get_cell_context_data(self, instance, parent_context):
         context = super().get_cell_context_data(instance, parent_context)
         context["page"] = instance
-        context["page_perms"] = instance.permissions_for_user(
-            parent_context["request"].user
-        )
+        context["page_perms"] = get_page_perms(instance, parent_context)
         return context
 
     def render_header_html(self, parent_context):
@@ -133,6 +138,19 @@ class PageTable(Table):
 
         self.show_locale_labels = show_locale_labels
         self.actions_next_url = actions_next_url
+        self._page_perms = None
+
+    def get_page_perms(self, instance, user):
+        """
+        Return the PagePermissionTester for the given page. The testers for all rows are
+        built together on first use, and shared between the columns that need them.
+        """
+        if self._page_perms is None:
+            self._page_perms = page_permission_policy.testers_for_pages(user, self.data)
+        try:
+            return self._page_perms[instance.pk]
+        except KeyError:
+            return instance.permissions_for_user(user)
 
     def get_ascending_title_text(self, column):
         return self.ascending_title_text_format % {
@@ -5,15 +5,36 @@ from django.core.exceptions import ValidationError
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
-from django.utils import timezone
 from django.views.decorators.http import require_POST
 
-from wagtail.admin.models import EditingSession
+from wagtail.admin.editing_sessions import get_editing_sessions_backend
 from wagtail.admin.ui.editing_sessions import EditingSessionsList
 from wagtail.admin.utils import get_user_display_name
 from wagtail.models import Page, Revision, RevisionMixin, WorkflowMixin
 
 
+def user_can_edit(user, model, obj):
+    if isinstance(obj, Page):
+        return obj.permissions_for_user(user).can_edit()
+
+    try:
+        permission_policy = model.snippet_viewset.permission_policy
+    except AttributeError:
+        # model is neither a Page nor a snippet
+        raise Http404
+
+    can_edit = permission_policy.user_has_permission_for_instance(user, "change", obj)
+    if not can_edit and isinstance(obj, WorkflowMixin):
+        workflow = obj.get_workflow()
+        if workflow is not None:
+            current_workflow_task = obj.current_workflow_task
+            can_edit = bool(
+                current_workflow_task
+                and current_workflow_task.user_can_access_editor(obj, user)
+            )
+    return can_edit
+
+
 @require_POST
 def ping(request, app_label, model_name, object_id, session_id):
     try:
@@ -26,63 +47,32 @@ def ping(request, app_label, model_name, object_id, session_id):
     content_type = ContentType.objects.get_for_model(model)
 
     obj = get_object_or_404(model, pk=unquoted_object_id)
-    if isinstance(obj, Page):
-        can_edit = obj.permissions_for_user(request.user).can_edit()
-    else:
-        try:
-            permission_policy = model.snippet_viewset.permission_policy
-        except AttributeError:
-            # model is neither a Page nor a snippet
-            raise Http404
 
-        can_edit = permission_policy.user_has_permission_for_instance(
-            request.user, "change", obj
+    backend = get_editing_sessions_backend()
+    can_edit = backend.get_cached_permission(
+        request.user, content_type, unquoted_object_id
+    )
+    if can_edit is None:
+        can_edit = user_can_edit(request.user, model, obj)
+        backend.set_cached_permission(
+            request.user, content_type, unquoted_object_id, can_edit
         )
-        if not can_edit and isinstance(obj, WorkflowMixin):
-            workflow = obj.get_workflow()
-            if workflow is not None:
-                current_workflow_task = obj.current_workflow_task
-                can_edit = (
-                    current_workflow_task
-                    and current_workflow_task.user_can_access_editor(obj, request.user)
-                )
 
     if not can_edit:
         raise Http404
 
     try:
-        session = EditingSession.objects.get(
-            id=session_id,
-            user=request.user,
-            content_type=content_type,
-            object_id=unquoted_object_id,
+        session = backend.ping(
+            session_id,
+            request.user,
+            content_type,
+            unquoted_object_id,
+            request.POST.get("is_editing", False),
         )
-    except EditingSession.DoesNotExist:
-        session = EditingSession(
-            content_type=content_type,
-            object_id=unquoted_object_id,
-            user=request.user,
-        )
-
-    session.last_seen_at = timezone.now()
-    session.is_editing = request.POST.get("is_editing", False)
-    try:
-        session.full_clean()
     except ValidationError:
         return JsonResponse({"error": "Invalid data"}, status=400)
-    else:
-        session.save()
 
-    other_sessions = (
-        EditingSession.objects.filter(
-            content_type=content_type,
-            object_id=unquoted_object_id,
-            last_seen_at__gte=timezone.now() - timezone.timedelta(minutes=1),
-        )
-        .exclude(id=session.id)
-        .select_related("user", "user__wagtail_userprofile")
-        .order_by("-last_seen_at")
-    )
+    other_sessions = backend.get_other_sessions(session)
 
     # create a lookup of sessions indexed by user ID. Multiple sessions from the same user
     # are merged, such that the most recently seen one is reported, but is_editing is true
@@ -196,5 +186,5 @@ def ping(request, app_label, model_name, object_id, session_id):
 
 @require_POST
 def release(request, session_id):
-    EditingSession.objects.filter(id=session_id, user=request.user).delete()
+    get_editing_sessions_backend().release(session_id, request.user)
     return JsonResponse({})
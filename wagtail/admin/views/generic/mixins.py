@@ -17,7 +17,7 @@ from django.utils.translation import gettext as _
 
 from wagtail import hooks
 from wagtail.admin import messages
-from wagtail.admin.models import EditingSession
+from wagtail.admin.editing_sessions import get_editing_sessions_backend
 from wagtail.admin.templatetags.wagtailadmin_tags import user_display_name
 from wagtail.admin.ui.editing_sessions import EditingSessionsModule
 from wagtail.admin.ui.tables import TitleColumn
@@ -688,13 +688,9 @@ class CreateEditViewOptionalFeaturesMixin:
     def get_editing_sessions(self):
         if self.view_name == "create":
             return None
-        EditingSession.cleanup()
         content_type = ContentType.objects.get_for_model(self.model)
-        session = EditingSession.objects.create(
-            user=self.request.user,
-            content_type=content_type,
-            object_id=self.object.pk,
-            last_seen_at=timezone.now(),
+        session = get_editing_sessions_backend().create_session(
+            self.request.user, content_type, self.object.pk
         )
         revision_id = self.object.latest_revision_id if self.revision_enabled else None
         return EditingSessionsModule(
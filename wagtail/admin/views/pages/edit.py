@@ -16,8 +16,8 @@ from django.views.generic.base import View
 from wagtail.actions.publish_page_revision import PublishPageRevisionAction
 from wagtail.admin import messages
 from wagtail.admin.action_menu import PageActionMenu
+from wagtail.admin.editing_sessions import get_editing_sessions_backend
 from wagtail.admin.mail import send_notification
-from wagtail.admin.models import EditingSession
 from wagtail.admin.ui.components import MediaContainer
 from wagtail.admin.ui.editing_sessions import EditingSessionsModule
 from wagtail.admin.ui.side_panels import (
@@ -886,13 +886,9 @@ class EditView(WagtailAdminTemplateMixin, HookResponseMixin, View):
         return MediaContainer(side_panels)
 
     def get_editing_sessions(self):
-        EditingSession.cleanup()
         content_type = get_default_page_content_type()
-        session = EditingSession.objects.create(
-            user=self.request.user,
-            content_type=content_type,
-            object_id=self.page.pk,
-            last_seen_at=timezone.now(),
+        session = get_editing_sessions_backend().create_session(
+            self.request.user, content_type, self.page.pk
         )
         return EditingSessionsModule(
             session,
@@ -10,6 +10,11 @@ class WagtailAPIV2AppConfig(AppConfig):
     verbose_name = _("Wagtail API v2")
 
     def ready(self):
+        from wagtail.api.v2 import caching
+
+        # Install response cache invalidation signal handlers
+        caching.register_signal_handlers()
+
         # Install cache purging signal handlers
         if getattr(settings, "WAGTAILAPI_USE_FRONTENDCACHE", False):
             if apps.is_installed("wagtail.contrib.frontend_cache"):
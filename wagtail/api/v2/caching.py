@@ -0,0 +1,182 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, caches
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.models import Page, PageViewRestriction, Site, get_page_models
+from wagtail.signals import (
+    page_published,
+    page_unpublished,
+    post_page_move,
+    pre_page_move,
+)
+
+# Responses are cached along with the version of each of their tags at the time.
+# Invalidating a tag deletes its version, so any response cached with it no longer
+# matches. Pages are tagged by path: "page-<path>" for responses that contain the
+# page, and "tree-<path>" for responses that list pages within that subtree. Every
+# response also has the "all" tag, which is invalidated when sites change.
+
+ALL_CACHE_TAG = "all"
+
+# Tags of the subtrees of pages that are being moved, by page ID, to be invalidated
+# again once the move is complete
+_moving_page_tags = {}
+
+
+def get_response_cache():
+    """
+    Return the cache backend used for API responses: the "wagtailapi" cache if it is
+    configured, otherwise the default cache.
+    """
+    try:
+        return caches["wagtailapi"]
+    except InvalidCacheBackendError:
+        return caches[DEFAULT_CACHE_ALIAS]
+
+
+def get_response_cache_timeout():
+    return getattr(settings, "WAGTAILAPI_RESPONSE_CACHE_TIMEOUT", 0)
+
+
+def get_page_cache_tag(path):
+    return f"page-{path}"
+
+
+def get_tree_cache_tag(path=""):
+    return f"tree-{path}"
+
+
+def get_tag_version_key(tag):
+    return f"wagtailapi-tag-{tag}"
+
+
+def get_cached_response(cache_key):
+    """
+    Return the dict of response data cached under the given key, or None if there
+    is none or any of its tags have been invalidated since.
+    """
+    cache = get_response_cache()
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+
+    versions = cache.get_many(cached["tag_versions"].keys())
+    if versions != cached["tag_versions"]:
+        return None
+
+    return cached
+
+
+def set_cached_response(cache_key, tags, response, etag=None):
+    """
+    Cache the rendered response under the given key until the timeout given by
+    WAGTAILAPI_RESPONSE_CACHE_TIMEOUT, or until any of the given tags are invalidated.
+    """
+    cache = get_response_cache()
+
+    version_keys = [get_tag_version_key(tag) for tag in [ALL_CACHE_TAG, *tags]]
+    for version_key in version_keys:
+        cache.add(version_key, uuid.uuid4().hex, None)
+    versions = cache.get_many(version_keys)
+    if len(versions) != len(version_keys):
+        # The tag versions couldn't be stored
+        return
+
+    cache.set(
+        cache_key,
+        {
+            "tag_versions": versions,
+            "status": response.status_code,
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "location": response.get("Location"),
+            "etag": etag,
+        },
+        get_response_cache_timeout(),
+    )
+
+
+def invalidate_cache_tags(tags):
+    get_response_cache().delete_many([get_tag_version_key(tag) for tag in tags])
+
+
+def get_page_invalidation_tags(page):
+    """
+    Return the tags of the responses that may change when the given page changes:
+    those containing the page, and those listing any subtree that it's part of.
+    """
+    return [
+        get_page_cache_tag(page.path),
+        get_tree_cache_tag(),
+    ] + [
+        get_tree_cache_tag(page.path[:length])
+        for length in range(page.steplen, len(page.path) + 1, page.steplen)
+    ]
+
+
+def get_subtree_invalidation_tags(page):
+    """
+    Return the tags of the responses that may change when the given page and its
+    descendants change, such as when the page is moved or made private.
+    """
+    descendant_paths = Page.objects.filter(
+        path__startswith=page.path, depth__gt=page.depth
+    ).values_list("path", flat=True)
+    return get_page_invalidation_tags(page) + [
+        tag
+        for path in descendant_paths
+        for tag in [get_page_cache_tag(path), get_tree_cache_tag(path)]
+    ]
+
+
+def invalidate_page_responses(instance, **kwargs):
+    if get_response_cache_timeout():
+        invalidate_cache_tags(get_page_invalidation_tags(instance))
+
+
+def invalidate_page_view_restriction_responses(instance, **kwargs):
+    if get_response_cache_timeout():
+        page = Page.objects.filter(pk=instance.page_id).first()
+        if page is not None:
+            invalidate_cache_tags(get_subtree_invalidation_tags(page))
+
+
+def invalidate_moving_page_responses(instance, **kwargs):
+    # Responses tagged with the page's old paths are invalidated before the move,
+    # and again afterwards in case any were cached while it was in progress
+    if get_response_cache_timeout():
+        tags = get_subtree_invalidation_tags(instance)
+        _moving_page_tags[instance.pk] = tags
+        invalidate_cache_tags(tags)
+
+
+def invalidate_moved_page_responses(instance, **kwargs):
+    old_tags = _moving_page_tags.pop(instance.pk, [])
+    if get_response_cache_timeout():
+        invalidate_cache_tags(old_tags + get_subtree_invalidation_tags(instance))
+
+
+def invalidate_all_responses(**kwargs):
+    if get_response_cache_timeout():
+        invalidate_cache_tags([ALL_CACHE_TAG])
+
+
+def register_signal_handlers():
+    for model in get_page_models():
+        page_published.connect(invalidate_page_responses, sender=model)
+        page_unpublished.connect(invalidate_page_responses, sender=model)
+        post_delete.connect(invalidate_page_responses, sender=model)
+        pre_page_move.connect(invalidate_moving_page_responses, sender=model)
+        post_page_move.connect(invalidate_moved_page_responses, sender=model)
+
+    post_save.connect(
+        invalidate_page_view_restriction_responses, sender=PageViewRestriction
+    )
+    post_delete.connect(
+        invalidate_page_view_restriction_responses, sender=PageViewRestriction
+    )
+
+    post_save.connect(invalidate_all_responses, sender=Site)
+    post_delete.connect(invalidate_all_responses, sender=Site)
@@ -77,8 +77,10 @@ class OrderingFilter(BaseFilterBackend):
 
         And random ordering
         Eg: ?order=random
+
+        When paginating by cursor, the ordering is applied by the paginator instead.
         """
-        if "order" in request.GET:
+        if "order" in request.GET and "cursor" not in request.GET:
             order_by_list = request.GET["order"].split(",")
 
             # Random ordering
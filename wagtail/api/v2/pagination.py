@@ -1,22 +1,32 @@
+import json
 from collections import OrderedDict
 
 from django.conf import settings
+from django.db.models import QuerySet
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 
-from .utils import BadRequestError
+from .utils import BadRequestError, parse_boolean
 
 
 class WagtailPagination(BasePagination):
-    def paginate_queryset(self, queryset, request, view=None):
-        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+    """
+    Paginates listings with the ``?offset`` and ``?limit`` parameters.
 
-        try:
-            offset = int(request.GET.get("offset", 0))
-            if offset < 0:
-                raise ValueError()
-        except ValueError:
-            raise BadRequestError("offset must be a positive integer")
+    Passing the ``?cursor`` parameter switches to keyset pagination instead: results
+    are ordered by ``id`` or ``path`` (chosen with ``?order``), and each page of
+    results gives a ``next_cursor`` to pass in to fetch the following page. An empty
+    ``?cursor`` starts from the first result. Unlike offsets, this stays fast
+    however deep into the results the client gets.
+
+    In either mode, ``?count=false`` skips counting the total number of results.
+    """
+
+    cursor_ordering_fields = ["id", "path"]
+
+    def get_limit(self, request):
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
 
         try:
             limit_default = 20 if not limit_max else min(20, limit_max)
@@ -29,24 +39,112 @@ class WagtailPagination(BasePagination):
         if limit_max and limit > limit_max:
             raise BadRequestError("limit cannot be higher than %d" % limit_max)
 
+        return limit
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+
+        try:
+            count = parse_boolean(request.GET.get("count", "true"))
+        except ValueError:
+            raise BadRequestError("count must be 'true' or 'false'")
+        self.total_count = queryset.count() if count else None
+
+        if "cursor" in request.GET:
+            self.cursor_pagination = True
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        self.cursor_pagination = False
+
+        try:
+            offset = int(request.GET.get("offset", 0))
+            if offset < 0:
+                raise ValueError()
+        except ValueError:
+            raise BadRequestError("offset must be a positive integer")
+
+        limit = self.get_limit(request)
+
         start = offset
         stop = offset + limit
 
-        self.view = view
-        self.total_count = queryset.count()
         return queryset[start:stop]
 
+    def get_cursor_ordering(self, queryset, request):
+        model_field_names = {field.name for field in queryset.model._meta.get_fields()}
+        available_fields = [
+            field_name
+            for field_name in self.cursor_ordering_fields
+            if field_name in model_field_names
+        ]
+
+        ordering = request.GET.get("order", "id")
+        if ordering.removeprefix("-") not in available_fields:
+            raise BadRequestError(
+                "cursor pagination only supports ordering by %s"
+                % " or ".join(available_fields)
+            )
+
+        return ordering
+
+    def encode_cursor(self, ordering, value):
+        return urlsafe_base64_encode(json.dumps([ordering, value]).encode())
+
+    def decode_cursor(self, cursor, ordering):
+        try:
+            cursor_ordering, value = json.loads(urlsafe_base64_decode(cursor))
+        except (TypeError, ValueError):
+            raise BadRequestError("cursor is not valid")
+
+        if cursor_ordering != ordering:
+            raise BadRequestError("cursor was created with a different ordering")
+
+        return value
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        if not isinstance(queryset, QuerySet):
+            raise BadRequestError("cursor pagination cannot be used with search")
+
+        if "offset" in request.GET:
+            raise BadRequestError("cursor pagination cannot be used with offset")
+
+        ordering = self.get_cursor_ordering(queryset, request)
+        field_name = ordering.removeprefix("-")
+        limit = self.get_limit(request)
+
+        queryset = queryset.order_by(ordering)
+        if request.GET["cursor"]:
+            value = self.decode_cursor(request.GET["cursor"], ordering)
+            lookup = "lt" if ordering.startswith("-") else "gt"
+            try:
+                queryset = queryset.filter(**{f"{field_name}__{lookup}": value})
+            except (TypeError, ValueError):
+                raise BadRequestError("cursor is not valid")
+
+        # Fetch one more result than needed to find out whether there's a next page
+        results = list(queryset[: limit + 1])
+        if len(results) > limit:
+            results = results[:limit]
+            self.next_cursor = self.encode_cursor(
+                ordering, getattr(results[-1], field_name)
+            )
+        else:
+            self.next_cursor = None
+
+        return results
+
     def get_paginated_response(self, data):
+        meta = OrderedDict(
+            [
+                ("total_count", self.total_count),
+            ]
+        )
+        if self.cursor_pagination:
+            meta["next_cursor"] = self.next_cursor
+
         data = OrderedDict(
             [
-                (
-                    "meta",
-                    OrderedDict(
-                        [
-                            ("total_count", self.total_count),
-                        ]
-                    ),
-                ),
+                ("meta", meta),
                 ("items", data),
             ]
         )
@@ -1,5 +1,7 @@
 from collections import OrderedDict
 
+from django.db import models
+from django.db.models import prefetch_related_objects
 from django.urls.exceptions import NoReverseMatch
 from modelcluster.models import get_all_child_relations
 from rest_framework import relations, serializers
@@ -7,6 +9,8 @@ from rest_framework.fields import Field, SkipField
 from taggit.managers import _TaggableManager
 
 from wagtail import fields as wagtailcore_fields
+from wagtail.blocks import StreamValue
+from wagtail.models import Site
 
 from .utils import get_object_detail_url
 
@@ -139,6 +143,12 @@ class PageParentField(relations.RelatedField):
     """
 
     def get_attribute(self, instance):
+        try:
+            # Parents found in bulk by PageSerializer.prepare_instances
+            return self.context["parent_pages"][instance.pk]
+        except KeyError:
+            pass
+
         parent = instance.get_parent()
 
         if self.context["base_queryset"].filter(id=parent.id).exists():
@@ -279,9 +289,25 @@ class TagsField(Field):
     """
 
     def to_representation(self, value):
+        if value.prefetch_cache_name in getattr(
+            value.instance, "_prefetched_objects_cache", {}
+        ):
+            return sorted(tag.name for tag in value.all())
         return list(value.all().order_by("name").values_list("name", flat=True))
 
 
+class BaseListSerializer(serializers.ListSerializer):
+    """
+    Serializes a list of objects, giving the child serializer the chance to fetch
+    the related data for all of them at once first.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if isinstance(data, models.Manager) else data)
+        self.child.prepare_instances(instances)
+        return super().to_representation(instances)
+
+
 class BaseSerializer(serializers.ModelSerializer):
     # Add StreamField to serializer_field_mapping
     serializer_field_mapping = (
@@ -349,6 +375,57 @@ class BaseSerializer(serializers.ModelSerializer):
 
         return data
 
+    def prepare_instances(self, instances):
+        """
+        Fetch the related objects, child relations, tags and StreamField blocks
+        needed to serialize the given instances in bulk, rather than with queries
+        for each instance.
+        """
+        if not instances:
+            return
+
+        lookups = []
+        nested_fields = []
+        stream_fields = []
+        for field in self.fields.values():
+            if isinstance(field, (RelatedField, ChildRelationField, TagsField)):
+                lookups.append(field.source)
+                if not isinstance(field, TagsField):
+                    nested_fields.append(field)
+            elif isinstance(field, StreamField):
+                stream_fields.append(field)
+            elif hasattr(field, "prefetch_for_instances"):
+                # Fields such as ImageRenditionField can fetch their data in bulk
+                field.prefetch_for_instances(instances)
+
+        if lookups:
+            prefetch_related_objects(instances, *lookups)
+
+        for field in nested_fields:
+            if isinstance(field, ChildRelationField):
+                related_objects = [
+                    child_object
+                    for instance in instances
+                    for child_object in getattr(instance, field.source).all()
+                ]
+            else:
+                related_objects = [
+                    related_object
+                    for related_object in (
+                        getattr(instance, field.source) for instance in instances
+                    )
+                    if related_object is not None
+                ]
+
+            field.serializer_class(context=self.context).prepare_instances(
+                related_objects
+            )
+
+        for field in stream_fields:
+            StreamValue.bulk_prefetch_blocks(
+                [getattr(instance, field.source) for instance in instances]
+            )
+
     def build_property_field(self, field_name, model_class):
         # TaggableManager is not a Django field so it gets treated as a property
         field = getattr(model_class, field_name)
@@ -392,6 +469,41 @@ class PageSerializer(BaseSerializer):
 
         return super().build_relational_field(field_name, relation_info)
 
+    def prepare_instances(self, instances):
+        super().prepare_instances(instances)
+        if not instances:
+            return
+
+        lookups = [
+            field_name
+            for field_name in ["locale", "alias_of"]
+            if field_name in self.fields
+        ]
+        if lookups:
+            prefetch_related_objects(instances, *lookups)
+
+        if "html_url" in self.fields:
+            # Share a single lookup of the site root paths between all pages
+            site_root_paths = Site.get_site_root_paths()
+            for page in instances:
+                page._wagtail_cached_site_root_paths = site_root_paths
+
+        if "parent" in self.fields:
+            parent_paths = {
+                page.pk: page.path[: -page.steplen]
+                for page in instances
+                if page.depth > 1
+            }
+            parents = {
+                parent.path: parent
+                for parent in self.context["base_queryset"].filter(
+                    path__in=parent_paths.values()
+                )
+            }
+            self.context.setdefault("parent_pages", {}).update(
+                {pk: parents.get(path) for pk, path in parent_paths.items()}
+            )
+
 
 def get_serializer_class(
     model,
@@ -406,6 +518,7 @@ def get_serializer_class(
     class Meta:
         model = model_
         fields = list(field_names)
+        list_serializer_class = BaseListSerializer
 
     attrs = {
         "Meta": Meta,
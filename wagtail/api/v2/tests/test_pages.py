@@ -1,3 +1,4 @@
+import base64
 import collections
 import json
 from io import StringIO
@@ -6,14 +7,16 @@ from unittest import mock
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
+from django.core.cache import caches
+from django.db import connection
 from django.test import TestCase, TransactionTestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
 from wagtail.api.v2 import signal_handlers
 from wagtail.api.v2.views import PagesAPIViewSet
-from wagtail.models import Locale, Page, Site
+from wagtail.models import Locale, Page, PageViewRestriction, Site
 from wagtail.models.view_restrictions import BaseViewRestriction
 from wagtail.test.demosite import models
 from wagtail.test.testapp.models import StreamPage
@@ -1098,6 +1101,113 @@ class TestPageListing(WagtailTestUtils, TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(content, {"message": "offset must be a positive integer"})
 
+    # CURSOR
+
+    @override_settings(WAGTAILAPI_LIMIT_MAX=None)
+    def get_ordered_page_ids(self, ordering):
+        response = self.get_response(limit=1000)
+        page_ids = self.get_page_id_list(json.loads(response.content.decode("UTF-8")))
+        return list(
+            Page.objects.filter(id__in=page_ids)
+            .order_by(ordering)
+            .values_list("id", flat=True)
+        )
+
+    def test_cursor_pagination(self):
+        expected_ids = self.get_ordered_page_ids("id")
+
+        response = self.get_response(cursor="", limit=5)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), expected_ids[:5])
+        self.assertEqual(content["meta"]["total_count"], len(expected_ids))
+        self.assertTrue(content["meta"]["next_cursor"])
+
+        response = self.get_response(cursor=content["meta"]["next_cursor"], limit=5)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), expected_ids[5:10])
+
+    def test_cursor_pagination_last_page(self):
+        page_ids = []
+        cursor = ""
+        while cursor is not None:
+            response = self.get_response(cursor=cursor, limit=7)
+            content = json.loads(response.content.decode("UTF-8"))
+            page_ids.extend(self.get_page_id_list(content))
+            cursor = content["meta"]["next_cursor"]
+
+        self.assertEqual(page_ids, self.get_ordered_page_ids("id"))
+
+    def test_cursor_pagination_by_path(self):
+        response = self.get_response(cursor="", order="-path", limit=3)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        response = self.get_response(
+            cursor=content["meta"]["next_cursor"], order="-path", limit=3
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(
+            self.get_page_id_list(content), self.get_ordered_page_ids("-path")[3:6]
+        )
+
+    def test_cursor_with_unsupported_ordering_gives_error(self):
+        response = self.get_response(cursor="", order="title")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content,
+            {"message": "cursor pagination only supports ordering by id or path"},
+        )
+
+    def test_cursor_with_different_ordering_gives_error(self):
+        response = self.get_response(cursor="", limit=2)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        response = self.get_response(
+            cursor=content["meta"]["next_cursor"], order="path"
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content, {"message": "cursor was created with a different ordering"}
+        )
+
+    def test_invalid_cursor_gives_error(self):
+        response = self.get_response(cursor="abc")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor is not valid"})
+
+    def test_cursor_with_offset_gives_error(self):
+        response = self.get_response(cursor="", offset=10)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content, {"message": "cursor pagination cannot be used with offset"}
+        )
+
+    # COUNT
+
+    def test_count_false(self):
+        response = self.get_response(count="false", limit=5)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertIsNone(content["meta"]["total_count"])
+        self.assertEqual(len(content["items"]), 5)
+
+    def test_count_not_boolean_gives_error(self):
+        response = self.get_response(count="abc")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "count must be 'true' or 'false'"})
+
     # REGRESSION TESTS
 
     def test_issue_3967(self):
@@ -1862,6 +1972,321 @@ class TestPageDetailWithStreamField(TestCase):
         self.assertEqual(content["body"][0]["value"]["alt_text"], "Some alt text")
 
 
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+)
+class TestPageListingQueries(TestCase):
+    fixtures = ["demosite.json"]
+
+    def setUp(self):
+        blog_page = models.BlogEntryPage.objects.get(id=18)
+        blog_page.carousel_items = [
+            models.BlogEntryPageCarouselItem(
+                image_id=14, caption="Elephant", link_external="https://example.com"
+            )
+        ]
+        blog_page.related_links = [
+            models.BlogEntryPageRelatedLink(
+                title="Elephants", link_external="https://example.com/elephants"
+            )
+        ]
+        blog_page.save()
+
+        for i in range(3):
+            blog_page.copy(update_attrs={"slug": f"elephants-{i}"})
+
+    def count_queries(self, limit):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("wagtailapi_v2:pages:listing"),
+                {
+                    "type": "demosite.BlogEntryPage",
+                    "fields": "*",
+                    "order": "-id",
+                    "limit": limit,
+                },
+            )
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(len(content["items"]), limit)
+        self.assertEqual(content["items"][0]["tags"], ["wagtail"])
+        self.assertEqual(content["items"][0]["carousel_items"][0]["image"]["id"], 14)
+        self.assertEqual(content["items"][0]["related_links"][0]["title"], "Elephants")
+        return len(queries)
+
+    def test_number_of_queries_does_not_depend_on_number_of_results(self):
+        self.assertEqual(self.count_queries(1), self.count_queries(3))
+
+
+class TestPageListingWithStreamField(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        homepage = Page.objects.get(url_path="/home/")
+        homepage.add_child(
+            instance=StreamPage(
+                title="stream page",
+                slug="stream-page",
+                body='[{"type": "text", "value": "foo"}]',
+            )
+        )
+
+    def get_streampage_queries(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("wagtailapi_v2:pages:listing"),
+                {"type": "tests.StreamPage", **params},
+            )
+        self.assertEqual(response.status_code, 200)
+        return response, [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "tests_streampage"' in query["sql"]
+        ]
+
+    def test_unrequested_streamfield_is_not_loaded(self):
+        response, queries = self.get_streampage_queries(fields="title")
+
+        self.assertNotIn("body", json.loads(response.content)["items"][0])
+        self.assertTrue(queries)
+        for sql in queries:
+            self.assertNotIn('"tests_streampage"."body"', sql)
+
+    def test_requested_streamfield_is_loaded(self):
+        response, queries = self.get_streampage_queries(fields="body")
+
+        self.assertEqual(
+            json.loads(response.content)["items"][0]["body"][0]["value"], "foo"
+        )
+        self.assertIn('"tests_streampage"."body"', queries[-1])
+
+
+@override_settings(
+    WAGTAILAPI_RESPONSE_CACHE_TIMEOUT=300,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtailapi-response-cache-tests",
+        }
+    },
+)
+class TestPageResponseCache(WagtailTestUtils, TestCase):
+    fixtures = ["demosite.json"]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def get_listing(self, **params):
+        return self.client.get(reverse("wagtailapi_v2:pages:listing"), params)
+
+    def get_detail(self, page_id, **headers):
+        return self.client.get(
+            reverse("wagtailapi_v2:pages:detail", args=(page_id,)), headers=headers
+        )
+
+    def get_titles(self, response):
+        return [
+            item["title"]
+            for item in json.loads(response.content.decode("UTF-8"))["items"]
+        ]
+
+    def publish_title(self, page_id, title):
+        page = Page.objects.get(id=page_id).specific
+        page.title = title
+        page.save_revision().publish()
+
+    def test_listing_is_cached(self):
+        response = self.get_listing(child_of=5)
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(1):
+            # Only the site is looked up
+            cached_response = self.get_listing(child_of=5)
+
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.content, response.content)
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    def test_query_string_is_normalised(self):
+        self.get_listing(child_of=5, fields="title")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("wagtailapi_v2:pages:listing") + "?fields=title&child_of=5"
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_listing_is_invalidated_by_publishing_page_in_subtree(self):
+        self.get_listing(child_of=5)
+
+        self.publish_title(18, "Blog post about hippos")
+
+        self.assertIn(
+            "Blog post about hippos", self.get_titles(self.get_listing(child_of=5))
+        )
+
+    def test_listing_is_invalidated_by_unpublishing_page_in_subtree(self):
+        self.get_listing(descendant_of=2)
+
+        Page.objects.get(id=22).unpublish()
+
+        self.assertNotIn(
+            "A grandchild page", self.get_titles(self.get_listing(descendant_of=2))
+        )
+
+    def test_listing_is_invalidated_by_deleting_page_in_subtree(self):
+        self.get_listing(child_of=5)
+
+        Page.objects.get(id=18).delete()
+
+        self.assertNotIn(
+            "Blog post about elephants", self.get_titles(self.get_listing(child_of=5))
+        )
+
+    def test_listing_is_not_invalidated_by_publishing_page_in_other_subtree(self):
+        self.get_listing(child_of=5)
+
+        self.publish_title(8, "Event one")
+
+        with self.assertNumQueries(1):
+            self.get_listing(child_of=5)
+
+    def test_detail_is_invalidated_by_publishing_page(self):
+        self.get_detail(18)
+
+        self.publish_title(18, "Blog post about hippos")
+
+        content = json.loads(self.get_detail(18).content.decode("UTF-8"))
+        self.assertEqual(content["title"], "Blog post about hippos")
+
+    def test_detail_is_invalidated_by_publishing_parent_page(self):
+        self.get_detail(18)
+
+        self.publish_title(5, "Blog")
+
+        content = json.loads(self.get_detail(18).content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["parent"]["title"], "Blog")
+
+    def test_responses_are_invalidated_by_adding_view_restriction(self):
+        self.get_listing(descendant_of=6)
+        self.get_detail(22)
+
+        restriction = PageViewRestriction.objects.create(
+            page_id=21, restriction_type="password", password="secret"
+        )
+
+        self.assertNotIn(
+            "A grandchild page", self.get_titles(self.get_listing(descendant_of=6))
+        )
+        self.assertEqual(self.get_detail(22).status_code, 404)
+
+        restriction.delete()
+
+        self.assertIn(
+            "A grandchild page", self.get_titles(self.get_listing(descendant_of=6))
+        )
+        self.assertEqual(self.get_detail(22).status_code, 200)
+
+    def test_responses_are_invalidated_by_moving_page(self):
+        self.get_listing(child_of=5)
+        self.get_listing(child_of=6)
+        self.get_detail(18)
+
+        Page.objects.get(id=18).move(Page.objects.get(id=6), pos="last-child")
+
+        self.assertNotIn(
+            "Blog post about elephants", self.get_titles(self.get_listing(child_of=5))
+        )
+        self.assertIn(
+            "Blog post about elephants", self.get_titles(self.get_listing(child_of=6))
+        )
+        content = json.loads(self.get_detail(18).content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["parent"]["title"], "Standard index")
+        self.assertIn("/standard-index/blog-post-again/", content["meta"]["html_url"])
+
+    def test_responses_are_invalidated_by_moving_ancestor_page(self):
+        self.get_listing(child_of=21)
+        self.get_detail(22)
+
+        Page.objects.get(id=21).move(Page.objects.get(id=5), pos="last-child")
+
+        self.assertIn(
+            "A grandchild page", self.get_titles(self.get_listing(child_of=21))
+        )
+        content = json.loads(self.get_detail(22).content.decode("UTF-8"))
+        self.assertIn(
+            "/blog-index/a-deeper-menu-level/a-grandchild-page/",
+            content["meta"]["html_url"],
+        )
+
+    def test_responses_are_invalidated_by_changing_site(self):
+        self.get_listing(child_of=5)
+        self.get_detail(18)
+
+        site = Site.objects.get(is_default_site=True)
+        site.hostname = "example.com"
+        site.save()
+
+        content = json.loads(self.get_detail(18).content.decode("UTF-8"))
+        self.assertIn("example.com", content["meta"]["html_url"])
+        with CaptureQueriesContext(connection) as queries:
+            self.get_listing(child_of=5)
+        self.assertGreater(len(queries), 1)
+
+    def test_etag(self):
+        response = self.get_detail(18)
+        etag = response["ETag"]
+
+        # From the response cache
+        response = self.get_detail(18, if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Without the response cache, the ETag is the same until the page is published
+        caches["default"].clear()
+        response = self.get_detail(18, if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        self.publish_title(18, "Blog post about hippos")
+
+        response = self.get_detail(18, if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_find_view_is_cached(self):
+        response = self.client.get(
+            reverse("wagtailapi_v2:pages:find"), {"html_path": "/blog-index/"}
+        )
+        self.assertEqual(response.status_code, 302)
+
+        with self.assertNumQueries(1):
+            cached_response = self.client.get(
+                reverse("wagtailapi_v2:pages:find"), {"html_path": "/blog-index/"}
+            )
+        self.assertEqual(cached_response.status_code, 302)
+        self.assertEqual(cached_response["Location"], response["Location"])
+
+    def test_authenticated_requests_are_not_cached(self):
+        self.create_test_user()
+        credentials = base64.b64encode(b"test@email.com:password").decode()
+        url = reverse("wagtailapi_v2:pages:listing") + "?child_of=5"
+        self.client.get(url, headers={"authorization": f"Basic {credentials}"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, headers={"authorization": f"Basic {credentials}"}
+            )
+        self.assertGreater(len(queries), 2)
+        self.assertNotIn("ETag", response)
+
+    @override_settings(WAGTAILAPI_RESPONSE_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.get_listing(child_of=5)
+
+        response = self.get_listing(child_of=5)
+        self.assertNotIn("ETag", response)
+
+
 @override_settings(
     WAGTAILFRONTENDCACHE={
         "varnish": {
@@ -2,9 +2,12 @@ from collections import OrderedDict
 
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist
-from django.http import Http404
+from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
+from django.template.response import SimpleTemplateResponse
 from django.urls import path, reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import urlencode
 from modelcluster.fields import ParentalKey
 from rest_framework import status
 from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
@@ -12,8 +15,17 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from wagtail.api import APIField
+from wagtail.coreutils import safe_md5
+from wagtail.fields import StreamField
 from wagtail.models import Page, PageViewRestriction, Site
 
+from .caching import (
+    get_cached_response,
+    get_page_cache_tag,
+    get_response_cache_timeout,
+    get_tree_cache_tag,
+    set_cached_response,
+)
 from .filters import (
     AncestorOfFilter,
     ChildOfFilter,
@@ -46,6 +58,8 @@ class BaseAPIViewSet(GenericViewSet):
         [
             "limit",
             "offset",
+            "cursor",
+            "count",
             "fields",
             "order",
             "search",
@@ -63,6 +77,9 @@ class BaseAPIViewSet(GenericViewSet):
     detail_only_fields = []
     name = None  # Set on subclass.
 
+    # Whether to use the response cache, see can_cache_response
+    cache_responses = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -76,19 +93,103 @@ class BaseAPIViewSet(GenericViewSet):
         return self.model.objects.all().order_by("id")
 
     def listing_view(self, request):
+        use_cache = self.can_cache_response()
+        if use_cache:
+            cached_response = self.get_cached_response()
+            if cached_response is not None:
+                return cached_response
+
         queryset = self.get_queryset()
         self.check_query_parameters(queryset)
+        queryset = self.defer_unused_fields(queryset)
         queryset = self.filter_queryset(queryset)
         queryset = self.paginate_queryset(queryset)
+
+        if use_cache:
+            etag = self.get_etag(queryset, getattr(self.paginator, "total_count", None))
+            not_modified_response = get_conditional_response(request, etag=etag)
+            if not_modified_response is not None:
+                not_modified_response["ETag"] = etag
+                return not_modified_response
+
         serializer = self.get_serializer(queryset, many=True)
-        return self.get_paginated_response(serializer.data)
+        response = self.get_paginated_response(serializer.data)
+
+        if use_cache:
+            self.cache_response(response, self.get_listing_cache_tags(), etag)
+        return response
+
+    def defer_unused_fields(self, queryset):
+        """
+        Defer loading the StreamFields of the listed model that are not included in
+        the response, so that they are neither fetched nor deserialised.
+        """
+        model = queryset.model
+        stream_fields = [
+            field
+            for field in model._meta.concrete_fields
+            if isinstance(field, StreamField)
+        ]
+        if not stream_fields:
+            return queryset
+
+        model_field_names = {field.name for field in model._meta.get_fields()}
+        serializer_class = self.get_serializer_class()
+
+        used_fields = set()
+        for field_name in serializer_class.Meta.fields:
+            declared_field = serializer_class._declared_fields.get(field_name)
+            if declared_field is not None:
+                # Fields such as "type" and "html_url" don't use StreamFields, but
+                # overridden serializers may read from another field
+                source = declared_field.source or field_name
+            else:
+                source = field_name
+            source = source.split(".")[0]
+
+            if source in model_field_names:
+                used_fields.add(source)
+            elif declared_field is None or declared_field.source:
+                # A property or method, which could read any field
+                return queryset
+
+        deferred_fields = [
+            field.name for field in stream_fields if field.name not in used_fields
+        ]
+        if deferred_fields:
+            queryset = queryset.defer(*deferred_fields)
+        return queryset
 
     def detail_view(self, request, pk):
+        use_cache = self.can_cache_response()
+        if use_cache:
+            cached_response = self.get_cached_response()
+            if cached_response is not None:
+                return cached_response
+
         instance = self.get_object()
+
+        if use_cache:
+            etag = self.get_etag([instance])
+            not_modified_response = get_conditional_response(request, etag=etag)
+            if not_modified_response is not None:
+                not_modified_response["ETag"] = etag
+                return not_modified_response
+
         serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        response = Response(serializer.data)
+
+        if use_cache:
+            self.cache_response(response, self.get_detail_cache_tags(instance), etag)
+        return response
 
     def find_view(self, request):
+        use_cache = self.can_cache_response()
+        if use_cache:
+            cached_response = self.get_cached_response()
+            if cached_response is not None:
+                return cached_response
+
         queryset = self.get_queryset()
 
         try:
@@ -113,7 +214,122 @@ class BaseAPIViewSet(GenericViewSet):
                 )
             )
 
-        return redirect(url)
+        response = redirect(url)
+
+        if use_cache:
+            self.cache_response(response, self.get_detail_cache_tags(obj))
+        return response
+
+    def can_cache_response(self):
+        """
+        Whether responses from this endpoint can be served from and stored in the
+        response cache. This is the case for endpoints that enable
+        ``cache_responses``, when WAGTAILAPI_RESPONSE_CACHE_TIMEOUT is set, for
+        anonymous JSON requests that haven't passed any view restrictions.
+        """
+        request = self.request
+        return bool(
+            self.cache_responses
+            and get_response_cache_timeout()
+            and request.accepted_renderer.format == "json"
+            and not request.user.is_authenticated
+            and not getattr(request, "session", {}).get(
+                PageViewRestriction.passed_view_restrictions_session_key
+            )
+        )
+
+    def get_response_cache_key(self):
+        """
+        Return the key the response to the current request is cached under, based
+        on its URL, normalised query string and site.
+        """
+        request = self.request
+        site = Site.find_for_request(request)
+        key = "|".join(
+            [
+                request.build_absolute_uri(request.path),
+                urlencode(sorted(request.GET.lists()), doseq=True),
+                str(site.pk if site else ""),
+                request.accepted_renderer.format,
+            ]
+        )
+        return "wagtailapi-response-%s" % (
+            safe_md5(key.encode(), usedforsecurity=False).hexdigest()
+        )
+
+    def get_cached_response(self):
+        cached = get_cached_response(self.get_response_cache_key())
+        if cached is None:
+            return None
+
+        response = None
+        if cached["etag"]:
+            response = get_conditional_response(self.request, etag=cached["etag"])
+
+        if response is None:
+            response = HttpResponse(
+                cached["content"],
+                status=cached["status"],
+                content_type=cached["content_type"],
+            )
+            if cached["location"]:
+                response["Location"] = cached["location"]
+
+        if cached["etag"]:
+            response["ETag"] = cached["etag"]
+        return response
+
+    def cache_response(self, response, cache_tags, etag=None):
+        """
+        Store the response in the response cache once it has been rendered, to be
+        served until any of the given cache tags are invalidated.
+        """
+        if etag:
+            response["ETag"] = etag
+
+        cache_key = self.get_response_cache_key()
+
+        def callback(response):
+            set_cached_response(cache_key, cache_tags, response, etag)
+
+        if isinstance(response, SimpleTemplateResponse):
+            response.add_post_render_callback(callback)
+        else:
+            callback(response)
+
+    def get_etag(self, objects, *extra):
+        """
+        Return an ETag for a response containing the given objects, which changes
+        whenever any of them are published. Returns None if the objects cannot be
+        published.
+        """
+        versions = []
+        for obj in objects:
+            if not hasattr(obj, "last_published_at"):
+                return None
+            versions.append(
+                "%s:%s"
+                % (
+                    obj.pk,
+                    obj.last_published_at.isoformat() if obj.last_published_at else "",
+                )
+            )
+
+        key = "|".join([self.get_response_cache_key(), *versions, *map(str, extra)])
+        return '"%s"' % safe_md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def get_listing_cache_tags(self):
+        """
+        Return the cache tags for the current listing response. Invalidating any
+        of them removes it from the response cache.
+        """
+        return []
+
+    def get_detail_cache_tags(self, instance):
+        """
+        Return the cache tags for a response containing the given object.
+        """
+        return []
 
     def find_object(self, queryset, request):
         """
@@ -461,6 +677,7 @@ class PagesAPIViewSet(BaseAPIViewSet):
     detail_only_fields = ["parent"]
     name = "pages"
     model = Page
+    cache_responses = True
 
     @classmethod
     def get_detail_default_fields(cls, model):
@@ -482,6 +699,29 @@ class PagesAPIViewSet(BaseAPIViewSet):
 
         return listing_default_fields
 
+    def get_listing_cache_tags(self):
+        # Listings are invalidated by changes to any page within the subtree they
+        # list from
+        for parameter in ["child_of", "descendant_of"]:
+            value = self.request.GET.get(parameter)
+            if value == "root":
+                return [get_tree_cache_tag(self.get_root_page().path)]
+            elif value:
+                return [
+                    get_tree_cache_tag(
+                        Page.objects.values_list("path", flat=True).get(id=value)
+                    )
+                ]
+
+        return [get_tree_cache_tag()]
+
+    def get_detail_cache_tags(self, instance):
+        # The response includes details of the parent page
+        return [
+            get_page_cache_tag(instance.path),
+            get_page_cache_tag(instance.path[: -instance.steplen]),
+        ]
+
     def get_root_page(self):
         """
         Returns the page that is used when the `&child_of=root` filter is used.
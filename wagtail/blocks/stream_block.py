@@ -24,6 +24,7 @@ from .base import (
     get_error_list_json_data,
     get_help_icon,
 )
+from .field_block import ChooserBlock
 
 __all__ = [
     "BaseStreamBlock",
@@ -722,6 +723,46 @@ class StreamValue(MutableSequence):
                 child_block, value, id=self._raw_data[i].get("id")
             )
 
+    @staticmethod
+    def bulk_prefetch_blocks(stream_values):
+        """
+        Populate _bound_blocks on all of the given StreamValues at once, so that each child
+        block's bulk_to_python method is called a single time across all of the streams
+        rather than once per stream. Chooser blocks are grouped by their target model, so
+        that the database lookups for (for example) the chooser blocks on a list of pages
+        are batched into one query per model, even across different page types.
+        """
+        # Group the (stream value, index, child block) entries of unconverted items by the
+        # block that will convert them. Blocks are not hashable, so key chooser blocks by
+        # their model, and any other block by the identity of the stream block and the
+        # type name
+        bulk_blocks_by_key = {}
+        items_by_key = defaultdict(list)
+        for stream_value in stream_values:
+            child_blocks = stream_value.stream_block.child_blocks
+            for i, raw_item in enumerate(stream_value._raw_data):
+                if (
+                    stream_value._bound_blocks[i] is not None
+                    or raw_item["type"] not in child_blocks
+                ):
+                    continue
+                child_block = child_blocks[raw_item["type"]]
+                if type(child_block).bulk_to_python is ChooserBlock.bulk_to_python:
+                    key = child_block.model_class
+                else:
+                    key = (id(stream_value.stream_block), raw_item["type"])
+                bulk_blocks_by_key.setdefault(key, child_block)
+                items_by_key[key].append((stream_value, i, child_block))
+
+        for key, items in items_by_key.items():
+            converted_values = bulk_blocks_by_key[key].bulk_to_python(
+                [stream_value._raw_data[i]["value"] for stream_value, i, __ in items]
+            )
+            for (stream_value, i, child_block), value in zip(items, converted_values):
+                stream_value._bound_blocks[i] = StreamValue.StreamChild(
+                    child_block, value, id=stream_value._raw_data[i].get("id")
+                )
+
     def get_prep_value(self):
         prep_value = []
 
@@ -9,12 +9,19 @@ class WagtailRedirectsAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
 
     def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
         from wagtail.signals import page_slug_changed, post_page_move
 
+        from .models import Redirect
         from .signal_handlers import (
             autocreate_redirects_on_page_move,
             autocreate_redirects_on_slug_change,
+            post_delete_redirect_signal_handler,
+            post_save_redirect_signal_handler,
         )
 
         post_page_move.connect(autocreate_redirects_on_page_move)
         page_slug_changed.connect(autocreate_redirects_on_slug_change)
+        post_save.connect(post_save_redirect_signal_handler, sender=Redirect)
+        post_delete.connect(post_delete_redirect_signal_handler, sender=Redirect)
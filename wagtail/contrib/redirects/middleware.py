@@ -1,6 +1,7 @@
 from urllib.parse import urlparse
 
 from django import http
+from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.encoding import uri_to_iri
 
@@ -14,7 +15,16 @@ def _get_redirect(request, path):
     ):  # reject URLs with null characters, which crash on Postgres (#4496)
         return None
 
-    site = Site.find_for_request(request)
+    if getattr(settings, "WAGTAILREDIRECTS_PATH_INDEX", False):
+        path_index = _get_path_index(request)
+        if not path_index.has_path(path):
+            return None
+        site = Site.find_for_request(request)
+        if not path_index.has_redirect(path, site):
+            return None
+    else:
+        site = Site.find_for_request(request)
+
     try:
         return models.Redirect.get_for_site(site).get(old_path=path)
     except models.Redirect.MultipleObjectsReturned:
@@ -24,6 +34,16 @@ def _get_redirect(request, path):
         return None
 
 
+def _get_path_index(request):
+    # Only check the index version once per request, as up to four paths are
+    # looked up for each 404 response
+    try:
+        return request._wagtail_redirect_path_index
+    except AttributeError:
+        request._wagtail_redirect_path_index = models.get_redirect_path_index()
+        return request._wagtail_redirect_path_index
+
+
 def get_redirect(request, path):
     redirect = _get_redirect(request, path)
     if not redirect:
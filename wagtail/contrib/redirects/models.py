@@ -6,6 +6,9 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.models import Page, Site
+from wagtail.utils.process_cache import VersionedProcessCache
+
+PATH_INDEX_VERSION_CACHE_KEY = "wagtail_redirects_path_index_version"
 
 
 class Redirect(models.Model):
@@ -215,7 +218,59 @@ class Redirect(models.Model):
         else:
             self.redirect_page_route_path = ""
 
+    @staticmethod
+    def clear_path_index():
+        """
+        Discard the in-process redirect path index, and invalidate the copies
+        held by other processes by deleting the shared version key.
+        """
+        path_index.clear()
+
     class Meta:
         verbose_name = _("redirect")
         verbose_name_plural = _("redirects")
         unique_together = [("old_path", "site")]
+
+
+class RedirectPathIndex:
+    """
+    An in-memory index of the ``old_path`` of all Redirect records, and the sites
+    they apply to. This allows the redirect middleware to rule out most paths
+    without querying the database; paths that may match are then looked up as
+    normal.
+    """
+
+    def __init__(self, redirect_rows):
+        self.site_ids_by_path = {}
+        for old_path, site_id in redirect_rows:
+            self.site_ids_by_path.setdefault(old_path, set()).add(site_id)
+
+    @classmethod
+    def build(cls):
+        return cls(Redirect.objects.values_list("old_path", "site_id").iterator())
+
+    def has_path(self, path):
+        return path in self.site_ids_by_path
+
+    def has_redirect(self, path, site=None):
+        """
+        Return whether there is a redirect from the given path that applies to the
+        given site (or to any site, if ``site`` is None).
+        """
+        site_ids = self.site_ids_by_path.get(path)
+        if not site_ids:
+            return False
+        return site is None or None in site_ids or site.pk in site_ids
+
+
+path_index = VersionedProcessCache(
+    PATH_INDEX_VERSION_CACHE_KEY, RedirectPathIndex.build
+)
+
+
+def get_redirect_path_index():
+    """
+    Return the process-local ``RedirectPathIndex``, rebuilt whenever a Redirect is
+    changed by this or another process.
+    """
+    return path_index.get()
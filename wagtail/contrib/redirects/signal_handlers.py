@@ -9,7 +9,7 @@ from wagtail.contrib.frontend_cache.utils import PurgeBatch
 from wagtail.coreutils import BatchCreator, get_dummy_request
 from wagtail.models import Page, Site
 
-from .models import Redirect
+from .models import Redirect, path_index
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,9 @@ class BatchRedirectCreator(BatchCreator):
         Redirect.objects.filter(automatically_created=True).filter(clashes_q).delete()
 
     def post_process(self):
+        # bulk_create() doesn't send the post_save signal
+        path_index.clear_on_commit()
+
         if not apps.is_installed("wagtail.contrib.frontend_cache"):
             return
 
@@ -43,6 +46,14 @@ class BatchRedirectCreator(BatchCreator):
         batch.purge()
 
 
+def post_save_redirect_signal_handler(instance, **kwargs):
+    path_index.clear_on_commit()
+
+
+def post_delete_redirect_signal_handler(instance, **kwargs):
+    path_index.clear_on_commit()
+
+
 def autocreate_redirects_on_slug_change(
     instance_before: Page, instance: Page, **kwargs
 ):
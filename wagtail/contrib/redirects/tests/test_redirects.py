@@ -2,6 +2,7 @@ from io import BytesIO
 
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from openpyxl.reader.excel import load_workbook
@@ -597,6 +598,95 @@ class TestRedirects(TestCase):
         self.assertIs(redirect.is_permanent, True)
 
 
+@override_settings(
+    WAGTAILREDIRECTS_PATH_INDEX=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRedirectsWithPathIndex(TestRedirects):
+    # This inherits from TestRedirects so contains all the same test cases
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        # The index is normally kept in sync by the Redirect signal handlers,
+        # but these are bypassed when the database is rolled back between tests
+        models.Redirect.clear_path_index()
+
+    def test_no_queries_for_unknown_path(self):
+        models.Redirect.add_redirect("/redirectme", "/redirectto")
+
+        # Build the index
+        self.client.get("/redirectme/")
+
+        with self.assertNumQueries(0):
+            models.get_redirect_path_index()
+
+        # Only the site and page lookups for serving the 404 response are made
+        with self.assertNumQueries(2):
+            response = self.client.get("/nonexistent/?foo=bar")
+        self.assertEqual(response.status_code, 404)
+
+    def test_path_for_other_site(self):
+        other_site = Site.objects.create(
+            hostname="other.example.com", port=80, root_page=Page.objects.get(pk=2)
+        )
+        models.Redirect.objects.create(
+            old_path="/redirectme", site=other_site, redirect_link="/redirectto"
+        )
+        index = models.get_redirect_path_index()
+
+        self.assertTrue(index.has_redirect("/redirectme", other_site))
+        self.assertTrue(index.has_redirect("/redirectme"))
+        self.assertFalse(
+            index.has_redirect("/redirectme", Site.objects.get(is_default_site=True))
+        )
+        self.assertFalse(index.has_redirect("/other"))
+
+    def test_invalidated_on_save_and_delete(self):
+        response = self.client.get("/redirectme/")
+        self.assertEqual(response.status_code, 404)
+
+        redirect = models.Redirect.add_redirect("/redirectme", "/redirectto")
+        response = self.client.get("/redirectme/")
+        self.assertRedirects(
+            response, "/redirectto", status_code=301, fetch_redirect_response=False
+        )
+
+        redirect.delete()
+        response = self.client.get("/redirectme/")
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(WAGTAILREDIRECTS_AUTO_CREATE=True)
+    def test_invalidated_on_bulk_create(self):
+        response = self.client.get("/events/christmas/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/events/xmas/").status_code, 404)
+
+        # Automatically created redirects are saved with bulk_create()
+        page = Page.objects.get(url_path="/home/events/christmas/").specific
+        page.slug = "xmas"
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+
+        response = self.client.get("/events/christmas/")
+        self.assertRedirects(
+            response, "/events/xmas/", status_code=301, fetch_redirect_response=False
+        )
+
+    def test_invalidated_by_version_key(self):
+        redirect = models.Redirect.add_redirect("/redirectme", "/redirectto")
+        self.assertTrue(models.get_redirect_path_index().has_path("/redirectme"))
+
+        # Simulate another process changing the redirect and clearing the version
+        # key, without the signal handlers running in this process
+        models.Redirect.objects.filter(pk=redirect.pk).update(old_path="/other")
+        cache.delete(models.PATH_INDEX_VERSION_CACHE_KEY)
+
+        index = models.get_redirect_path_index()
+        self.assertFalse(index.has_path("/redirectme"))
+        self.assertTrue(index.has_path("/other"))
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 )
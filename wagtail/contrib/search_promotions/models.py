@@ -1,4 +1,5 @@
 import datetime
+from collections import defaultdict
 
 from django.conf import settings
 from django.db import models
@@ -7,6 +8,8 @@ from django.utils.translation import gettext_lazy as _
 
 from wagtail.search.utils import MAX_QUERY_STRING_LENGTH, normalise_query_string
 
+from .utils import buffer_query_hit
+
 
 class Query(models.Model):
     query_string = models.CharField(max_length=MAX_QUERY_STRING_LENGTH, unique=True)
@@ -20,6 +23,10 @@ class Query(models.Model):
     def add_hit(self, date=None):
         if date is None:
             date = timezone.now().date()
+
+        if buffer_query_hit(self.query_string, date):
+            return
+
         daily_hits, created = QueryDailyHits.objects.get_or_create(
             query=self, date=date
         )
@@ -54,6 +61,18 @@ class Query(models.Model):
             query_string=normalise_query_string(query_string)
         )[0]
 
+    @classmethod
+    def record_hit(cls, query_string, date=None):
+        """
+        Records a hit for the given search query. When hits are buffered (with the
+        WAGTAILSEARCH_HITS_BUFFER_SIZE setting), this doesn't touch the database.
+        """
+        if date is None:
+            date = timezone.now().date()
+
+        if not buffer_query_hit(normalise_query_string(query_string), date):
+            cls.get(query_string).add_hit(date)
+
     @classmethod
     def get_most_popular(cls, date_since=None):
         objects = cls.objects.filter(daily_hits__isnull=False)
@@ -75,6 +94,49 @@ class QueryDailyHits(models.Model):
     date = models.DateField()
     hits = models.IntegerField(default=0)
 
+    @classmethod
+    def add_hits(cls, hits):
+        """
+        Adds the hits given as a dict mapping (query string, date) pairs to the
+        number of hits, creating any Query and QueryDailyHits records needed in bulk
+        """
+        hits_by_query_string = defaultdict(int)
+        for (query_string, date), count in hits.items():
+            hits_by_query_string[(normalise_query_string(query_string), date)] += count
+        if not hits_by_query_string:
+            return
+
+        query_strings = {query_string for query_string, date in hits_by_query_string}
+        Query.objects.bulk_create(
+            [Query(query_string=query_string) for query_string in query_strings],
+            ignore_conflicts=True,
+        )
+        query_ids = dict(
+            Query.objects.filter(query_string__in=query_strings).values_list(
+                "query_string", "id"
+            )
+        )
+
+        cls.objects.bulk_create(
+            [
+                cls(query_id=query_ids[query_string], date=date)
+                for query_string, date in hits_by_query_string
+            ],
+            ignore_conflicts=True,
+        )
+
+        # Increment the records with one UPDATE for each date and number of hits.
+        # Most queries only get a hit or two between flushes, so there are few of
+        # these.
+        query_ids_by_date_and_count = defaultdict(list)
+        for (query_string, date), count in hits_by_query_string.items():
+            query_ids_by_date_and_count[(date, count)].append(query_ids[query_string])
+
+        for (date, count), ids in query_ids_by_date_and_count.items():
+            cls.objects.filter(date=date, query_id__in=ids).update(
+                hits=models.F("hits") + count
+            )
+
     @classmethod
     def garbage_collect(cls, days=None):
         """
@@ -0,0 +1,15 @@
+import datetime
+
+from django_tasks import task
+
+
+@task()
+def add_query_hits_task(hits):
+    from wagtail.contrib.search_promotions.models import QueryDailyHits
+
+    QueryDailyHits.add_hits(
+        {
+            (query_string, datetime.date.fromisoformat(date)): count
+            for query_string, date, count in hits
+        }
+    )
@@ -1,10 +1,12 @@
 import json
+import threading
 from datetime import date, datetime, timedelta
 from io import BytesIO, StringIO
+from unittest import mock
 
 from django.contrib.auth.models import Permission
 from django.core import management
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from openpyxl import load_workbook
@@ -19,6 +21,7 @@ from wagtail.contrib.search_promotions.models import (
 from wagtail.contrib.search_promotions.templatetags.wagtailsearchpromotions_tags import (
     get_search_promotions,
 )
+from wagtail.contrib.search_promotions.utils import query_hit_buffer
 from wagtail.log_actions import registry as log_registry
 from wagtail.test.utils import WagtailTestUtils
 from wagtail.test.utils.template_tests import AdminTemplateTestUtils
@@ -1539,6 +1542,90 @@ class TestHitCounter(TestCase):
         self.assertEqual(Query.get("Hello").hits, 10)
 
 
+class TestBufferedHitCounter(TestCase):
+    def setUp(self):
+        self.addCleanup(query_hit_buffer.flush)
+
+    def test_record_hit_without_buffer(self):
+        Query.record_hit("Hello")
+        Query.record_hit("hello ")
+
+        self.assertEqual(Query.get("Hello").hits, 2)
+
+    @override_settings(WAGTAILSEARCH_HITS_BUFFER_SIZE=3)
+    def test_hits_are_buffered(self):
+        with self.assertNumQueries(0):
+            Query.record_hit("Hello")
+            Query.record_hit("hello ")
+
+        self.assertFalse(Query.objects.filter(query_string="hello").exists())
+
+        # The buffer is flushed once it's full
+        with self.captureOnCommitCallbacks(execute=True):
+            Query.record_hit("World")
+        self.assertEqual(Query.get("Hello").hits, 2)
+        self.assertEqual(Query.get("World").hits, 1)
+
+    @override_settings(WAGTAILSEARCH_HITS_BUFFER_SIZE=3)
+    def test_add_hit_is_buffered(self):
+        query = Query.get("Hello")
+        with self.assertNumQueries(0):
+            query.add_hit()
+            query.add_hit()
+        self.assertEqual(query.hits, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            query_hit_buffer.flush()
+        self.assertEqual(query.hits, 2)
+
+    @override_settings(
+        WAGTAILSEARCH_HITS_BUFFER_SIZE=100, WAGTAILSEARCH_HITS_BUFFER_MAX_AGE=0
+    )
+    def test_buffer_max_age(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Query.record_hit("Hello")
+        self.assertEqual(Query.get("Hello").hits, 1)
+
+    @override_settings(
+        WAGTAILSEARCH_HITS_BUFFER_SIZE=100, WAGTAILSEARCH_HITS_BUFFER_MAX_AGE=0.01
+    )
+    def test_buffer_is_flushed_by_timer(self):
+        flushed = threading.Event()
+        with mock.patch(
+            "wagtail.contrib.search_promotions.utils.add_query_hits_task"
+        ) as add_query_hits_task:
+            add_query_hits_task.enqueue.side_effect = lambda hits: flushed.set()
+            Query.record_hit("Hello")
+
+            # The buffer is flushed without waiting for another hit
+            self.assertTrue(flushed.wait(5))
+
+        add_query_hits_task.enqueue.assert_called_once_with(
+            [["hello", timezone.now().date().isoformat(), 1]]
+        )
+        self.assertIsNone(query_hit_buffer.timer)
+
+    def test_add_hits(self):
+        today = date.today()
+        yesterday = today - timedelta(days=1)
+        Query.get("Hello").add_hit(date=today)
+
+        with self.assertNumQueries(5):
+            QueryDailyHits.add_hits(
+                {
+                    ("Hello", today): 2,
+                    ("hello ", today): 1,
+                    ("Hello", yesterday): 3,
+                    ("World", today): 3,
+                }
+            )
+
+        self.assertEqual(Query.get("Hello").daily_hits.get(date=today).hits, 4)
+        self.assertEqual(Query.get("Hello").daily_hits.get(date=yesterday).hits, 3)
+        self.assertEqual(Query.get("World").hits, 3)
+        self.assertEqual(Query.objects.count(), 2)
+
+
 class TestQueryStringNormalisation(TestCase):
     def setUp(self):
         self.query = Query.get("  Hello  World!  ")
@@ -0,0 +1,96 @@
+import atexit
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+from .tasks import add_query_hits_task
+
+
+class QueryHitBuffer:
+    """
+    Counts search query hits in memory, and hands the totals over to
+    ``add_query_hits_task`` to be written to the database in bulk once the buffer
+    holds ``max_size`` hits or its oldest hit is ``max_age`` seconds old. The age is
+    checked by a timer, so that an idle process doesn't hold on to its hits. Any
+    hits left in the buffer are flushed when the process exits.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = Counter()
+        self.size = 0
+        self.started_at = None
+        self.timer = None
+        self.exit_handler_registered = False
+
+    def add(self, query_string, date, max_size, max_age):
+        with self.lock:
+            if not self.exit_handler_registered:
+                atexit.register(self.flush)
+                self.exit_handler_registered = True
+
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+                if max_age > 0:
+                    self.timer = threading.Timer(max_age, self.flush_from_timer)
+                    self.timer.daemon = True
+                    self.timer.start()
+            self.hits[(query_string, date)] += 1
+            self.size += 1
+
+            needs_flush = (
+                self.size >= max_size or time.monotonic() - self.started_at >= max_age
+            )
+
+        if needs_flush:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            hits = self.hits
+            self.hits = Counter()
+            self.size = 0
+            self.started_at = None
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        if hits:
+            add_query_hits_task.enqueue(
+                [
+                    [query_string, date.isoformat(), count]
+                    for (query_string, date), count in hits.items()
+                ]
+            )
+
+    def flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            # Close any database connections opened by the timer's thread
+            connections.close_all()
+
+
+query_hit_buffer = QueryHitBuffer()
+
+
+def buffer_query_hit(query_string, date):
+    """
+    Adds a hit for the (normalised) query string to the buffer, if buffering is
+    enabled with the WAGTAILSEARCH_HITS_BUFFER_SIZE setting. Returns whether the
+    hit was buffered.
+    """
+    buffer_size = getattr(settings, "WAGTAILSEARCH_HITS_BUFFER_SIZE", 0)
+    if not buffer_size:
+        return False
+
+    query_hit_buffer.add(
+        query_string,
+        date,
+        max_size=buffer_size,
+        max_age=getattr(settings, "WAGTAILSEARCH_HITS_BUFFER_MAX_AGE", 60),
+    )
+    return True
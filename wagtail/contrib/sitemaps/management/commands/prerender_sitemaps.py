@@ -0,0 +1,135 @@
+import gzip
+import os
+import posixpath
+import re
+import tempfile
+from urllib.parse import urljoin
+
+from django.core.files import File
+from django.core.files.storage import storages
+from django.core.management.base import BaseCommand
+
+from wagtail.contrib.sitemaps.sitemap_generator import (
+    Sitemap,
+    iter_sitemap_index_xml,
+    iter_sitemap_xml,
+)
+from wagtail.models import Site
+
+SITEMAP_FILE_RE = re.compile(r"^sitemap-\d+\.xml\.gz$")
+
+
+class Command(BaseCommand):
+    help = "Renders the sitemap of each site to gzipped files in storage, along with a sitemap index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            help="Only render the sitemap of the site with this hostname",
+        )
+        parser.add_argument(
+            "--storage",
+            default="default",
+            help="Alias of the storage to save the files to (default: default)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default="sitemaps",
+            help="Directory within the storage to save the files to (default: sitemaps)",
+        )
+
+    def handle(self, *args, **options):
+        storage = storages[options["storage"]]
+
+        sites = Site.objects.select_related("root_page").order_by("hostname", "port")
+        if options["site"]:
+            sites = sites.filter(hostname=options["site"])
+
+        for site in sites:
+            directory = posixpath.join(
+                options["output_dir"], f"{site.hostname}-{site.port}"
+            )
+            index_name = self.render_site(site, storage, directory)
+            self.stdout.write(
+                f"Rendered sitemap index for {site.root_url} to {storage.url(index_name)}"
+            )
+
+    def render_site(self, site, storage, directory):
+        sitemap = Sitemap(site=site)
+
+        sitemaps = []
+        names = set()
+        for page in sitemap.pages_paginator.page_range:
+            name = posixpath.join(directory, f"sitemap-{page}.xml.gz")
+            last_mods = set()
+            self.write_file(
+                storage,
+                name,
+                iter_sitemap_xml(
+                    self.track_lastmod(sitemap.iter_urls(page), last_mods)
+                ),
+            )
+            lastmod = max(last_mods) if last_mods and None not in last_mods else None
+            sitemaps.append((self.get_file_url(storage, name, site), lastmod))
+            names.add(name)
+
+        # Remove files left over from earlier runs when the sitemap had more pages
+        try:
+            filenames = storage.listdir(directory)[1]
+        except (FileNotFoundError, NotImplementedError):
+            filenames = []
+        for filename in filenames:
+            name = posixpath.join(directory, filename)
+            if SITEMAP_FILE_RE.match(filename) and name not in names:
+                storage.delete(name)
+
+        index_name = posixpath.join(directory, "sitemap.xml.gz")
+        self.write_file(storage, index_name, iter_sitemap_index_xml(sitemaps))
+        return index_name
+
+    def track_lastmod(self, urls, last_mods):
+        for url in urls:
+            last_mods.add(url.get("lastmod"))
+            yield url
+
+    def write_file(self, storage, name, chunks):
+        with tempfile.TemporaryFile() as f:
+            with gzip.GzipFile(
+                filename=posixpath.basename(name).removesuffix(".gz"),
+                mode="wb",
+                fileobj=f,
+                mtime=0,
+            ) as gzip_file:
+                for chunk in chunks:
+                    gzip_file.write(chunk.encode())
+
+            f.seek(0)
+            self.replace_file(storage, name, File(f))
+
+    def replace_file(self, storage, name, file):
+        """
+        Save the file under the given name, replacing any existing file without a
+        gap in which there is none where the storage allows it.
+        """
+        if not storage.exists(name):
+            storage.save(name, file)
+            return
+
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            # Storages without local paths can't swap files, so the old file is only
+            # deleted once the new one is ready to be saved
+            storage.delete(name)
+            storage.save(name, file)
+            return
+
+        # Save the new file alongside the old one, then move it into place, which
+        # replaces the old file atomically
+        temp_name = storage.save(f"{name}.tmp", file)
+        os.replace(storage.path(temp_name), path)
+
+    def get_file_url(self, storage, name, site):
+        # Sitemap indexes must give absolute URLs; storages such as the file system
+        # storage give URLs relative to the site
+        return urljoin(site.root_url + "/", storage.url(name))
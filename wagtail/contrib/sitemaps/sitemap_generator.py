@@ -1,4 +1,9 @@
 from django.contrib.sitemaps import Sitemap as DjangoSitemap
+from django.core.paginator import Paginator
+from django.utils.dateformat import format as format_date
+from django.utils.functional import cached_property
+from django.utils.html import escape
+from django.utils.timezone import template_localtime
 
 # Note: avoid importing models here. This module is imported from __init__.py
 # which causes it to be loaded early in startup if wagtail.contrib.sitemaps is
@@ -7,8 +12,12 @@ from django.contrib.sitemaps import Sitemap as DjangoSitemap
 
 
 class Sitemap(DjangoSitemap):
-    def __init__(self, request=None):
+    # Number of pages fetched from the database at a time by iter_urls
+    chunk_size = 2000
+
+    def __init__(self, request=None, site=None):
         self.request = request
+        self.site = site
 
     def location(self, obj):
         return obj.get_full_url(self.request)
@@ -21,22 +30,29 @@ class Sitemap(DjangoSitemap):
     def get_wagtail_site(self):
         from wagtail.models import Site
 
+        if self.site is not None:
+            return self.site
+
         site = Site.find_for_request(self.request)
         if site is None:
             return Site.objects.select_related("root_page").get(is_default_site=True)
         return site
 
-    def items(self):
+    def get_pages(self):
+        """
+        Return the queryset of (non-specific) pages to include in the sitemap.
+        """
         return (
             self.get_wagtail_site()
             .root_page.get_descendants(inclusive=True)
             .live()
             .public()
             .order_by("path")
-            .defer_streamfields()
-            .specific()
         )
 
+    def items(self):
+        return self.get_pages().defer_streamfields().specific()
+
     def _urls(self, page, protocol, domain):
         urls = []
         last_mods = set()
@@ -52,3 +68,173 @@ class Sitemap(DjangoSitemap):
         if last_mods and None not in last_mods:
             self.latest_lastmod = max(last_mods)
         return urls
+
+    def page_model_needs_specific(self, model):
+        """
+        Return whether the URL entries for pages of the given type can only be found
+        from the specific page, because the model customizes its sitemap entries or
+        its URL.
+        """
+        from wagtail.models import Page
+
+        return any(
+            getattr(model, name) is not getattr(Page, name)
+            for name in ["get_sitemap_urls", "get_url_parts", "get_full_url"]
+        )
+
+    @cached_property
+    def pages_paginator(self):
+        """
+        The paginator used by ``iter_urls``. Unless ``items`` is overridden, this
+        counts the (non-specific) pages given by ``get_pages``, which is cheaper than
+        counting the specific queryset behind ``paginator``. Unlike ``paginator``, it
+        is only created once, so the pages are counted a single time however many
+        sitemap pages are rendered.
+        """
+        if type(self).items is not Sitemap.items:
+            return self.paginator
+        return Paginator(self.get_pages(), self.limit)
+
+    def iter_urls(self, page=1):
+        """
+        Return an iterator over the URL entries on the given page of the sitemap, as
+        an alternative to ``get_urls`` for large sites.
+
+        Pages are fetched a chunk at a time using a lightweight query of their URL
+        paths and dates, and only the pages whose type overrides ``get_sitemap_urls``
+        (or its URL) are fetched as specific pages. Raises ``EmptyPage`` or
+        ``PageNotAnInteger`` straight away if the page number is invalid.
+
+        Subclasses that override ``items`` (rather than ``get_pages``) get the same
+        entries as ``get_urls``, built from the specific pages given by ``items``.
+        """
+        paginator = self.pages_paginator
+        paginator_page = paginator.page(page)
+        if not paginator.count:
+            return iter([])
+
+        if type(self).items is not Sitemap.items:
+            return iter(self._urls(page, protocol=None, domain=None))
+
+        rows = paginator.object_list.values(
+            "id",
+            "content_type_id",
+            "url_path",
+            "last_published_at",
+            "latest_revision_created_at",
+        )[paginator_page.start_index() - 1 : paginator_page.end_index()]
+        return self._iter_urls_for_rows(rows.iterator(chunk_size=self.chunk_size))
+
+    def _iter_urls_for_rows(self, rows):
+        from django.contrib.contenttypes.models import ContentType
+
+        from wagtail.models import Site
+
+        # Without a request to cache them on, look up the site root paths once here
+        # rather than for each page
+        site_root_paths = Site.get_site_root_paths() if self.request is None else None
+        needs_specific = {}
+
+        chunk = []
+        for row in rows:
+            content_type_id = row["content_type_id"]
+            if content_type_id not in needs_specific:
+                model = ContentType.objects.get_for_id(content_type_id).model_class()
+                needs_specific[content_type_id] = (
+                    model is not None and self.page_model_needs_specific(model)
+                )
+            chunk.append(row)
+
+            if len(chunk) == self.chunk_size:
+                yield from self._iter_urls_for_chunk(
+                    chunk, needs_specific, site_root_paths
+                )
+                chunk = []
+
+        yield from self._iter_urls_for_chunk(chunk, needs_specific, site_root_paths)
+
+    def _iter_urls_for_chunk(self, rows, needs_specific, site_root_paths):
+        from wagtail.models import Page
+
+        specific_ids = [
+            row["id"] for row in rows if needs_specific[row["content_type_id"]]
+        ]
+        specific_pages = {}
+        if specific_ids:
+            specific_pages = {
+                page.pk: page
+                for page in Page.objects.filter(pk__in=specific_ids)
+                .defer_streamfields()
+                .specific()
+            }
+
+        for row in rows:
+            if needs_specific[row["content_type_id"]]:
+                page = specific_pages.get(row["id"])
+                if page is None:
+                    # The page has been deleted since the chunk was fetched
+                    continue
+                if self.request is None:
+                    page._wagtail_cached_site_root_paths = site_root_paths
+                yield from page.get_sitemap_urls(self.request)
+            else:
+                page = Page(id=row["id"], url_path=row["url_path"])
+                if self.request is None:
+                    page._wagtail_cached_site_root_paths = site_root_paths
+                yield {
+                    "location": page.get_full_url(self.request),
+                    "lastmod": row["last_published_at"]
+                    or row["latest_revision_created_at"],
+                }
+
+
+def iter_sitemap_xml(urls):
+    """
+    Render the given URL entries to a sitemap XML document, a string at a time.
+    The output matches Django's ``sitemap.xml`` template.
+    """
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        'xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+    )
+    for url in urls:
+        parts = ["<url><loc>%s</loc>" % escape(url["location"])]
+        if url.get("lastmod"):
+            parts.append(
+                "<lastmod>%s</lastmod>"
+                % format_date(template_localtime(url["lastmod"]), "Y-m-d")
+            )
+        if url.get("changefreq"):
+            parts.append("<changefreq>%s</changefreq>" % escape(url["changefreq"]))
+        if url.get("priority"):
+            parts.append("<priority>%s</priority>" % escape(url["priority"]))
+        for alternate in url.get("alternates") or []:
+            parts.append(
+                '<xhtml:link rel="alternate" hreflang="%s" href="%s"/>'
+                % (escape(alternate["lang_code"]), escape(alternate["location"]))
+            )
+        parts.append("</url>\n")
+        yield "".join(parts)
+    yield "</urlset>\n"
+
+
+def iter_sitemap_index_xml(sitemaps):
+    """
+    Render a sitemap index XML document listing the given (location, lastmod)
+    pairs, a string at a time. The output matches Django's ``sitemap_index.xml``
+    template.
+    """
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    )
+    for location, lastmod in sitemaps:
+        parts = ["<sitemap><loc>%s</loc>" % escape(location)]
+        if lastmod:
+            parts.append(
+                "<lastmod>%s</lastmod>" % format_date(template_localtime(lastmod), "c")
+            )
+        parts.append("</sitemap>\n")
+        yield "".join(parts)
+    yield "</sitemapindex>\n"
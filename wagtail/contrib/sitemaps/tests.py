@@ -1,9 +1,20 @@
 import datetime
+import gzip
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.core.paginator import EmptyPage
+from django.db import connection
 from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from wagtail.models import Page, PageViewRestriction, Site
@@ -247,6 +258,91 @@ class TestSitemapGenerator(TestCase):
 
         self.assertFalse(hasattr(sitemap, "latest_lastmod"))
 
+    def test_iter_urls(self):
+        request, django_site = self.get_request_and_django_site("/sitemap.xml")
+        req_protocol = request.scheme
+
+        self.home_page.add_child(
+            instance=EventIndex(title="Events", slug="events", live=True)
+        )
+
+        sitemap = Sitemap(request)
+        self.assertEqual(
+            list(sitemap.iter_urls()),
+            sitemap.get_urls(1, django_site, req_protocol),
+        )
+
+    def test_iter_urls_only_fetches_specific_pages_when_needed(self):
+        request, django_site = self.get_request_and_django_site("/sitemap.xml")
+
+        # pre-seed the site caches, so that they're not counted towards the query count
+        Site.find_for_request(request)
+        Site.get_site_root_paths()
+
+        sitemap = Sitemap(request)
+        # None of the pages override get_sitemap_urls, so only the rows are fetched
+        # rather than the specific pages
+        with self.assertNumQueries(6):
+            urls = [url["location"] for url in sitemap.iter_urls()]
+
+        self.assertIn("http://localhost/", urls)  # Homepage
+        self.assertIn("http://localhost/hello-world/", urls)  # Child page
+        self.assertNotIn("http://localhost/unpublished/", urls)
+        self.assertNotIn("http://localhost/protected/", urls)
+
+    def test_iter_urls_uses_specific(self):
+        request, django_site = self.get_request_and_django_site("/sitemap.xml")
+
+        self.home_page.add_child(
+            instance=EventIndex(title="Events", slug="events", live=True)
+        )
+
+        sitemap = Sitemap(request)
+        sitemap.chunk_size = 2
+        urls = [url["location"] for url in sitemap.iter_urls()]
+
+        self.assertIn("http://localhost/events/", urls)  # Main view
+        self.assertIn("http://localhost/events/past/", urls)  # Sub view
+        self.assertIn("http://localhost/hello-world/", urls)
+
+    def test_iter_urls_without_request(self):
+        sitemap = Sitemap()
+        urls = {url["location"]: url["lastmod"] for url in sitemap.iter_urls()}
+
+        self.assertIn("http://localhost/", urls)  # Homepage
+        self.assertDatesEqual(
+            urls["http://localhost/no-last-publish-date/"],
+            datetime.datetime(2017, 2, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        )
+
+    def test_iter_urls_with_site(self):
+        sitemap = Sitemap(site=Site.objects.get(hostname="other.example.com"))
+        urls = [url["location"] for url in sitemap.iter_urls()]
+
+        self.assertEqual(urls, ["http://other.example.com/"])
+
+    def test_iter_urls_with_overridden_items(self):
+        request, django_site = self.get_request_and_django_site("/sitemap.xml")
+        child_page = self.child_page
+
+        class ExcludingSitemap(Sitemap):
+            def items(self):
+                return super().items().exclude(pk=child_page.pk)
+
+        sitemap = ExcludingSitemap(request)
+        urls = list(sitemap.iter_urls())
+
+        self.assertEqual(urls, sitemap.get_urls(1, django_site, request.scheme))
+        locations = [url["location"] for url in urls]
+        self.assertIn("http://localhost/", locations)
+        self.assertNotIn("http://localhost/hello-world/", locations)
+
+    def test_iter_urls_invalid_page(self):
+        sitemap = Sitemap()
+
+        with self.assertRaises(EmptyPage):
+            sitemap.iter_urls(page=2)
+
     def test_non_default_site(self):
         request = RequestFactory().get("/sitemap.xml")
         request.META["HTTP_HOST"] = "other.example.com"
@@ -274,6 +370,22 @@ class TestSitemapView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml")
 
+    def test_streaming_sitemap_view(self):
+        response = self.client.get("/streaming-sitemap.xml")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        self.assertTrue(content.startswith('<?xml version="1.0" encoding="UTF-8"?>'))
+        self.assertIn("<url><loc>http://localhost/</loc>", content)
+        self.assertTrue(content.endswith("</urlset>\n"))
+
+    def test_streaming_sitemap_view_invalid_page(self):
+        response = self.client.get("/streaming-sitemap.xml?p=2")
+
+        self.assertEqual(response.status_code, 404)
+
     def test_sitemap_view_with_current_site_middleware(self):
         with self.modify_settings(
             MIDDLEWARE={
@@ -284,3 +396,108 @@ class TestSitemapView(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml")
+
+
+class TestPrerenderSitemapsCommand(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_root_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_root_override.enable()
+        self.addCleanup(media_root_override.disable)
+
+        home_page = Page.objects.get(id=2)
+        for i in range(3):
+            home_page.add_child(
+                instance=SimplePage(
+                    title=f"Page {i}",
+                    slug=f"page-{i}",
+                    content="hello",
+                    live=True,
+                    last_published_at=datetime.datetime(
+                        2017, 1, i + 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                )
+            )
+        home_page.last_published_at = datetime.datetime(
+            2017, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+        )
+        home_page.save()
+
+    def read_file(self, name):
+        with gzip.open(os.path.join(self.media_root, "sitemaps", name), "rt") as f:
+            return f.read()
+
+    def test_prerender_sitemaps(self):
+        stdout = StringIO()
+        call_command("prerender_sitemaps", stdout=stdout)
+
+        self.assertIn(
+            "Rendered sitemap index for http://localhost to "
+            "/media/sitemaps/localhost-80/sitemap.xml.gz",
+            stdout.getvalue(),
+        )
+
+        sitemap = self.read_file("localhost-80/sitemap-1.xml.gz")
+        self.assertIn("<loc>http://localhost/</loc>", sitemap)
+        self.assertIn("<loc>http://localhost/page-2/</loc>", sitemap)
+
+        index = self.read_file("localhost-80/sitemap.xml.gz")
+        self.assertIn(
+            "<loc>http://localhost/media/sitemaps/localhost-80/sitemap-1.xml.gz</loc>",
+            index,
+        )
+        self.assertIn("<lastmod>2017-01-03T21:00:00+09:00</lastmod>", index)
+
+    def test_prerender_sitemaps_counts_pages_once(self):
+        with mock.patch.object(Sitemap, "limit", 2), CaptureQueriesContext(
+            connection
+        ) as queries:
+            call_command("prerender_sitemaps", "--site=localhost", stdout=StringIO())
+
+        count_queries = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(
+                'SELECT COUNT(*) AS "__count" FROM "wagtailcore_page"'
+            )
+        ]
+        # The pages are counted once, rather than again for each sitemap page
+        self.assertEqual(len(count_queries), 1)
+
+    def test_prerender_sitemaps_splits_pages(self):
+        with mock.patch.object(Sitemap, "limit", 2):
+            call_command("prerender_sitemaps", "--site=localhost", stdout=StringIO())
+
+        index = self.read_file("localhost-80/sitemap.xml.gz")
+        self.assertIn("sitemap-1.xml.gz", index)
+        self.assertIn("sitemap-2.xml.gz", index)
+        self.assertIn(
+            "<loc>http://localhost/page-2/</loc>",
+            self.read_file("localhost-80/sitemap-2.xml.gz"),
+        )
+
+        # Files for pages that no longer exist are removed on the next run, and the
+        # others are replaced without being deleted first
+        with mock.patch.object(
+            FileSystemStorage,
+            "delete",
+            autospec=True,
+            side_effect=FileSystemStorage.delete,
+        ) as delete:
+            call_command("prerender_sitemaps", "--site=localhost", stdout=StringIO())
+        self.assertEqual(
+            [call.args[1] for call in delete.call_args_list],
+            ["sitemaps/localhost-80/sitemap-2.xml.gz"],
+        )
+        self.assertIn(
+            "<loc>http://localhost/page-2/</loc>",
+            self.read_file("localhost-80/sitemap-1.xml.gz"),
+        )
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(
+                    self.media_root, "sitemaps", "localhost-80", "sitemap-2.xml.gz"
+                )
+            )
+        )
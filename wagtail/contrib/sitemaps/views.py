@@ -1,8 +1,12 @@
 import inspect
+import itertools
 
 from django.contrib.sitemaps import views as sitemap_views
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.http import Http404, StreamingHttpResponse
 
-from .sitemap_generator import Sitemap
+from .sitemap_generator import Sitemap, iter_sitemap_xml
 
 
 def index(request, sitemaps, **kwargs):
@@ -18,6 +22,55 @@ def sitemap(request, sitemaps=None, **kwargs):
     return sitemap_views.sitemap(request, sitemaps, **kwargs)
 
 
+@sitemap_views.x_robots_tag
+def streaming_sitemap(
+    request, sitemaps=None, section=None, content_type="application/xml"
+):
+    """
+    A drop-in replacement for the ``sitemap`` view that streams the URL entries as
+    they are generated, rather than building the whole sitemap in memory first.
+    Wagtail sitemaps use ``Sitemap.iter_urls`` to avoid loading specific pages where
+    possible.
+    """
+    if sitemaps:
+        sitemaps = prepare_sitemaps(request, sitemaps)
+    else:
+        sitemaps = {"wagtail": Sitemap(request)}
+
+    if section is not None:
+        if section not in sitemaps:
+            raise Http404("No sitemap available for section: %r" % section)
+        maps = [sitemaps[section]]
+    else:
+        maps = sitemaps.values()
+    page = request.GET.get("p", 1)
+
+    urls = []
+    for site in maps:
+        try:
+            if callable(site):
+                site = site()
+            if isinstance(site, Sitemap):
+                urls.append(site.iter_urls(page=page))
+            else:
+                urls.append(
+                    site.get_urls(
+                        page=page,
+                        site=get_current_site(request),
+                        protocol=request.scheme,
+                    )
+                )
+        except EmptyPage:
+            raise Http404("Page %s empty" % page)
+        except PageNotAnInteger:
+            raise Http404("No page '%s'" % page)
+
+    return StreamingHttpResponse(
+        iter_sitemap_xml(itertools.chain.from_iterable(urls)),
+        content_type=content_type,
+    )
+
+
 def prepare_sitemaps(request, sitemaps):
     initialised_sitemaps = {}
     for name, sitemap_cls in sitemaps.items():
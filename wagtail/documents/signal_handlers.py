@@ -2,6 +2,7 @@ from django.db import transaction
 from django.db.models.signals import post_delete
 
 from wagtail.documents import get_document_model
+from wagtail.signal_handlers import connect_entity_cache_signal_handlers
 from wagtail.tasks import delete_file_from_storage_task
 
 
@@ -16,3 +17,4 @@ def post_delete_file_cleanup(instance, **kwargs):
 def register_signal_handlers():
     Document = get_document_model()
     post_delete.connect(post_delete_file_cleanup, sender=Document)
+    connect_entity_cache_signal_handlers(Document)
@@ -1,13 +1,28 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, caches
 from django.utils.timezone import now
 
 from wagtail.coreutils import accepts_kwarg, safe_md5
 
-from .exceptions import EmbedUnsupportedProviderException
+from .exceptions import EmbedException, EmbedUnsupportedProviderException
 from .finders import get_finders
 from .models import Embed
 
+logger = logging.getLogger("wagtail.embeds")
+
+# Maximum number of embeds held in the per-process cache
+LOCAL_CACHE_MAX_ENTRIES = 1000
+
+# Per-process cache of Embed objects, mapping embed hash => (embed, expiry timestamp)
+_local_cache = OrderedDict()
+_local_cache_lock = threading.Lock()
+
 
 def get_finder_for_embed(url, max_width=None, max_height=None):
     for finder in get_finders():
@@ -20,16 +35,187 @@ def get_finder_for_embed(url, max_width=None, max_height=None):
     raise EmbedUnsupportedProviderException
 
 
+def get_embed_cache():
+    """
+    Return the cache backend used to store Embed objects in front of the database, or
+    None if no "embeds" cache is configured.
+    """
+    try:
+        return caches["embeds"]
+    except InvalidCacheBackendError:
+        return None
+
+
+def get_embed_cache_key(embed_hash):
+    return f"wagtail-embed-{embed_hash}"
+
+
+def _get_cache_timeout(embed):
+    # Number of seconds the embed may be cached for, honouring its cache_until;
+    # None means no limit other than the cache's own expiry
+    if embed.cache_until is None:
+        return None
+    return (embed.cache_until - now()).total_seconds()
+
+
+def get_cached_embeds(embed_hashes):
+    """
+    Return a dict of the Embed objects for the given hashes that are found in the
+    per-process or shared cache.
+    """
+    found = {}
+    local_timeout = getattr(settings, "WAGTAILEMBEDS_LOCAL_CACHE_TIMEOUT", 0)
+    missing = []
+    with _local_cache_lock:
+        for embed_hash in embed_hashes:
+            try:
+                embed, expires_at = _local_cache[embed_hash]
+            except KeyError:
+                missing.append(embed_hash)
+                continue
+            if local_timeout and expires_at > time.monotonic():
+                _local_cache.move_to_end(embed_hash)
+                found[embed_hash] = embed
+            else:
+                del _local_cache[embed_hash]
+                missing.append(embed_hash)
+
+    cache = get_embed_cache()
+    if cache is not None and missing:
+        cache_keys = {
+            get_embed_cache_key(embed_hash): embed_hash for embed_hash in missing
+        }
+        for cache_key, embed in cache.get_many(cache_keys).items():
+            found[cache_keys[cache_key]] = embed
+            _set_local_cache(embed)
+
+    return found
+
+
+def _set_local_cache(embed):
+    timeout = getattr(settings, "WAGTAILEMBEDS_LOCAL_CACHE_TIMEOUT", 0)
+    if not timeout:
+        return
+
+    cache_timeout = _get_cache_timeout(embed)
+    if cache_timeout is not None:
+        timeout = min(timeout, cache_timeout)
+    if timeout <= 0:
+        return
+
+    with _local_cache_lock:
+        _local_cache[embed.hash] = (embed, time.monotonic() + timeout)
+        _local_cache.move_to_end(embed.hash)
+        while len(_local_cache) > LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+def cache_embeds(embeds):
+    """
+    Store the given Embed objects in the per-process and shared caches, until their
+    cache_until time (if any).
+    """
+    cache = get_embed_cache()
+    for embed in embeds:
+        timeout = _get_cache_timeout(embed)
+        if timeout is not None and timeout <= 0:
+            # Already expired
+            continue
+
+        _set_local_cache(embed)
+        if cache is not None:
+            if timeout is None:
+                cache.set(get_embed_cache_key(embed.hash), embed)
+            else:
+                cache.set(get_embed_cache_key(embed.hash), embed, timeout)
+
+
+def clear_cached_embed(embed_hash):
+    """
+    Remove the Embed object for the given hash from the caches. Other processes may
+    keep serving their own copy for up to WAGTAILEMBEDS_LOCAL_CACHE_TIMEOUT seconds.
+    """
+    with _local_cache_lock:
+        _local_cache.pop(embed_hash, None)
+    cache = get_embed_cache()
+    if cache is not None:
+        cache.delete(get_embed_cache_key(embed_hash))
+
+
+def _is_stale(embed):
+    return embed.cache_until is not None and embed.cache_until <= now()
+
+
+def _refresh_stale_embed(embed, url, max_width, max_height):
+    from .tasks import refresh_embed_task
+
+    lock_cache = get_embed_cache() or caches[DEFAULT_CACHE_ALIAS]
+    if not lock_cache.add(f"wagtail-embed-refresh-{embed.hash}", True, 60):
+        # A refresh has recently been requested by another request or process
+        return
+
+    refresh_embed_task.enqueue(url, max_width, max_height)
+
+
+def _get_embeds_from_database(embed_args):
+    """
+    Given a dict mapping embed hashes to the (url, max_width, max_height) arguments they
+    were generated from, return a dict of the usable Embed objects from the database.
+    Expired embeds are only returned when WAGTAILEMBEDS_STALE_WHILE_REVALIDATE is
+    enabled, in which case a task is enqueued to refresh them.
+    """
+    stale_while_revalidate = getattr(
+        settings, "WAGTAILEMBEDS_STALE_WHILE_REVALIDATE", False
+    )
+    embeds = Embed.objects.filter(hash__in=embed_args.keys())
+    if not stale_while_revalidate:
+        embeds = embeds.exclude(cache_until__lte=now())
+
+    found = {}
+    for embed in embeds:
+        if _is_stale(embed):
+            _refresh_stale_embed(embed, *embed_args[embed.hash])
+        else:
+            cache_embeds([embed])
+        found[embed.hash] = embed
+    return found
+
+
 def get_embed(url, max_width=None, max_height=None, finder=get_finder_for_embed):
     embed_hash = get_embed_hash(url, max_width, max_height)
 
+    # Check cache
+    try:
+        return get_cached_embeds([embed_hash])[embed_hash]
+    except KeyError:
+        pass
+
     # Check database
     try:
-        return Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
-    except Embed.DoesNotExist:
+        return _get_embeds_from_database({embed_hash: (url, max_width, max_height)})[
+            embed_hash
+        ]
+    except KeyError:
         pass
 
+    return fetch_embed(url, max_width, max_height, finder=finder)
+
+
+def fetch_embed(url, max_width=None, max_height=None, finder=get_finder_for_embed):
+    """
+    Fetch the embed for the given URL from the finder, and create or update its
+    Embed record.
+    """
     embed_dict = finder(url, max_width, max_height)
+    return save_embed(url, max_width, max_height, embed_dict)
+
+
+def save_embed(url, max_width, max_height, embed_dict):
+    """
+    Create or update the Embed record for the given URL from the dict returned by
+    an embed finder.
+    """
+    embed_hash = get_embed_hash(url, max_width, max_height)
 
     # Make sure width and height are valid integers before inserting into database
     try:
@@ -59,9 +245,43 @@ def get_embed(url, max_width=None, max_height=None, finder=get_finder_for_embed)
     embed.last_updated = datetime.now()
     embed.save()
 
+    cache_embeds([embed])
+
     return embed
 
 
+def get_embeds(urls, max_width=None, max_height=None, finder=None):
+    """
+    Return a dict mapping each of the given URLs to its Embed object, looking up all
+    cached or stored embeds together. URLs for which no embed can be found (i.e. the
+    finder raises an EmbedException) are omitted.
+    """
+    hashes_by_url = {url: get_embed_hash(url, max_width, max_height) for url in urls}
+
+    embeds_by_hash = get_cached_embeds(hashes_by_url.values())
+    missing_args = {
+        embed_hash: (url, max_width, max_height)
+        for url, embed_hash in hashes_by_url.items()
+        if embed_hash not in embeds_by_hash
+    }
+    if missing_args:
+        embeds_by_hash.update(_get_embeds_from_database(missing_args))
+
+    finder_kwargs = {"finder": finder} if finder else {}
+    embeds = {}
+    for url, embed_hash in hashes_by_url.items():
+        try:
+            embeds[url] = embeds_by_hash[embed_hash]
+        except KeyError:
+            try:
+                embeds[url] = embeds_by_hash[embed_hash] = get_embed(
+                    url, max_width, max_height, **finder_kwargs
+                )
+            except EmbedException:
+                logger.debug("No embed found for %s", url)
+    return embeds
+
+
 def get_embed_hash(url, max_width=None, max_height=None):
     h = safe_md5(url.encode("utf-8"), usedforsecurity=False)
     if max_width is not None:
@@ -41,6 +41,13 @@ class OEmbedFinder(EmbedFinder):
                 if re.match(pattern, url):
                     return endpoint
 
+    def get_endpoint(self, url):
+        """
+        Return the oEmbed endpoint of the provider for the given URL, or None if no
+        provider handles it.
+        """
+        return self._get_endpoint(url)
+
     def accept(self, url):
         return self._get_endpoint(url) is not None
 
@@ -20,6 +20,25 @@ def embed_to_frontend_html(url, max_width=None, max_height=None):
         return ""
 
 
+def embeds_to_frontend_html(urls, max_width=None, max_height=None):
+    """
+    Return the front-end HTML for each of the given URLs, looking up their embeds
+    together. URLs for which no embed can be found give an empty string.
+    """
+    embeds_by_url = embeds.get_embeds(urls, max_width, max_height)
+    return [
+        render_to_string(
+            "wagtailembeds/embed_frontend.html",
+            {
+                "embed": embeds_by_url[url],
+            },
+        )
+        if url in embeds_by_url
+        else ""
+        for url in urls
+    ]
+
+
 def embed_to_editor_html(url):
     embed = embeds.get_embed(url)
     # catching EmbedException is the responsibility of the caller
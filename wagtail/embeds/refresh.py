@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.utils.timezone import now
+
+from wagtail import blocks
+from wagtail.fields import RichTextField, StreamField
+from wagtail.rich_text.rewriters import FIND_EMBED_TAG, extract_attrs
+
+from .blocks import EmbedBlock
+from .embeds import get_embed_hash, get_finder_for_embed, save_embed
+from .finders import get_finders
+from .finders.oembed import OEmbedFinder
+from .models import Embed
+
+logger = logging.getLogger("wagtail.embeds")
+
+DEFAULT_WORKERS = 4
+
+# Maximum number of requests per second made to each provider
+DEFAULT_RATE_LIMIT = 1.0
+
+# Maximum number of hashes looked up in a single query
+LOOKUP_BATCH_SIZE = 500
+
+
+def _find_embeds_in_rich_text(html):
+    for match in FIND_EMBED_TAG.finditer(html or ""):
+        attrs = extract_attrs(match.group(1))
+        if attrs.get("embedtype") == "media" and attrs.get("url"):
+            yield attrs["url"], None, None
+
+
+def _find_embeds_in_block(block, value):
+    """
+    Yield (url, max_width, max_height) for each embed within the raw JSON-ish value
+    of the given block.
+    """
+    if not value:
+        return
+
+    if isinstance(block, EmbedBlock):
+        yield (
+            value,
+            getattr(block.meta, "max_width", None),
+            getattr(block.meta, "max_height", None),
+        )
+    elif isinstance(block, blocks.RichTextBlock):
+        yield from _find_embeds_in_rich_text(value)
+    elif isinstance(block, blocks.BaseStreamBlock):
+        for item in value:
+            child_block = block.child_blocks.get(item.get("type"))
+            if child_block is not None:
+                yield from _find_embeds_in_block(child_block, item.get("value"))
+    elif isinstance(block, blocks.BaseStructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from _find_embeds_in_block(child_block, value.get(name))
+    elif isinstance(block, blocks.ListBlock):
+        for item in value:
+            if block._item_is_in_block_format(item):
+                item = item["value"]
+            yield from _find_embeds_in_block(block.child_block, item)
+
+
+def find_embed_references(pages):
+    """
+    Return a dict mapping embed hashes to the (url, max_width, max_height) arguments
+    of the embeds used in the StreamFields and rich text fields of the given pages.
+
+    Embeds are not recorded in the reference index, so the fields are scanned
+    directly, using their raw data so that no blocks are converted.
+    """
+    references = {}
+    for page in pages.specific().iterator():
+        for field in page._meta.concrete_fields:
+            if isinstance(field, StreamField):
+                stream_value = field.value_from_object(page)
+                found = _find_embeds_in_block(
+                    stream_value.stream_block, stream_value.raw_data
+                )
+            elif isinstance(field, RichTextField):
+                found = _find_embeds_in_rich_text(field.value_from_object(page))
+            else:
+                continue
+
+            for embed_args in found:
+                references[get_embed_hash(*embed_args)] = embed_args
+    return references
+
+
+def get_embeds_to_refresh(pages, expiring_within=timedelta(hours=1)):
+    """
+    Return a list of (url, max_width, max_height) arguments for the embeds used by
+    the given pages that either have not been fetched yet, or expire within the
+    given timedelta.
+    """
+    references = find_embed_references(pages)
+    threshold = now() + expiring_within
+
+    fresh_hashes = set()
+    hashes = list(references)
+    for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+        fresh_hashes.update(
+            Embed.objects.filter(hash__in=hashes[start : start + LOOKUP_BATCH_SIZE])
+            .exclude(cache_until__lte=threshold)
+            .values_list("hash", flat=True)
+        )
+
+    return [
+        embed_args
+        for embed_hash, embed_args in references.items()
+        if embed_hash not in fresh_hashes
+    ]
+
+
+def get_provider_key(url):
+    """
+    Return the key that requests for the given embed URL are rate limited by: the
+    host of its oEmbed endpoint if there is one, otherwise the host of the URL.
+    """
+    for finder in get_finders():
+        if finder.accept(url):
+            if isinstance(finder, OEmbedFinder):
+                return urlsplit(finder.get_endpoint(url)).netloc
+            break
+    return urlsplit(url).netloc
+
+
+class ProviderRateLimiter:
+    """
+    Spaces out the requests made to each provider, across all threads, so that at
+    most ``rate`` requests are made per second. A ``rate`` of zero disables the limit.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next_request_at = {}
+
+    def wait(self, provider_key):
+        if not self.interval:
+            return
+
+        with self._lock:
+            current_time = time.monotonic()
+            request_at = max(
+                current_time, self._next_request_at.get(provider_key, current_time)
+            )
+            self._next_request_at[provider_key] = request_at + self.interval
+
+        if request_at > current_time:
+            time.sleep(request_at - current_time)
+
+
+def refresh_embeds(
+    embeds, workers=DEFAULT_WORKERS, rate_limit=DEFAULT_RATE_LIMIT, executor=None
+):
+    """
+    Fetch the given (url, max_width, max_height) embeds from their finders
+    concurrently, and store the results. Only the requests to the providers are made
+    in the pool of threads; the Embed records are saved in the calling thread.
+
+    Returns a tuple of the number of embeds refreshed and the number that failed.
+    """
+    rate_limiter = ProviderRateLimiter(rate_limit)
+
+    def find_embed(url, max_width, max_height):
+        rate_limiter.wait(get_provider_key(url))
+        return get_finder_for_embed(url, max_width, max_height)
+
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    refreshed = failed = 0
+    with executor:
+        futures = {
+            executor.submit(find_embed, *embed_args): embed_args
+            for embed_args in embeds
+        }
+        for future in as_completed(futures):
+            url, max_width, max_height = futures[future]
+            try:
+                embed_dict = future.result()
+            except Exception:  # noqa: BLE001
+                # Providers may fail in many ways (such as timeouts or invalid
+                # responses), which shouldn't stop the remaining embeds from refreshing
+                logger.warning("Failed to refresh embed for %s", url, exc_info=True)
+                failed += 1
+                continue
+
+            save_embed(url, max_width, max_height, embed_dict)
+            refreshed += 1
+
+    return refreshed, failed
@@ -24,3 +24,7 @@ class MediaEmbedHandler(EmbedHandler):
         representation for use on the front-end.
         """
         return format.embed_to_frontend_html(attrs["url"])
+
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list: list[dict]) -> list[str]:
+        return format.embeds_to_frontend_html([attrs["url"] for attrs in attrs_list])
@@ -1,7 +1,10 @@
 from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .embeds import clear_cached_embed
 from .finders import get_finders
+from .models import Embed
 
 
 @receiver(setting_changed)
@@ -11,3 +14,12 @@ def clear_embed_caches(*, setting: str, **kwargs: dict) -> None:
     """
     if setting == "WAGTAILEMBEDS_FINDERS":
         get_finders.cache_clear()
+
+
+@receiver(post_save, sender=Embed)
+@receiver(post_delete, sender=Embed)
+def clear_cached_embed_on_change(*, instance: Embed, **kwargs: dict) -> None:
+    """
+    Remove a changed or deleted embed from the embed caches
+    """
+    clear_cached_embed(instance.hash)
@@ -0,0 +1,33 @@
+import logging
+from datetime import timedelta
+
+from django_tasks import task
+
+from wagtail.embeds.embeds import fetch_embed
+from wagtail.embeds.exceptions import EmbedException
+from wagtail.embeds.refresh import get_embeds_to_refresh, refresh_embeds
+from wagtail.models import Page
+
+logger = logging.getLogger("wagtail.embeds")
+
+
+@task()
+def refresh_embed_task(url, max_width=None, max_height=None):
+    try:
+        fetch_embed(url, max_width, max_height)
+    except EmbedException:
+        # Keep serving the existing embed
+        logger.warning("Failed to refresh embed for %s", url, exc_info=True)
+
+
+@task()
+def refresh_embeds_task(expiring_within_minutes=60):
+    """
+    Fetch the embeds used on live pages that have not been fetched yet, or expire
+    within the given number of minutes.
+    """
+    embeds = get_embeds_to_refresh(
+        Page.objects.live(), timedelta(minutes=expiring_within_minutes)
+    )
+    refreshed, failed = refresh_embeds(embeds)
+    logger.info("Refreshed %d embeds, %d failed", refreshed, failed)
@@ -1,5 +1,6 @@
 import datetime
 import json
+import threading
 import unittest
 import urllib.request
 from unittest.mock import patch
@@ -12,9 +13,9 @@ from django.urls import reverse
 from django.utils.timezone import make_aware, now
 
 from wagtail import blocks
-from wagtail.embeds import oembed_providers
+from wagtail.embeds import embeds, oembed_providers
 from wagtail.embeds.blocks import EmbedBlock, EmbedValue
-from wagtail.embeds.embeds import get_embed, get_embed_hash
+from wagtail.embeds.embeds import get_embed, get_embed_hash, get_embeds
 from wagtail.embeds.exceptions import (
     EmbedNotFoundException,
     EmbedUnsupportedProviderException,
@@ -264,6 +265,175 @@ class TestEmbeds(TestCase):
             get_embed("www.test.com/1234", max_width=400)
 
 
+class TestEmbedCache(TestCase):
+    def setUp(self):
+        self.hit_count = 0
+        embeds._local_cache.clear()
+        self.addCleanup(embeds._local_cache.clear)
+
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        self.hit_count += 1
+        if "missing" in url:
+            raise EmbedNotFoundException
+        return {
+            "title": "Test: " + url,
+            "type": "video",
+            "width": 640,
+            "height": 480,
+            "html": "<p>Blah blah blah</p>",
+        }
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "embeds": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "embeds",
+            },
+        }
+    )
+    def test_shared_cache(self):
+        embeds.get_embed_cache().clear()
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+        with self.assertNumQueries(0):
+            cached_embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        self.assertEqual(cached_embed, embed)
+        self.assertEqual(cached_embed.title, "Test: www.test.com/1234")
+        self.assertEqual(self.hit_count, 1)
+
+        # Changing the embed removes it from the cache
+        embed.title = "Changed"
+        embed.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_embed("www.test.com/1234", finder=self.dummy_finder).title,
+                "Changed",
+            )
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "embeds": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "embeds",
+            },
+        }
+    )
+    def test_shared_cache_honours_cache_until(self):
+        embeds.get_embed_cache().clear()
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+
+        self.assertEqual(embeds.get_cached_embeds([embed.hash]), {})
+
+        embeds.cache_embeds([embed])
+        self.assertEqual(embeds.get_cached_embeds([embed.hash]), {})
+
+        embed.cache_until = now() + datetime.timedelta(minutes=1)
+        embeds.cache_embeds([embed])
+        self.assertEqual(embeds.get_cached_embeds([embed.hash]), {embed.hash: embed})
+
+    @override_settings(WAGTAILEMBEDS_LOCAL_CACHE_TIMEOUT=60)
+    def test_local_cache(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_embed("www.test.com/1234", finder=self.dummy_finder), embed
+            )
+
+        embed.delete()
+        self.assertEqual(embeds.get_cached_embeds([embed.hash]), {})
+
+    @override_settings(WAGTAILEMBEDS_LOCAL_CACHE_TIMEOUT=60)
+    @patch("wagtail.embeds.embeds.LOCAL_CACHE_MAX_ENTRIES", 5)
+    def test_local_cache_is_thread_safe(self):
+        embed_objects = [Embed(hash=str(i), url=f"www.test.com/{i}") for i in range(10)]
+        hashes = [embed.hash for embed in embed_objects]
+        errors = []
+
+        def use_cache():
+            try:
+                for i in range(200):
+                    embeds.cache_embeds(embed_objects)
+                    embeds.get_cached_embeds(hashes)
+                    embeds.clear_cached_embed(hashes[i % 10])
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=use_cache) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(embeds._local_cache), 5)
+
+    def test_local_cache_disabled_by_default(self):
+        get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+        with self.assertNumQueries(1):
+            get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+    def test_get_embeds(self):
+        get_embed("www.test.com/1", finder=self.dummy_finder)
+        get_embed("www.test.com/2", finder=self.dummy_finder)
+        self.assertEqual(self.hit_count, 2)
+
+        with self.assertNumQueries(1):
+            result = get_embeds(
+                ["www.test.com/1", "www.test.com/2"], finder=self.dummy_finder
+            )
+
+        self.assertEqual(set(result), {"www.test.com/1", "www.test.com/2"})
+        self.assertEqual(result["www.test.com/2"].title, "Test: www.test.com/2")
+        self.assertEqual(self.hit_count, 2)
+
+    def test_get_embeds_fetches_missing_embeds(self):
+        get_embed("www.test.com/1", finder=self.dummy_finder)
+
+        result = get_embeds(
+            ["www.test.com/1", "www.test.com/3", "www.test.com/missing"],
+            finder=self.dummy_finder,
+        )
+
+        self.assertEqual(set(result), {"www.test.com/1", "www.test.com/3"})
+        self.assertEqual(self.hit_count, 3)
+        self.assertTrue(Embed.objects.filter(url="www.test.com/3").exists())
+
+    @override_settings(WAGTAILEMBEDS_STALE_WHILE_REVALIDATE=True)
+    def test_stale_while_revalidate(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+
+        with patch("wagtail.embeds.tasks.fetch_embed") as fetch_embed:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                stale_embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+                # Only one refresh is requested at a time
+                get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+        self.assertEqual(stale_embed, embed)
+        self.assertEqual(self.hit_count, 1)
+        self.assertEqual(len(callbacks), 1)
+        fetch_embed.assert_called_once_with("www.test.com/1234", None, None)
+
+    def test_expired_embed_refetched_without_stale_while_revalidate(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+
+        get_embed("www.test.com/1234", finder=self.dummy_finder)
+        self.assertEqual(self.hit_count, 2)
+
+
 class TestEmbedHash(TestCase):
     def test_get_embed_hash(self):
         url = "www.test.com/1234"
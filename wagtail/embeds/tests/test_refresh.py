@@ -0,0 +1,335 @@
+import datetime
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+from wagtail import blocks
+from wagtail.embeds.blocks import EmbedBlock
+from wagtail.embeds.embeds import get_embed_hash
+from wagtail.embeds.models import Embed
+from wagtail.embeds.refresh import (
+    ProviderRateLimiter,
+    _find_embeds_in_block,
+    find_embed_references,
+    get_embeds_to_refresh,
+    get_provider_key,
+)
+from wagtail.embeds.tasks import refresh_embeds_task
+from wagtail.models import Page
+from wagtail.test.testapp.models import StreamPage
+
+
+class StubOEmbedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        params = parse_qs(urlsplit(self.path).query)
+        url = params["url"][0]
+        self.server.requested_urls.append(url)
+
+        if url.endswith("/missing"):
+            self.send_error(404)
+            return
+
+        if url.endswith("/broken"):
+            # A response the finder can't handle, failing with an unexpected error
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        body = json.dumps(
+            {
+                "type": "video",
+                "title": f"Video at {url}",
+                "html": f'<iframe src="{url}"></iframe>',
+                "width": 640,
+                "height": 360,
+                "cache_age": 86400,
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def rich_text_embed(url):
+    return f'<p>Watch this</p><embed embedtype="media" url="{url}"/>'
+
+
+class TestRefreshEmbeds(TestCase):
+    fixtures = ["test.json"]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubOEmbedHandler)
+        cls.server.requested_urls = []
+        cls.server_thread = threading.Thread(
+            target=cls.server.serve_forever, daemon=True
+        )
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requested_urls.clear()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/oembed"
+        finders_override = override_settings(
+            WAGTAILEMBEDS_FINDERS=[
+                {
+                    "class": "wagtail.embeds.finders.oembed",
+                    "providers": [
+                        {
+                            "endpoint": self.endpoint,
+                            "urls": [r"^https://video\.example\.com/.+$"],
+                        }
+                    ],
+                }
+            ]
+        )
+        finders_override.enable()
+        self.addCleanup(finders_override.disable)
+
+        self.home = Page.objects.get(url_path="/home/")
+
+    def add_page(self, *urls, live=True):
+        page = StreamPage(
+            title="Videos",
+            live=live,
+            body=json.dumps(
+                [{"type": "rich_text", "value": rich_text_embed(url)} for url in urls]
+            ),
+        )
+        self.home.add_child(instance=page)
+        return page
+
+    def add_embed(self, url, cache_until):
+        return Embed.objects.create(
+            url=url,
+            hash=get_embed_hash(url),
+            type="video",
+            html="<p>Old</p>",
+            cache_until=cache_until,
+        )
+
+    def test_find_embed_references(self):
+        self.add_page("https://video.example.com/1", "https://video.example.com/2")
+        self.add_page("https://video.example.com/3", live=False)
+
+        references = find_embed_references(Page.objects.live())
+
+        self.assertEqual(
+            references,
+            {
+                get_embed_hash("https://video.example.com/1"): (
+                    "https://video.example.com/1",
+                    None,
+                    None,
+                ),
+                get_embed_hash("https://video.example.com/2"): (
+                    "https://video.example.com/2",
+                    None,
+                    None,
+                ),
+            },
+        )
+
+    def test_find_embeds_in_nested_blocks(self):
+        block = blocks.StreamBlock(
+            [
+                ("video", EmbedBlock(max_width=800)),
+                (
+                    "gallery",
+                    blocks.ListBlock(
+                        blocks.StructBlock(
+                            [
+                                ("video", EmbedBlock(max_height=400)),
+                                ("caption", blocks.RichTextBlock()),
+                            ]
+                        )
+                    ),
+                ),
+            ]
+        )
+        value = [
+            {"type": "video", "value": "https://video.example.com/1"},
+            {
+                "type": "gallery",
+                "value": [
+                    {
+                        "type": "item",
+                        "id": "1",
+                        "value": {
+                            "video": "https://video.example.com/2",
+                            "caption": rich_text_embed("https://video.example.com/3"),
+                        },
+                    },
+                    {"video": "", "caption": ""},
+                ],
+            },
+        ]
+
+        self.assertEqual(
+            list(_find_embeds_in_block(block, value)),
+            [
+                ("https://video.example.com/1", 800, None),
+                ("https://video.example.com/2", None, 400),
+                ("https://video.example.com/3", None, None),
+            ],
+        )
+
+    def test_get_embeds_to_refresh(self):
+        self.add_page(
+            "https://video.example.com/missing-row",
+            "https://video.example.com/expiring",
+            "https://video.example.com/fresh",
+            "https://video.example.com/permanent",
+        )
+        self.add_embed(
+            "https://video.example.com/expiring",
+            now() + datetime.timedelta(minutes=10),
+        )
+        self.add_embed(
+            "https://video.example.com/fresh", now() + datetime.timedelta(days=1)
+        )
+        self.add_embed("https://video.example.com/permanent", None)
+
+        embeds = get_embeds_to_refresh(Page.objects.live(), datetime.timedelta(hours=1))
+
+        self.assertEqual(
+            sorted(embeds),
+            [
+                ("https://video.example.com/expiring", None, None),
+                ("https://video.example.com/missing-row", None, None),
+            ],
+        )
+
+    def test_refresh_embeds_command(self):
+        self.add_page(
+            "https://video.example.com/1",
+            "https://video.example.com/2",
+            "https://video.example.com/fresh",
+        )
+        self.add_embed("https://video.example.com/2", now())
+        self.add_embed(
+            "https://video.example.com/fresh", now() + datetime.timedelta(days=1)
+        )
+
+        stdout = StringIO()
+        call_command("refresh_embeds", "--rate-limit=0", stdout=stdout)
+
+        self.assertIn("Successfully refreshed 2 embeds", stdout.getvalue())
+        self.assertEqual(
+            sorted(self.server.requested_urls),
+            ["https://video.example.com/1", "https://video.example.com/2"],
+        )
+
+        embed = Embed.objects.get(hash=get_embed_hash("https://video.example.com/2"))
+        self.assertEqual(embed.title, "Video at https://video.example.com/2")
+        self.assertGreater(embed.cache_until, now() + datetime.timedelta(hours=23))
+        self.assertTrue(
+            Embed.objects.filter(
+                hash=get_embed_hash("https://video.example.com/1")
+            ).exists()
+        )
+
+    def test_refresh_embeds_command_with_failures(self):
+        self.add_page(
+            "https://video.example.com/1", "https://video.example.com/missing"
+        )
+
+        stdout = StringIO()
+        with self.assertLogs("wagtail.embeds", level="WARNING"):
+            call_command("refresh_embeds", "--rate-limit=0", stdout=stdout)
+
+        self.assertIn("Successfully refreshed 1 embeds", stdout.getvalue())
+        self.assertIn("Failed to refresh 1 embeds", stdout.getvalue())
+        self.assertFalse(
+            Embed.objects.filter(
+                hash=get_embed_hash("https://video.example.com/missing")
+            ).exists()
+        )
+
+    def test_refresh_embeds_command_with_unexpected_errors(self):
+        self.add_page(
+            "https://video.example.com/broken",
+            "https://video.example.com/1",
+            "https://video.example.com/2",
+        )
+
+        stdout = StringIO()
+        with self.assertLogs("wagtail.embeds", level="WARNING"):
+            call_command("refresh_embeds", "--rate-limit=0", stdout=stdout)
+
+        self.assertIn("Successfully refreshed 2 embeds", stdout.getvalue())
+        self.assertIn("Failed to refresh 1 embeds", stdout.getvalue())
+
+    def test_refresh_embeds_command_with_nothing_to_refresh(self):
+        stdout = StringIO()
+        call_command("refresh_embeds", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "No embeds to refresh")
+        self.assertEqual(self.server.requested_urls, [])
+
+    def test_refresh_embeds_task(self):
+        self.add_page("https://video.example.com/1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_embeds_task.enqueue()
+
+        self.assertEqual(self.server.requested_urls, ["https://video.example.com/1"])
+        self.assertTrue(
+            Embed.objects.filter(
+                hash=get_embed_hash("https://video.example.com/1")
+            ).exists()
+        )
+
+    def test_get_provider_key(self):
+        self.assertEqual(
+            get_provider_key("https://video.example.com/1"),
+            f"127.0.0.1:{self.server.server_port}",
+        )
+        self.assertEqual(
+            get_provider_key("https://other.example.com/1"), "other.example.com"
+        )
+
+
+class TestProviderRateLimiter(TestCase):
+    def test_requests_to_same_provider_are_spaced_out(self):
+        rate_limiter = ProviderRateLimiter(rate=20)
+
+        start = time.monotonic()
+        for _ in range(3):
+            rate_limiter.wait("video.example.com")
+        rate_limiter.wait("other.example.com")
+
+        # The second and third requests to the same provider wait 0.05s each; the
+        # request to the other provider doesn't wait
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_no_limit(self):
+        rate_limiter = ProviderRateLimiter(rate=0)
+
+        start = time.monotonic()
+        for _ in range(10):
+            rate_limiter.wait("video.example.com")
+
+        self.assertLess(time.monotonic() - start, 0.05)
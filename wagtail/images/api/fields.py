@@ -1,8 +1,10 @@
 from collections import OrderedDict
 
-from rest_framework.fields import Field
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import prefetch_related_objects
+from rest_framework.fields import Field, SkipField
 
-from ..models import SourceImageIOError
+from ..models import SourceImageIOError, prefetch_renditions_for_images
 from ..utils import to_svg_safe_spec
 
 
@@ -33,6 +35,34 @@ class ImageRenditionField(Field):
         self.preserve_svg = preserve_svg
         super().__init__(*args, **kwargs)
 
+    def prefetch_for_instances(self, instances):
+        """
+        Fetch the renditions needed for the images of all of the given instances
+        at once, rather than with a query for each image.
+        """
+        if instances and "." not in self.source:
+            try:
+                model_field = instances[0]._meta.get_field(self.source)
+            except (AttributeError, FieldDoesNotExist):
+                model_field = None
+
+            if model_field is not None and model_field.is_relation:
+                prefetch_related_objects(instances, self.source)
+
+        images = []
+        for instance in instances:
+            try:
+                image = self.get_attribute(instance)
+            except (AttributeError, SkipField):
+                continue
+            if image is not None:
+                images.append(image)
+
+        filter_specs = [self.filter_spec]
+        if self.preserve_svg:
+            filter_specs.append(to_svg_safe_spec(self.filter_spec))
+        prefetch_renditions_for_images(images, *filter_specs)
+
     def to_representation(self, image):
         try:
             if image.is_svg() and self.preserve_svg:
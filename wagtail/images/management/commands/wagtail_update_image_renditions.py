@@ -1,9 +1,15 @@
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
 
 from wagtail.images import get_image_model
+from wagtail.images.models import rendition_process_pool
+from wagtail.utils.executors import InlineExecutor, setup_worker
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,32 @@ def progress_bar(current, total, bar_length=50):
     return (f"Progress: [{arrow}{padding}] {int(fraction*100)}%", ending)
 
 
+def update_renditions_for_image(image_id, rendition_ids, purge_only=False):
+    """
+    Delete the given renditions of an image and, unless ``purge_only`` is set,
+    regenerate them with a single call to ``get_renditions()``, so that the
+    original image is only read once. This may run in a worker process, so only
+    receives picklable arguments. Returns the number of renditions processed.
+    """
+    Image = get_image_model()
+    Rendition = Image.get_rendition_model()
+
+    with transaction.atomic():
+        renditions = Rendition.objects.filter(image_id=image_id, id__in=rendition_ids)
+        filter_specs = list(
+            dict.fromkeys(renditions.values_list("filter_spec", flat=True))
+        )
+
+        # Delete the existing renditions
+        num_renditions, _ = renditions.delete()
+
+        if not purge_only and filter_specs:
+            # Create new ones
+            Image.objects.get(id=image_id).get_renditions(*filter_specs)
+
+    return num_renditions
+
+
 class Command(BaseCommand):
     """Command to create missing image renditions with the option to remove (purge) any existing ones."""
 
@@ -36,8 +68,25 @@ class Command(BaseCommand):
             default=50,
             help="Operate in x size chunks (default: %(default)s)",
         )
+        parser.add_argument(
+            "--group-by-image",
+            action="store_true",
+            help="Regenerate all renditions of each image together, so that each original image is only read once",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to use with --group-by-image (default: %(default)s)",
+        )
 
     def handle(self, *args, **options):
+        workers = options["workers"]
+        if workers < 1:
+            raise CommandError("--workers must be at least 1")
+        if workers > 1 and not options["group_by_image"]:
+            raise CommandError("--workers can only be used with --group-by-image")
+
         Rendition = get_image_model().get_rendition_model()
 
         renditions = Rendition.objects.all()
@@ -60,13 +109,36 @@ class Command(BaseCommand):
                 self.style.HTTP_INFO(f"Regenerating {num_renditions} rendition(s)")
             )
 
+        if options["group_by_image"]:
+            num_renditions = self.update_renditions_by_image(
+                renditions.filter(id__in=rendition_ids),
+                num_renditions,
+                purge_only,
+                workers,
+            )
+        else:
+            num_renditions = self.update_renditions(
+                renditions.filter(id__in=rendition_ids),
+                num_renditions,
+                purge_only,
+                options["chunk_size"],
+            )
+
+        if num_renditions:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully processed {num_renditions} rendition(s)"
+                )
+            )
+        else:
+            self.stdout.write(self.style.WARNING("Could not process any renditions."))
+
+    def update_renditions(self, renditions, num_renditions, purge_only, chunk_size):
         progress_bar_current = 1
         for rendition in (
             # Pre-calculate the ids of the renditions to change,
             # otherwise `.iterator` never ends.
-            renditions.filter(id__in=rendition_ids)
-            .select_related("image")
-            .iterator(chunk_size=options["chunk_size"])
+            renditions.select_related("image").iterator(chunk_size=chunk_size)
         ):
             try:
                 with transaction.atomic():
@@ -90,11 +162,72 @@ class Command(BaseCommand):
                 )
                 num_renditions -= 1
 
-        if num_renditions:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully processed {num_renditions} rendition(s)"
-                )
+        return num_renditions
+
+    def update_renditions_by_image(
+        self, renditions, num_renditions, purge_only, workers
+    ):
+        rendition_ids_by_image = {}
+        for rendition_id, image_id in renditions.values_list("id", "image_id"):
+            rendition_ids_by_image.setdefault(image_id, []).append(rendition_id)
+
+        start_time = time.monotonic()
+        progress_bar_current = 0
+        num_processed = 0
+        with self.get_rendition_pool_context(workers), self.get_executor(
+            workers
+        ) as executor:
+            futures = {
+                executor.submit(
+                    update_renditions_for_image, image_id, rendition_ids, purge_only
+                ): (image_id, len(rendition_ids))
+                for image_id, rendition_ids in rendition_ids_by_image.items()
+            }
+
+            for future in as_completed(futures):
+                image_id, num_image_renditions = futures[future]
+                try:
+                    num_processed += future.result()
+                except Exception:  # noqa: BLE001
+                    logger.exception(
+                        "Error operating on renditions of image %d", image_id
+                    )
+                    self.stderr.write(
+                        self.style.ERROR(
+                            f"Failed to operate on renditions of image {image_id}"
+                        )
+                    )
+
+                progress_bar_current += num_image_renditions
+                _progress_bar = progress_bar(progress_bar_current, num_renditions)
+                self.stdout.write(_progress_bar[0], ending=_progress_bar[1])
+
+        duration = time.monotonic() - start_time
+        self.stdout.write(
+            "Processed {} rendition(s) of {} image(s) in {:.1f}s ({:.1f} renditions/sec)".format(
+                num_processed,
+                len(rendition_ids_by_image),
+                duration,
+                num_processed / duration if duration else 0,
             )
-        else:
-            self.stdout.write(self.style.WARNING("Could not process any renditions."))
+        )
+
+        return num_processed
+
+    def get_rendition_pool_context(self, workers):
+        # With a single worker, the renditions of each image are generated in a pool
+        # of processes instead, if WAGTAILIMAGES_RENDITION_EXECUTOR is "process"
+        if (
+            workers == 1
+            and getattr(settings, "WAGTAILIMAGES_RENDITION_EXECUTOR", None) == "process"
+        ):
+            return rendition_process_pool()
+        return nullcontext()
+
+    def get_executor(self, workers):
+        if workers == 1:
+            return InlineExecutor()
+
+        # Close database connections so that they aren't shared with forked workers
+        connections.close_all()
+        return ProcessPoolExecutor(max_workers=workers, initializer=setup_worker)
@@ -4,6 +4,7 @@ import concurrent.futures
 import hashlib
 import itertools
 import logging
+import multiprocessing
 import os.path
 import re
 import time
@@ -15,6 +16,7 @@ from tempfile import SpooledTemporaryFile
 from typing import Any
 
 import willow
+from asgiref.local import Local
 from django.apps import apps
 from django.conf import settings
 from django.core import checks
@@ -22,6 +24,7 @@ from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, cac
 from django.core.cache.backends.base import BaseCache
 from django.core.exceptions import ImproperlyConfigured
 from django.core.files import File
+from django.core.files.base import ContentFile
 from django.core.files.storage import InvalidStorageError, default_storage, storages
 from django.db import models
 from django.db.models import Q
@@ -32,6 +35,7 @@ from django.utils.module_loading import import_string
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
+from willow.plugins.pillow import PillowImage
 
 from wagtail import hooks
 from wagtail.coreutils import string_to_ascii
@@ -49,6 +53,7 @@ from wagtail.images.rect import Rect
 from wagtail.models import CollectionMember, ReferenceIndex
 from wagtail.search import index
 from wagtail.search.queryset import SearchableQuerySetMixin
+from wagtail.utils.executors import InlineExecutor, setup_worker
 from wagtail.utils.file import hash_filelike
 
 logger = logging.getLogger("wagtail.images")
@@ -74,31 +79,191 @@ class SourceImageIOError(IOError):
     pass
 
 
+class DecodedSourceImage(File):
+    """
+    The contents of an original image file, along with the image already opened,
+    decoded and auto-oriented by Willow, so that several renditions can be
+    generated from it while only decoding the original once. ``Filter.run()``
+    uses ``willow_image`` rather than reading the file again; ``willow_image``
+    is never modified, so it can be shared between threads.
+    """
+
+    def __init__(self, original_image_bytes, name, willow_image, original_format):
+        super().__init__(BytesIO(original_image_bytes), name=name)
+        self.willow_image = willow_image
+        self.original_format = original_format
+
+    @staticmethod
+    def decode(original_image_bytes):
+        """
+        Opens, decodes and auto-orients the given image file contents, returning a
+        ``(willow_image, original_format)`` tuple. Returns ``None`` for images that
+        can't be shared between renditions, such as SVGs and animated images,
+        which are then opened separately for each rendition.
+        """
+        try:
+            willow_image = willow.Image.open(BytesIO(original_image_bytes))
+            original_format = willow_image.format_name
+            if willow_image.has_animation():
+                return None
+            willow_image = willow_image.auto_orient()
+        except Exception:  # noqa: BLE001
+            # Leave any errors to be reported when generating each rendition
+            return None
+
+        if not isinstance(willow_image, PillowImage):
+            return None
+
+        return willow_image, original_format
+
+
+def get_renditions_prefetch(image_model, filters):
+    """
+    Return a Prefetch object that fetches the generated renditions of images of the given
+    model for the given filters (or all renditions, if no filters are provided) into the
+    ``prefetched_renditions`` attribute.
+    """
+    rendition_model = image_model.get_rendition_model()
+    queryset = rendition_model.objects.all()
+
+    if filters:
+        # Get a list of filter spec strings. The given value could contain Filter objects
+        filter_specs = [
+            filter.spec if isinstance(filter, Filter) else filter for filter in filters
+        ]
+        queryset = queryset.filter(filter_spec__in=filter_specs)
+
+    return models.Prefetch(
+        "renditions",
+        queryset=queryset,
+        to_attr="prefetched_renditions",
+    )
+
+
+def prefetch_renditions_for_images(images, *filters):
+    """
+    Prefetches generated renditions for the given filters onto a list of image instances
+    that have already been fetched, using one query per image model.
+    Prefetches all renditions when no filters are provided.
+    """
+    images_by_model = defaultdict(list)
+    for image in images:
+        images_by_model[type(image)].append(image)
+
+    for image_model, model_images in images_by_model.items():
+        models.prefetch_related_objects(
+            model_images, get_renditions_prefetch(image_model, filters)
+        )
+
+
 class ImageQuerySet(SearchableQuerySetMixin, models.QuerySet):
     def prefetch_renditions(self, *filters):
         """
         Prefetches generated renditions for the given filters.
         Returns all renditions when no filters are provided.
         """
-        rendition_model = self.model.get_rendition_model()
-        queryset = rendition_model.objects.all()
-
-        if filters:
-            # Get a list of filter spec strings. The given value could contain Filter objects
-            filter_specs = [
-                filter.spec if isinstance(filter, Filter) else filter
-                for filter in filters
-            ]
-            queryset = queryset.filter(filter_spec__in=filter_specs)
+        return self.prefetch_related(get_renditions_prefetch(self.model, filters))
 
-        return self.prefetch_related(
-            models.Prefetch(
-                "renditions",
-                queryset=queryset,
-                to_attr="prefetched_renditions",
-            )
+
+RENDITION_EXECUTOR_TYPES = ("thread", "process", "inline")
+
+# The process pool set up by the innermost rendition_process_pool() block, along with
+# its number of workers
+_rendition_process_pool = Local()
+
+
+@contextmanager
+def rendition_process_pool(workers=None):
+    """
+    Context manager that starts a pool of worker processes, used within the block to
+    generate renditions when ``WAGTAILIMAGES_RENDITION_EXECUTOR`` is ``"process"``.
+    The pool is shut down on leaving the block. This is intended for management
+    commands and other batch jobs; elsewhere (such as while serving requests),
+    renditions are generated in a pool of threads instead.
+    """
+    if workers is None:
+        workers = getattr(
+            settings, "WAGTAILIMAGES_RENDITION_WORKERS", os.cpu_count() or 1
+        )
+
+    outer_pool = getattr(_rendition_process_pool, "value", None)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=setup_worker
+    ) as pool:
+        _rendition_process_pool.value = (pool, workers)
+        try:
+            yield pool
+        finally:
+            _rendition_process_pool.value = outer_pool
+
+
+def get_rendition_executor_settings():
+    """
+    Returns the type of executor and number of workers used by
+    ``AbstractImage.create_renditions()`` to generate multiple renditions, as
+    configured by the ``WAGTAILIMAGES_RENDITION_EXECUTOR`` and
+    ``WAGTAILIMAGES_RENDITION_WORKERS`` settings. Falls back on a thread pool
+    outside of a ``rendition_process_pool()`` block, and in daemonic processes.
+    """
+    executor_type = getattr(settings, "WAGTAILIMAGES_RENDITION_EXECUTOR", "thread")
+    if executor_type not in RENDITION_EXECUTOR_TYPES:
+        raise ImproperlyConfigured(
+            "WAGTAILIMAGES_RENDITION_EXECUTOR must be one of %s, not %r"
+            % (", ".join(RENDITION_EXECUTOR_TYPES), executor_type)
         )
 
+    if executor_type == "process" and (
+        getattr(_rendition_process_pool, "value", None) is None
+        # Daemonic processes, such as the workers of some task queues, can't start
+        # a process pool
+        or multiprocessing.current_process().daemon
+    ):
+        executor_type = "thread"
+
+    # Thread pools default to 3 workers; process pools default to the number of CPUs
+    workers = getattr(
+        settings,
+        "WAGTAILIMAGES_RENDITION_WORKERS",
+        3 if executor_type == "thread" else None,
+    )
+    return executor_type, workers
+
+
+def get_rendition_sources(image, filters, original_image_bytes):
+    """
+    Yield a ``(filter, source)`` pair for each of the given filters, with a source to
+    generate the rendition of ``image`` from, given the contents of its original
+    file. Where possible, the original is decoded once and shared between the
+    sources, as ``DecodedSourceImage`` instances.
+    """
+    decoded = DecodedSourceImage.decode(original_image_bytes)
+    for filter in filters:
+        if decoded is None:
+            yield filter, BytesIO(original_image_bytes)
+        else:
+            yield (
+                filter,
+                DecodedSourceImage(original_image_bytes, image.file.name, *decoded),
+            )
+
+
+def generate_rendition_instances(image, filters, original_image_bytes):
+    """
+    Generates unsaved renditions of ``image`` for the given filters with
+    ``generate_rendition_instance()``, decoding the original file once. This is run
+    in a worker process when ``WAGTAILIMAGES_RENDITION_EXECUTOR`` is ``"process"``,
+    so each rendition's file is replaced with its encoded contents, to be sent back
+    to the calling process.
+    """
+    renditions = []
+    for filter, source in get_rendition_sources(image, filters, original_image_bytes):
+        rendition = image.generate_rendition_instance(filter, source)
+        file = rendition.file.file
+        file.seek(0)
+        rendition.file = ContentFile(file.read(), name=file.name)
+        renditions.append(rendition)
+    return renditions
+
 
 def get_upload_to(instance, filename):
     """
@@ -714,16 +879,41 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         to_create = []
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            for future in concurrent.futures.as_completed(
-                executor.submit(
-                    self.generate_rendition_instance,
-                    filter,
-                    BytesIO(original_image_bytes),
+        executor_type, workers = get_rendition_executor_settings()
+        if executor_type == "process":
+            # Split the filters between the worker processes, which each decode the
+            # original once and send back their renditions with the encoded files
+            pool, pool_workers = _rendition_process_pool.value
+            chunk_count = min(len(filters), pool_workers)
+            futures = [
+                pool.submit(
+                    generate_rendition_instances,
+                    self,
+                    filters[start::chunk_count],
+                    original_image_bytes,
                 )
-                for filter in filters
-            ):
-                to_create.append(future.result())
+                for start in range(chunk_count)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                for rendition in future.result():
+                    rendition.image = self
+                    to_create.append(rendition)
+        else:
+            if executor_type == "thread":
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            else:
+                executor = InlineExecutor()
+
+            # Decode the original image once, and generate all of the renditions
+            # from the decoded image
+            with executor:
+                for future in concurrent.futures.as_completed(
+                    executor.submit(self.generate_rendition_instance, filter, source)
+                    for filter, source in get_rendition_sources(
+                        self, filters, original_image_bytes
+                    )
+                ):
+                    to_create.append(future.result())
 
         # Rendition generation can take a while. So, if other processes have created
         # identical renditions in the meantime, we should find them to avoid clashes.
@@ -765,20 +955,21 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         return return_value
 
     def generate_rendition_instance(
-        self, filter: Filter, source: BytesIO
+        self, filter: Filter, source: BytesIO | File
     ) -> AbstractRendition:
         """
         Use the supplied ``source`` image to create and return an
         **unsaved** ``Rendition`` instance, with a ``file`` value reflecting
         the supplied ``filter`` value and focal point values from this object.
         """
+        if not isinstance(source, File):
+            source = File(source, name=self.file.name)
+
         return self.get_rendition_model()(
             image=self,
             filter_spec=filter.spec,
             focal_point_key=filter.get_cache_key(self),
-            file=self.generate_rendition_file(
-                filter, source=File(source, name=self.file.name)
-            ),
+            file=self.generate_rendition_file(filter, source=source),
         )
 
     def generate_rendition_file(self, filter: Filter, *, source: File = None) -> File:
@@ -1012,116 +1203,131 @@ class Filter:
                 yield willow_image
 
     def run(self, image: AbstractImage, output: BytesIO, source: File = None):
+        if (
+            isinstance(source, DecodedSourceImage)
+            and type(self).get_willow_image is Filter.get_willow_image
+        ):
+            # The original image has already been decoded and oriented
+            return self.run_on_willow_image(
+                image, source.willow_image, output, source.original_format
+            )
+
         with self.get_willow_image(image, source) as willow:
             original_format = willow.format_name
 
             # Fix orientation of image
             willow = willow.auto_orient()
 
-            # Transform the image
-            transform = self.get_transform(
-                image, (willow.image.width, willow.image.height)
-            )
-            willow = willow.crop(transform.get_rect().round())
-            willow = willow.resize(transform.size)
+            return self.run_on_willow_image(image, willow, output, original_format)
 
-            # Apply filters
-            env = {
-                "original-format": original_format,
+    def run_on_willow_image(
+        self, image: AbstractImage, willow, output: BytesIO, original_format: str
+    ):
+        """
+        Applies this filter to ``willow``, the original image after it has been
+        opened and auto-oriented, and saves the result to ``output``. ``willow``
+        itself is left unchanged.
+        """
+        # Transform the image
+        transform = self.get_transform(image, (willow.image.width, willow.image.height))
+        willow = willow.crop(transform.get_rect().round())
+        willow = willow.resize(transform.size)
+
+        # Apply filters
+        env = {
+            "original-format": original_format,
+        }
+        for operation in self.filter_operations:
+            willow = operation.run(willow, image, env) or willow
+
+        # Find the output format to use
+        if "output-format" in env:
+            # Developer specified an output format
+            output_format = env["output-format"]
+        else:
+            # Convert avif, bmp and webp to png, and heic to jpg, by default
+            default_conversions = {
+                "avif": "png",
+                "bmp": "png",
+                "webp": "png",
+                "heic": "jpeg",
             }
-            for operation in self.filter_operations:
-                willow = operation.run(willow, image, env) or willow
 
-            # Find the output format to use
-            if "output-format" in env:
-                # Developer specified an output format
-                output_format = env["output-format"]
-            else:
-                # Convert avif, bmp and webp to png, and heic to jpg, by default
-                default_conversions = {
-                    "avif": "png",
-                    "bmp": "png",
-                    "webp": "png",
-                    "heic": "jpeg",
-                }
-
-                # Convert unanimated GIFs to PNG as well
-                if not willow.has_animation():
-                    default_conversions["gif"] = "png"
-
-                # Allow the user to override the conversions
-                conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
-                default_conversions.update(conversion)
-
-                # Get the converted output format falling back to the original
-                output_format = default_conversions.get(
-                    original_format, original_format
-                )
+            # Convert unanimated GIFs to PNG as well
+            if not willow.has_animation():
+                default_conversions["gif"] = "png"
 
-            if output_format == "jpeg":
-                # Allow changing of JPEG compression quality
-                if "jpeg-quality" in env:
-                    quality = env["jpeg-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
+            # Allow the user to override the conversions
+            conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
+            default_conversions.update(conversion)
 
-                # If the image has an alpha channel, give it a white background
-                if willow.has_alpha():
-                    willow = willow.set_background_color_rgb((255, 255, 255))
+            # Get the converted output format falling back to the original
+            output_format = default_conversions.get(original_format, original_format)
 
-                return willow.save_as_jpeg(
-                    output, quality=quality, progressive=True, optimize=True
-                )
-            elif output_format == "png":
-                return willow.save_as_png(output, optimize=True)
-            elif output_format == "gif":
-                return willow.save_as_gif(output)
-            elif output_format == "webp":
-                # Allow changing of WebP compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_webp(output, lossless=True)
-                elif "webp-quality" in env:
-                    quality = env["webp-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+        if output_format == "jpeg":
+            # Allow changing of JPEG compression quality
+            if "jpeg-quality" in env:
+                quality = env["jpeg-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
 
-                return willow.save_as_webp(output, quality=quality)
-            elif output_format == "avif":
-                # Allow changing of AVIF compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_avif(output, lossless=True)
-                elif "avif-quality" in env:
-                    quality = env["avif-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
-                return willow.save_as_avif(output, quality=quality)
-            elif output_format == "heic":
-                # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
-                # so there is little value in outputting it - for that reason, we make it work if someone
-                # explicitly requests it, but these settings are not documented.
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_heic(output, lossless=True)
-                elif "heic-quality" in env:
-                    quality = env["heic-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
-                return willow.save_as_heic(output, quality=quality)
-            elif output_format == "svg":
-                return willow.save_as_svg(output)
-            elif output_format == "ico":
-                return willow.save_as_ico(output)
-            raise UnknownOutputImageFormatError(
-                f"Unknown output image format '{output_format}'"
+            # If the image has an alpha channel, give it a white background
+            if willow.has_alpha():
+                willow = willow.set_background_color_rgb((255, 255, 255))
+
+            return willow.save_as_jpeg(
+                output, quality=quality, progressive=True, optimize=True
             )
+        elif output_format == "png":
+            return willow.save_as_png(output, optimize=True)
+        elif output_format == "gif":
+            return willow.save_as_gif(output)
+        elif output_format == "webp":
+            # Allow changing of WebP compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_webp(output, lossless=True)
+            elif "webp-quality" in env:
+                quality = env["webp-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+
+            return willow.save_as_webp(output, quality=quality)
+        elif output_format == "avif":
+            # Allow changing of AVIF compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_avif(output, lossless=True)
+            elif "avif-quality" in env:
+                quality = env["avif-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
+            return willow.save_as_avif(output, quality=quality)
+        elif output_format == "heic":
+            # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
+            # so there is little value in outputting it - for that reason, we make it work if someone
+            # explicitly requests it, but these settings are not documented.
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_heic(output, lossless=True)
+            elif "heic-quality" in env:
+                quality = env["heic-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
+            return willow.save_as_heic(output, quality=quality)
+        elif output_format == "svg":
+            return willow.save_as_svg(output)
+        elif output_format == "ico":
+            return willow.save_as_ico(output)
+        raise UnknownOutputImageFormatError(
+            f"Unknown output image format '{output_format}'"
+        )
 
     def get_cache_key(self, image):
         vary_parts = []
@@ -1419,8 +1625,22 @@ class AbstractRendition(ImageFileMixin, models.Model):
             self.image, self.focal_point_key, self.filter_spec
         )
 
+    @staticmethod
+    def construct_serve_cache_key(image_id, filter_spec):
+        """
+        Returns the cache key under which the image serve view stores the rendition
+        it serves for the given image ID and filter spec, which can be looked up
+        without loading the image itself.
+        """
+        return "wagtail-serve-rendition-" + "-".join([str(image_id), filter_spec])
+
     def purge_from_cache(self):
-        self.cache_backend.delete(self.get_cache_key())
+        self.cache_backend.delete_many(
+            [
+                self.get_cache_key(),
+                self.construct_serve_cache_key(self.image_id, self.filter_spec),
+            ]
+        )
 
     class Meta:
         abstract = True
@@ -3,6 +3,7 @@ from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 
 from wagtail.images import get_image_model
+from wagtail.signal_handlers import connect_entity_cache_signal_handlers
 from wagtail.tasks import delete_file_from_storage_task
 
 from .tasks import set_image_focal_point_task
@@ -20,6 +21,20 @@ def post_delete_purge_rendition_cache(instance, **kwargs):
     instance.purge_from_cache()
 
 
+def post_save_purge_rendition_serve_cache(instance, **kwargs):
+    # The renditions served for this image may change if its file or focal
+    # point has changed
+    Rendition = instance.get_rendition_model()
+    Rendition.cache_backend.delete_many(
+        [
+            Rendition.construct_serve_cache_key(instance.pk, filter_spec)
+            for filter_spec in instance.renditions.values_list(
+                "filter_spec", flat=True
+            ).distinct()
+        ]
+    )
+
+
 def post_save_image_feature_detection(instance, **kwargs):
     if getattr(settings, "WAGTAILIMAGES_FEATURE_DETECTION_ENABLED", False):
         # Make sure the image is not from a fixture
@@ -36,6 +51,8 @@ def register_signal_handlers():
     Rendition = Image.get_rendition_model()
 
     post_save.connect(post_save_image_feature_detection, sender=Image)
+    post_save.connect(post_save_purge_rendition_serve_cache, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Rendition)
     post_delete.connect(post_delete_purge_rendition_cache, sender=Rendition)
+    connect_entity_cache_signal_handlers(Image)
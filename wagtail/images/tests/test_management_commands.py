@@ -1,11 +1,18 @@
 import re
 import warnings
 from io import StringIO
+from unittest import mock
 
 from django.core import management
+from django.core.management.base import CommandError
 from django.test import TestCase, override_settings
 
-from ..management.commands.wagtail_update_image_renditions import progress_bar
+from wagtail.utils.executors import InlineExecutor
+
+from ..management.commands.wagtail_update_image_renditions import (
+    Command,
+    progress_bar,
+)
 from .utils import Image, get_test_image_file
 
 # note .utils.Image already does get_image_model()
@@ -138,3 +145,71 @@ class TestUpdateImageRenditions(TestCase):
         self.assertIn(
             f"Successfully processed {total_renditions} rendition(s)\n", output_string
         )
+
+    def create_renditions(self):
+        for filter_spec in ["width-100", "fill-50x50"]:
+            Rendition.objects.create(
+                image=self.image,
+                filter_spec=filter_spec,
+                width=100,
+                height=100,
+                file=get_test_image_file(
+                    filename="test_rendition.png", colour="white", size=(100, 100)
+                ),
+            )
+
+    def test_image_renditions_group_by_image(self):
+        self.create_renditions()
+        other_image = Image.objects.create(
+            title="Other test image",
+            file=get_test_image_file(filename="test_image.png", colour="white"),
+        )
+        other_image.get_rendition("width-100")
+
+        with mock.patch.object(
+            Image, "open_file", autospec=True, side_effect=Image.open_file
+        ) as open_file:
+            output = self.run_command(group_by_image=True)
+
+        output_string = self.REAESC.sub("", output.read())
+        self.assertIn("Regenerating 4 rendition(s)\n", output_string)
+        self.assertIn("Processed 4 rendition(s) of 2 image(s)", output_string)
+        self.assertIn("Successfully processed 4 rendition(s)\n", output_string)
+
+        # Each original image is only read once
+        self.assertEqual(open_file.call_count, 2)
+        self.assertEqual(
+            set(self.image.renditions.values_list("filter_spec", flat=True)),
+            {"original", "width-100", "fill-50x50"},
+        )
+        self.assertEqual(
+            list(other_image.renditions.values_list("filter_spec", flat=True)),
+            ["width-100"],
+        )
+
+    def test_image_renditions_group_by_image_with_purge_only(self):
+        self.create_renditions()
+        output = self.run_command(group_by_image=True, purge_only=True)
+        output_string = self.REAESC.sub("", output.read())
+        self.assertIn("Purging 3 rendition(s)\n", output_string)
+        self.assertIn("Successfully processed 3 rendition(s)\n", output_string)
+        self.assertFalse(Rendition.objects.exists())
+
+    def test_image_renditions_with_workers(self):
+        self.create_renditions()
+        # Worker processes can't see data created in a test transaction
+        with mock.patch.object(
+            Command, "get_executor", return_value=InlineExecutor()
+        ) as get_executor:
+            output = self.run_command(group_by_image=True, workers=4)
+
+        get_executor.assert_called_once_with(4)
+        output_string = self.REAESC.sub("", output.read())
+        self.assertIn("Successfully processed 3 rendition(s)\n", output_string)
+        self.assertEqual(self.image.renditions.count(), 3)
+
+    def test_workers_requires_group_by_image(self):
+        with self.assertRaisesMessage(
+            CommandError, "--workers can only be used with --group-by-image"
+        ):
+            self.run_command(workers=4)
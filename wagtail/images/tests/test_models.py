@@ -1,8 +1,13 @@
+import concurrent.futures
+import pickle
 import unittest
+from io import BytesIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
 from django.core.files import File
 from django.core.files.storage import Storage, default_storage, storages
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -12,6 +17,7 @@ from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_
 from django.urls import reverse
 from willow.image import Image as WillowImage
 
+from wagtail.images import models as image_models
 from wagtail.images.models import (
     Filter,
     Picture,
@@ -28,6 +34,7 @@ from wagtail.test.testapp.models import (
     ReimportedImageModel,
 )
 from wagtail.test.utils import WagtailTestUtils
+from wagtail.utils.executors import InlineExecutor
 
 from .utils import (
     Image,
@@ -504,6 +511,20 @@ class TestPicture(TestCase):
         )
 
 
+class PicklingInlineExecutor(InlineExecutor):
+    """
+    Runs each task in the current process as soon as it is submitted, passing the
+    arguments and result through pickle as a process pool would.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def submit(self, fn, /, *args, **kwargs):
+        args, kwargs = pickle.loads(pickle.dumps((args, kwargs)))
+        return super().submit(lambda: pickle.loads(pickle.dumps(fn(*args, **kwargs))))
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
 )
@@ -764,6 +785,180 @@ class TestRenditions(TestCase):
         # But, we should see equality on the keys
         self.assertEqual(third_result.keys(), result.keys())
 
+    def assertRenditionsCreated(self, result):
+        self.assertEqual(
+            {
+                filter.spec: (rendition.width, rendition.height)
+                for filter, rendition in result.items()
+            },
+            {"height-66": (88, 66), "width-100": (100, 75), "width-400": (400, 300)},
+        )
+        self.assertEqual(
+            set(self.image.renditions.values_list("filter_spec", flat=True)),
+            set(self.SPECS),
+        )
+
+    @override_settings(WAGTAILIMAGES_RENDITION_EXECUTOR="inline")
+    def test_create_renditions_with_inline_executor(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor"
+        ) as thread_pool_executor:
+            result = self.image.create_renditions(*filter_list)
+
+        thread_pool_executor.assert_not_called()
+        self.assertRenditionsCreated(result)
+
+    @override_settings(WAGTAILIMAGES_RENDITION_WORKERS=5)
+    def test_create_renditions_with_thread_executor(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as thread_pool_executor:
+            result = self.image.create_renditions(*filter_list)
+
+        thread_pool_executor.assert_called_once_with(max_workers=5)
+        self.assertRenditionsCreated(result)
+
+    def test_create_renditions_decodes_original_once(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with mock.patch.object(
+            Filter,
+            "get_willow_image",
+            autospec=True,
+            side_effect=Filter.get_willow_image,
+        ) as get_willow_image:
+            result = self.image.create_renditions(*filter_list)
+
+        # The original image isn't opened separately for each filter
+        get_willow_image.assert_not_called()
+        self.assertRenditionsCreated(result)
+
+        # The renditions are identical to ones generated separately
+        for filter, rendition in result.items():
+            with rendition.file.open() as f:
+                rendition_bytes = f.read()
+            with self.image.open_file() as f:
+                output = filter.run(
+                    self.image,
+                    BytesIO(),
+                    source=File(BytesIO(f.read()), name=self.image.file.name),
+                )
+            self.assertEqual(rendition_bytes, output.f.getvalue())
+
+    def test_create_renditions_with_svg_image(self):
+        self.image.file = get_test_image_file_svg(width=100, height=50)
+        self.image.save()
+        filter_list = [Filter(spec) for spec in ("width-40", "width-20")]
+        with mock.patch.object(
+            Filter,
+            "get_willow_image",
+            autospec=True,
+            side_effect=Filter.get_willow_image,
+        ) as get_willow_image:
+            result = self.image.create_renditions(*filter_list)
+
+        # SVGs are opened separately for each rendition
+        self.assertEqual(get_willow_image.call_count, 2)
+        self.assertEqual(
+            sorted(rendition.width for rendition in result.values()), [20, 40]
+        )
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_EXECUTOR="process", WAGTAILIMAGES_RENDITION_WORKERS=2
+    )
+    def test_create_renditions_with_process_executor(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        # Worker processes can't be started by the (daemonic) processes of the
+        # parallel test runner, so the pool is replaced by one running tasks inline
+        with mock.patch(
+            "concurrent.futures.ProcessPoolExecutor", PicklingInlineExecutor
+        ), mock.patch(
+            "multiprocessing.current_process", return_value=mock.Mock(daemon=False)
+        ), image_models.rendition_process_pool() as pool, mock.patch.object(
+            pool, "submit", wraps=pool.submit
+        ) as submit:
+            result = self.image.create_renditions(*filter_list)
+
+        # The filters are shared out between the workers
+        self.assertEqual(submit.call_count, 2)
+        self.assertRenditionsCreated(result)
+        for rendition in result.values():
+            self.assertIs(rendition.image, self.image)
+
+    @override_settings(WAGTAILIMAGES_RENDITION_EXECUTOR="process")
+    def test_create_renditions_with_process_executor_outside_pool_block(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as thread_pool_executor:
+            result = self.image.create_renditions(*filter_list)
+
+        # No process pool is started (such as while serving a request), so threads
+        # are used instead
+        thread_pool_executor.assert_called_once_with(max_workers=3)
+        self.assertRenditionsCreated(result)
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_EXECUTOR="process", WAGTAILIMAGES_RENDITION_WORKERS=2
+    )
+    def test_create_renditions_with_process_executor_in_daemonic_process(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with image_models.rendition_process_pool() as pool, mock.patch(
+            "multiprocessing.current_process", return_value=mock.Mock(daemon=True)
+        ), mock.patch.object(pool, "submit") as submit, mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as thread_pool_executor:
+            result = self.image.create_renditions(*filter_list)
+
+        # Daemonic processes can't use a process pool, so threads are used instead
+        submit.assert_not_called()
+        thread_pool_executor.assert_called_once_with(max_workers=2)
+        self.assertRenditionsCreated(result)
+
+    def test_generate_rendition_instances_uses_generate_rendition_instance(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with self.image.open_file() as f:
+            original_image_bytes = f.read()
+
+        with mock.patch.object(
+            type(self.image),
+            "generate_rendition_instance",
+            autospec=True,
+            side_effect=type(self.image).generate_rendition_instance,
+        ) as generate_rendition_instance, mock.patch.object(
+            Filter,
+            "get_willow_image",
+            autospec=True,
+            side_effect=Filter.get_willow_image,
+        ) as get_willow_image:
+            renditions = image_models.generate_rendition_instances(
+                self.image, filter_list, original_image_bytes
+            )
+
+        self.assertEqual(generate_rendition_instance.call_count, 3)
+        # The original is decoded once, rather than for each filter
+        get_willow_image.assert_not_called()
+        self.assertEqual(
+            {
+                rendition.filter_spec: (rendition.width, rendition.height)
+                for rendition in renditions
+            },
+            {"height-66": (88, 66), "width-100": (100, 75), "width-400": (400, 300)},
+        )
+
+    @override_settings(WAGTAILIMAGES_RENDITION_EXECUTOR="fibers")
+    def test_create_renditions_with_unknown_executor(self):
+        filter_list = [Filter(spec) for spec in self.SPECS]
+        with self.assertRaisesMessage(
+            ImproperlyConfigured,
+            "WAGTAILIMAGES_RENDITION_EXECUTOR must be one of thread, process, inline, not 'fibers'",
+        ):
+            self.image.create_renditions(*filter_list)
+
     def test_alt_attribute(self):
         rendition = self.image.get_rendition("width-400")
         self.assertEqual(rendition.alt, "Test image")
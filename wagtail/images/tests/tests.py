@@ -1,6 +1,7 @@
 import os
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import willow
 from django import forms, template
@@ -413,6 +414,101 @@ class TestFrontendServeView(TestCase):
         image = willow.Image.open(b"".join(response.streaming_content))
         self.assertIsInstance(image, AvifImageFile)
 
+    def test_get_content_type_from_filename(self):
+        signature = generate_signature(self.image.id, "fill-800x600|format-webp")
+        with mock.patch.object(
+            Image.get_rendition_model(), "get_willow_image"
+        ) as get_willow_image:
+            response = self.client.get(
+                reverse(
+                    "wagtailimages_serve",
+                    args=(signature, self.image.id, "fill-800x600|format-webp"),
+                )
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/webp")
+        get_willow_image.assert_not_called()
+
+    def test_get_uses_rendition_cache(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        self.client.get(url)
+
+        with mock.patch.object(Image, "get_rendition") as get_rendition:
+            response = self.client.get(url)
+
+        get_rendition.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        image = willow.Image.open(b"".join(response.streaming_content))
+        self.assertIsInstance(image, PNGImageFile)
+
+    def test_rendition_cache_purged_when_image_changes(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        # Changing the focal point changes the rendition to serve
+        self.image.focal_point_x = 100
+        self.image.focal_point_y = 100
+        self.image.focal_point_width = 50
+        self.image.focal_point_height = 50
+        self.image.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.image.renditions.count(), 2)
+
+        # Deleting the rendition removes it from the cache
+        self.image.renditions.all().delete()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.image.renditions.count(), 1)
+
+    def test_get_with_if_none_match(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with mock.patch.object(ServeView, "serve") as serve:
+            response = self.client.get(url, headers={"if-none-match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("max-age=3600", response["Cache-Control"])
+        # The rendition file isn't opened
+        serve.assert_not_called()
+
+        response = self.client.get(url, headers={"if-none-match": '"other"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_with_if_modified_since(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        response = self.client.get(url)
+        last_modified = response["Last-Modified"]
+
+        response = self.client.get(url, headers={"if-modified-since": last_modified})
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(
+            url, headers={"if-modified-since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+        )
+        self.assertEqual(response.status_code, 200)
+
     def test_get_with_extra_component(self):
         """
         Test that a filename can be optionally added to the end of the URL.
@@ -1,8 +1,13 @@
+import hashlib
+import os
+
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import classonlymethod, method_decorator
+from django.utils.http import http_date
 from django.views.decorators.cache import cache_control
 from django.views.generic import View
 
@@ -20,6 +25,46 @@ def generate_image_url(image, filter_spec, viewname="wagtailimages_serve", key=N
     return url
 
 
+# Content types of the rendition file formats, keyed by the extensions
+# given to rendition files (see IMAGE_FORMAT_EXTENSIONS)
+RENDITION_CONTENT_TYPES = {
+    ".avif": "image/avif",
+    ".jpg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+    ".heic": "image/heic",
+}
+
+
+def get_rendition_content_type(rendition):
+    """
+    Returns the MIME type of the given rendition, derived from its filename where
+    possible so that the file doesn't need to be opened.
+    """
+    extension = os.path.splitext(rendition.file.name)[1].lower()
+    try:
+        return RENDITION_CONTENT_TYPES[extension]
+    except KeyError:
+        with rendition.get_willow_image() as willow_image:
+            return willow_image.mime_type
+
+
+def get_rendition_etag(rendition):
+    # Rendition files are never modified once created, so their name identifies
+    # their contents
+    return '"%s"' % hashlib.sha1(rendition.file.name.encode()).hexdigest()
+
+
+def get_rendition_last_modified(rendition):
+    try:
+        return rendition.file.storage.get_modified_time(rendition.file.name)
+    except (NotImplementedError, OSError):
+        return None
+
+
 class ServeView(View):
     model = get_image_model()
     action = "serve"
@@ -42,31 +87,58 @@ class ServeView(View):
         ):
             raise PermissionDenied
 
-        image = get_object_or_404(self.model, id=image_id)
+        # Look for the rendition served for this image and filter spec previously,
+        # to avoid fetching the image from the database
+        Rendition = self.model.get_rendition_model()
+        cache_key = Rendition.construct_serve_cache_key(image_id, filter_spec)
+        cached = Rendition.cache_backend.get(cache_key)
+
+        if cached is not None:
+            rendition, last_modified = cached
+        else:
+            image = get_object_or_404(self.model, id=image_id)
+
+            # Get/generate the rendition
+            try:
+                rendition = image.get_rendition(filter_spec)
+            except SourceImageIOError:
+                return HttpResponse(
+                    "Source image file not found", content_type="text/plain", status=410
+                )
+            except InvalidFilterSpecError:
+                return HttpResponse(
+                    "Invalid filter spec: " + filter_spec,
+                    content_type="text/plain",
+                    status=400,
+                )
 
-        # Get/generate the rendition
-        try:
-            rendition = image.get_rendition(filter_spec)
-        except SourceImageIOError:
-            return HttpResponse(
-                "Source image file not found", content_type="text/plain", status=410
-            )
-        except InvalidFilterSpecError:
-            return HttpResponse(
-                "Invalid filter spec: " + filter_spec,
-                content_type="text/plain",
-                status=400,
+            last_modified = get_rendition_last_modified(rendition)
+            Rendition.cache_backend.set(cache_key, (rendition, last_modified))
+
+        if self.action == "serve":
+            etag = get_rendition_etag(rendition)
+            last_modified = last_modified and int(last_modified.timestamp())
+
+            # Respond to revalidation requests without opening the file
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
             )
+            if response is None:
+                response = self.serve(rendition)
+
+            response["ETag"] = etag
+            if last_modified:
+                response["Last-Modified"] = http_date(last_modified)
+            return response
 
         return getattr(self, self.action)(rendition)
 
     def serve(self, rendition):
-        with rendition.get_willow_image() as willow_image:
-            mime_type = willow_image.mime_type
-
         # Serve the file
         rendition.file.open("rb")
-        response = FileResponse(rendition.file, content_type=mime_type)
+        response = FileResponse(
+            rendition.file, content_type=get_rendition_content_type(rendition)
+        )
 
         # Add a CSP header to prevent inline execution
         response["Content-Security-Policy"] = "default-src 'none'"
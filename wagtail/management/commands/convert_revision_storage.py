@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from wagtail.models import (
+    REVISION_DELTA_KEY,
+    Revision,
+    is_revision_delta,
+    make_revision_delta,
+)
+from wagtail.utils.json_delta import apply_delta
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the existing revisions of each object as periodic full snapshots with "
+        "deltas in between, or convert them all back to full snapshots"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--snapshot-interval",
+            type=int,
+            help=(
+                "Store every nth revision of each object in full (default: the "
+                "WAGTAIL_REVISION_SNAPSHOT_INTERVAL setting). Pass 0 or 1 to store "
+                "all revisions in full"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of objects to convert in each transaction (default: 100)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["snapshot_interval"]
+        if interval is None:
+            interval = getattr(settings, "WAGTAIL_REVISION_SNAPSHOT_INTERVAL", 0)
+        batch_size = options["batch_size"]
+
+        objects = (
+            Revision.objects.order_by("base_content_type_id", "object_id")
+            .values_list("base_content_type_id", "object_id")
+            .distinct()
+        )
+
+        object_count = 0
+        updated_count = 0
+        batch = []
+        for key in objects.iterator():
+            batch.append(key)
+            if len(batch) == batch_size:
+                updated_count += self.convert_batch(batch, interval)
+                object_count += len(batch)
+                batch = []
+        if batch:
+            updated_count += self.convert_batch(batch, interval)
+            object_count += len(batch)
+
+        self.stdout.write(
+            f"Updated {updated_count} revisions of {object_count} objects"
+        )
+
+    @transaction.atomic
+    def convert_batch(self, batch, interval):
+        return sum(
+            self.convert_object(base_content_type_id, object_id, interval)
+            for base_content_type_id, object_id in batch
+        )
+
+    def convert_object(self, base_content_type_id, object_id, interval):
+        rows = list(
+            Revision.objects.filter(
+                base_content_type_id=base_content_type_id, object_id=object_id
+            )
+            .order_by("created_at", "id")
+            .values_list("pk", "base_revision_id", "content")
+        )
+
+        # Rebuild the full content of every revision from how it's stored now
+        stored = {
+            pk: (base_revision_id, content) for pk, base_revision_id, content in rows
+        }
+        full_contents = {}
+        for pk, base_revision_id, content in rows:
+            if is_revision_delta(content):
+                content = apply_delta(
+                    stored[base_revision_id][1], content[REVISION_DELTA_KEY]
+                )
+            full_contents[pk] = content
+
+        updated_count = 0
+        snapshot_id = None
+        delta_count = 0
+        for pk, old_base_revision_id, old_content in rows:
+            base_revision_id = None
+            content = full_contents[pk]
+
+            if interval > 1 and snapshot_id is not None and delta_count < interval - 1:
+                delta = make_revision_delta(full_contents[snapshot_id], content)
+                if delta is not None:
+                    base_revision_id = snapshot_id
+                    content = delta
+
+            if base_revision_id is None:
+                snapshot_id = pk
+                delta_count = 0
+            else:
+                delta_count += 1
+
+            if base_revision_id != old_base_revision_id or content != old_content:
+                Revision.objects.filter(pk=pk).update(
+                    base_revision_id=base_revision_id, content=content
+                )
+                updated_count += 1
+
+        return updated_count
@@ -1,10 +1,12 @@
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
-from django.db.models import Q
-from django.db.models.deletion import ProtectedError
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models.deletion import ProtectedError, RestrictedError
 from django.utils import timezone
 
-from wagtail.models import Revision, WorkflowState
+from wagtail.models import DraftStateMixin, Revision, WorkflowState
 
 
 class Command(BaseCommand):
@@ -26,14 +28,32 @@ class Command(BaseCommand):
             action="store_true",
             help="Only delete revisions of non-page models",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of revisions to delete in each transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show the number of revisions that would be deleted for each model, without deleting them",
+        )
 
     def handle(self, *args, **options):
         days = options.get("days")
         pages = options.get("pages")
         non_pages = options.get("non_pages")
 
+        if options.get("dry_run"):
+            self.show_purgeable_revisions(days=days, pages=pages, non_pages=non_pages)
+            return
+
         revisions_deleted, protected_error_count = purge_revisions(
-            days=days, pages=pages, non_pages=non_pages
+            days=days,
+            pages=pages,
+            non_pages=non_pages,
+            batch_size=options.get("batch_size") or 1000,
         )
 
         if revisions_deleted:
@@ -51,8 +71,38 @@ class Command(BaseCommand):
         else:
             self.stdout.write("No revisions deleted")
 
+    def show_purgeable_revisions(self, days, pages, non_pages):
+        purgeable_revisions = get_purgeable_revisions(
+            days=days, pages=pages, non_pages=non_pages
+        )
+        protected = get_protected_revisions_filter()
+        counts = (
+            purgeable_revisions.exclude(protected)
+            .values("content_type")
+            .annotate(count=Count("pk"))
+            .order_by("content_type")
+        )
+
+        total = 0
+        for row in counts:
+            content_type = ContentType.objects.get_for_id(row["content_type"])
+            model = content_type.model_class()
+            label = model._meta.label if model else content_type.app_labeled_name
+            self.stdout.write(f"{label}: {row['count']}")
+            total += row["count"]
 
-def purge_revisions(days=None, pages=True, non_pages=True):
+        self.stdout.write(f"{total} revisions would be deleted")
+        self.stdout.write(
+            "%s revisions would be ignored because one or more protected relations exist that prevent deletion."
+            % purgeable_revisions.filter(protected).count()
+        )
+
+
+def get_purgeable_revisions(days=None, pages=True, non_pages=True):
+    """
+    Return a queryset of the revisions that may be purged: those that are not the
+    latest revision of their object, live, approved to go live, or in moderation.
+    """
     if pages == non_pages:
         # If both are True or both are False, purge revisions of pages and non-pages
         objects = Revision.objects.all()
@@ -66,6 +116,30 @@ def purge_revisions(days=None, pages=True, non_pages=True):
         approved_go_live_at__isnull=False
     )
 
+    # exclude the latest revision of each object, by only including revisions that
+    # have a later one (using the same ordering as Revision.is_latest_revision)
+    later_revisions = Revision.objects.filter(
+        base_content_type_id=OuterRef("base_content_type_id"),
+        object_id=OuterRef("object_id"),
+    ).filter(
+        Q(created_at__gt=OuterRef("created_at"))
+        | Q(created_at=OuterRef("created_at"), pk__gt=OuterRef("pk"))
+    )
+    purgeable_revisions = purgeable_revisions.filter(Exists(later_revisions))
+
+    # and exclude live revisions
+    for relation in get_revision_relations():
+        if relation.field.name == "live_revision" and issubclass(
+            relation.related_model, DraftStateMixin
+        ):
+            purgeable_revisions = purgeable_revisions.exclude(
+                Exists(
+                    relation.related_model._base_manager.filter(
+                        live_revision=OuterRef("pk")
+                    )
+                )
+            )
+
     if getattr(settings, "WAGTAIL_WORKFLOW_ENABLED", True):
         purgeable_revisions = purgeable_revisions.exclude(
             # and exclude revisions linked to an in progress or needs changes workflow state
@@ -78,16 +152,140 @@ def purge_revisions(days=None, pages=True, non_pages=True):
         # only include revisions which were created before the cut off date
         purgeable_revisions = purgeable_revisions.filter(created_at__lt=purgeable_until)
 
-    deleted_revisions_count = 0
-    protected_error_count = 0
+    return purgeable_revisions
+
 
-    for revision in purgeable_revisions.iterator():
-        # don't delete the latest revision
-        if not revision.is_latest_revision():
-            try:
-                revision.delete()
-                deleted_revisions_count += 1
-            except ProtectedError:
-                protected_error_count += 1
+def get_revision_relations():
+    """
+    Return the relations from other models to Revision, including those without a
+    reverse accessor (such as ``live_revision``).
+    """
+    return [
+        field
+        for field in Revision._meta.get_fields(include_hidden=True)
+        if field.auto_created
+        and not field.concrete
+        and (field.one_to_many or field.one_to_one)
+    ]
+
+
+def get_protected_revisions_filter():
+    """
+    Return a filter matching the revisions that can't be deleted because another
+    object refers to them with ``on_delete=models.PROTECT``.
+    """
+    protected = Q(pk__in=[])
+    for relation in get_revision_relations():
+        if relation.on_delete is models.PROTECT:
+            protected |= Exists(
+                relation.related_model._base_manager.filter(
+                    **{relation.field.name: OuterRef("pk")}
+                )
+            )
+    return protected
+
+
+def purge_revisions(days=None, pages=True, non_pages=True, batch_size=1000):
+    purgeable_revisions = get_purgeable_revisions(
+        days=days, pages=pages, non_pages=non_pages
+    )
+
+    protected = get_protected_revisions_filter()
+    protected_error_count = purgeable_revisions.filter(protected).count()
+    purgeable_revisions = purgeable_revisions.exclude(protected)
+
+    # Revisions stored as deltas are deleted before the revisions they are based
+    # on, so that most base revisions no longer have any revisions depending on them
+    deleted_revisions_count, errors = delete_revisions_in_batches(
+        purgeable_revisions.filter(base_revision__isnull=False), batch_size
+    )
+    protected_error_count += errors
+
+    has_delta_revisions = Exists(Revision.objects.filter(base_revision=OuterRef("pk")))
+    deleted, errors = delete_revisions_in_batches(
+        purgeable_revisions.filter(base_revision__isnull=True).exclude(
+            has_delta_revisions
+        ),
+        batch_size,
+    )
+    deleted_revisions_count += deleted
+    protected_error_count += errors
+
+    # Base revisions with surviving delta revisions are deleted individually, so
+    # that the delta revisions are stored in full first
+    for revision in purgeable_revisions.filter(has_delta_revisions).iterator():
+        if delete_revision(revision):
+            deleted_revisions_count += 1
+        else:
+            protected_error_count += 1
 
     return deleted_revisions_count, protected_error_count
+
+
+def delete_revisions_in_batches(revisions, batch_size):
+    """
+    Delete the given revisions, up to ``batch_size`` at a time. Returns the number
+    of revisions deleted, and the number that couldn't be deleted because of
+    protected relations.
+    """
+    revisions = revisions.order_by("pk")
+    deleted_count = 0
+    protected_error_count = 0
+    last_pk = None
+
+    while True:
+        batch = revisions if last_pk is None else revisions.filter(pk__gt=last_pk)
+        batch_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not batch_ids:
+            break
+        last_pk = batch_ids[-1]
+
+        try:
+            with transaction.atomic():
+                move_created_comments(batch_ids)
+                deleted_count += (
+                    Revision.objects.filter(pk__in=batch_ids)
+                    .delete()[1]
+                    .get(Revision._meta.label, 0)
+                )
+        except (ProtectedError, RestrictedError):
+            # Fall back on deleting the revisions in this batch one at a time
+            for revision in Revision.objects.filter(pk__in=batch_ids):
+                if delete_revision(revision):
+                    deleted_count += 1
+                else:
+                    protected_error_count += 1
+
+    return deleted_count, protected_error_count
+
+
+def delete_revision(revision):
+    try:
+        with transaction.atomic():
+            revision.delete()
+    except (ProtectedError, RestrictedError):
+        return False
+    return True
+
+
+def move_created_comments(revision_ids):
+    """
+    Move comments created on the given revisions to the next revision of their
+    object that isn't being deleted, as Revision.delete does.
+    """
+    revisions = Revision.objects.filter(
+        pk__in=revision_ids, created_comments__isnull=False
+    ).distinct()
+    for revision in revisions:
+        next_revision = (
+            Revision.objects.filter(
+                base_content_type_id=revision.base_content_type_id,
+                object_id=revision.object_id,
+                created_at__gt=revision.created_at,
+            )
+            .exclude(pk__in=revision_ids)
+            .order_by("created_at", "pk")
+            .first()
+        )
+        if next_revision:
+            revision.created_comments.all().update(revision_created=next_revision)
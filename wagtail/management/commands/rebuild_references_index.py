@@ -1,13 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
 from django.apps import apps
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from modelcluster.models import ClusterableModel, get_all_child_relations
 
 from wagtail.models import ReferenceIndex
 from wagtail.signal_handlers import disable_reference_index_auto_update
+from wagtail.utils.executors import get_pk_ranges, setup_worker
 
 DEFAULT_CHUNK_SIZE = 1000
 
 
+def get_queryset(model):
+    """
+    Return a queryset of the objects of ``model`` to index, with any child
+    relations prefetched so that they can be scanned for references without a
+    query per object.
+    """
+    queryset = model.objects.all()
+    if issubclass(model, ClusterableModel):
+        queryset = queryset.prefetch_related(
+            *(
+                child_relation.get_accessor_name()
+                for child_relation in get_all_child_relations(model)
+            )
+        )
+    return queryset
+
+
+def index_pk_range(model_label, first_pk, last_pk):
+    """
+    Create the reference index records for the objects of the given model with
+    primary keys between ``first_pk`` and ``last_pk`` (inclusive). This runs in a
+    worker process, so only receives picklable arguments. Returns the number of
+    objects indexed.
+    """
+    model = apps.get_model(model_label)
+    objects = list(
+        get_queryset(model).filter(pk__gte=first_pk, pk__lte=last_pk).order_by("pk")
+    )
+    with transaction.atomic():
+        ReferenceIndex.create_for_objects(objects)
+    return len(objects)
+
+
 class Command(BaseCommand):
     def write(self, *args, **kwargs):
         """
@@ -27,16 +65,31 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            default=1,
+            type=int,
+            help="Number of worker processes to index objects with",
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
 
         chunk_size = options.get("chunk_size")
+        workers = options.get("workers", 1)
+        if workers < 1:
+            raise CommandError("--workers must be at least 1")
+
         object_count = 0
 
         self.write("Rebuilding reference index")
 
-        with transaction.atomic():
+        # With a single process, the whole rebuild happens in one transaction.
+        # Worker processes can't share a transaction, so each chunk is committed
+        # separately instead.
+        with transaction.atomic() if workers == 1 else nullcontext():
             with disable_reference_index_auto_update():
                 # Use `_raw_delete` to avoid loading instances into memory
                 all_references = ReferenceIndex.objects.all()
@@ -49,19 +102,53 @@ class Command(BaseCommand):
                 self.write(str(model))
 
                 # Add items (chunk_size at a time)
-                for chunk in self.print_iter_progress(
-                    self.queryset_chunks(model.objects.all().order_by("pk"), chunk_size)
-                ):
-                    for instance in chunk:
-                        ReferenceIndex.create_or_update_for_object(instance)
+                if workers > 1:
+                    chunks = self.index_chunks_in_workers(model, chunk_size, workers)
+                else:
+                    chunks = self.index_chunks(model, chunk_size)
 
-                    object_count += len(chunk)
+                for count in self.print_iter_progress(chunks):
+                    object_count += count
 
                 self.print_newline()
 
         self.write("Indexed %d objects" % object_count)
         self.print_newline()
 
+    def index_chunks(self, model, chunk_size):
+        """
+        Create the reference index records for all objects of ``model``,
+        ``chunk_size`` at a time, yielding the number of objects in each chunk
+        once it has been indexed.
+
+        The index has just been emptied, so the records are inserted directly
+        rather than being compared against existing ones.
+        """
+        for chunk in self.queryset_chunks(get_queryset(model), chunk_size):
+            ReferenceIndex.create_for_objects(chunk)
+            yield len(chunk)
+
+    def index_chunks_in_workers(self, model, chunk_size, workers):
+        """
+        Equivalent to ``index_chunks``, but splits the objects into ranges of
+        primary keys that are indexed by a pool of worker processes.
+        """
+        with self.get_executor(workers) as executor:
+            futures = [
+                executor.submit(
+                    index_pk_range, model._meta.label_lower, first_pk, last_pk
+                )
+                for first_pk, last_pk in get_pk_ranges(model.objects.all(), chunk_size)
+            ]
+
+            for future in futures:
+                yield future.result()
+
+    def get_executor(self, workers):
+        # Close database connections so that they aren't shared with forked workers
+        connections.close_all()
+        return ProcessPoolExecutor(max_workers=workers, initializer=setup_worker)
+
     def print_newline(self):
         self.write("")
 
@@ -88,19 +175,18 @@ class Command(BaseCommand):
 
             self.stdout.flush()
 
-    # Atomic so the count of models doesn't change as it is iterated
-    @transaction.atomic
     def queryset_chunks(self, qs, chunk_size=DEFAULT_CHUNK_SIZE):
         """
-        Yield a queryset in chunks of at most ``chunk_size``. The chunk yielded
-        will be a list, not a queryset. Iterating over the chunks is done in a
-        transaction so that the order and count of items in the queryset
-        remains stable.
+        Yield a queryset, ordered by primary key, in chunks of at most
+        ``chunk_size``. The chunk yielded will be a list, not a queryset. Each
+        chunk is fetched by filtering on the last primary key of the previous
+        chunk, rather than by offset, so that fetching later chunks doesn't get
+        slower as the command progresses.
         """
-        i = 0
-        while True:
-            items = list(qs[i * chunk_size :][:chunk_size])
-            if not items:
-                break
+        qs = qs.order_by("pk")
+        items = list(qs[:chunk_size])
+        while items:
             yield items
-            i += 1
+            if len(items) < chunk_size:
+                break
+            items = list(qs.filter(pk__gt=items[-1].pk)[:chunk_size])
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from wagtail.embeds.refresh import (
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_WORKERS,
+    get_embeds_to_refresh,
+    refresh_embeds,
+)
+from wagtail.models import Page
+
+
+class Command(BaseCommand):
+    help = "Fetches the embeds used on live pages that are missing or about to expire"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--expiring-within",
+            type=int,
+            default=60,
+            help="Refresh embeds that expire within this number of minutes (default: 60)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f"Number of requests to make to embed providers concurrently (default: {DEFAULT_WORKERS})",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            default=DEFAULT_RATE_LIMIT,
+            help=f"Maximum number of requests per second to each provider, or 0 for no limit (default: {DEFAULT_RATE_LIMIT})",
+        )
+
+    def handle(self, *args, **options):
+        embeds = get_embeds_to_refresh(
+            Page.objects.live(), timedelta(minutes=options["expiring_within"])
+        )
+        if not embeds:
+            self.stdout.write("No embeds to refresh")
+            return
+
+        refreshed, failed = refresh_embeds(
+            embeds,
+            rate_limit=options["rate_limit"],
+            executor=self.get_executor(options["workers"]),
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully refreshed {refreshed} embeds")
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f"Failed to refresh {failed} embeds"))
+
+    def get_executor(self, workers):
+        return ThreadPoolExecutor(max_workers=workers)
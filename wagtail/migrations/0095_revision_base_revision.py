@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:51
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+import wagtail.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtailcore", "0094_alter_page_locale"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revision",
+            name="base_revision",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.RESTRICT,
+                related_name="delta_revisions",
+                to="wagtailcore.revision",
+                verbose_name="base revision",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="revision",
+            name="content",
+            field=wagtail.models.RevisionContentField(
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                verbose_name="content JSON",
+            ),
+        ),
+    ]
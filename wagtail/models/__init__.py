@@ -12,6 +12,7 @@ as Page.
 from __future__ import annotations
 
 import functools
+import json
 import logging
 import posixpath
 import uuid
@@ -38,6 +39,7 @@ from django.db import models, transaction
 from django.db.models import Q, Value
 from django.db.models.expressions import OuterRef, Subquery
 from django.db.models.functions import Concat, Substr
+from django.db.models.query_utils import DeferredAttribute
 from django.dispatch import receiver
 from django.http import Http404, HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.http.request import validate_host
@@ -98,6 +100,7 @@ from wagtail.signals import (
 )
 from wagtail.url_routing import RouteResult
 from wagtail.utils.deprecation import RemovedInWagtail70Warning
+from wagtail.utils.json_delta import apply_delta, make_delta
 from wagtail.utils.timestamps import ensure_utc
 
 from .audit_log import (  # noqa: F401
@@ -114,6 +117,7 @@ from .i18n import (  # noqa: F401
     LocaleManager,
     TranslatableMixin,
     bootstrap_translatable_model,
+    get_localized_many,
     get_translatable_models,
 )
 from .media import (  # noqa: F401
@@ -129,7 +133,7 @@ from .media import (  # noqa: F401
 )
 from .panels import CommentPanelPlaceholder, PanelPlaceholder
 from .reference_index import ReferenceIndex  # noqa: F401
-from .sites import Site, SiteManager, SiteRootPath  # noqa: F401
+from .sites import Site, SiteManager, SiteRootPath, site_lookup_table  # noqa: F401
 from .specific import SpecificMixin
 from .view_restrictions import BaseViewRestriction
 
@@ -1467,11 +1471,15 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                     path_components = [
                         component for component in path.split("/") if component
                     ]
-                    request._wagtail_route_for_request = (
-                        site.root_page.localized.specific.route(
+                    root_page = site.root_page.localized
+                    if getattr(settings, "WAGTAIL_SINGLE_QUERY_ROUTING", False):
+                        request._wagtail_route_for_request = (
+                            root_page._route_by_url_path(request, path_components)
+                        )
+                    else:
+                        request._wagtail_route_for_request = root_page.specific.route(
                             request, path_components
                         )
-                    )
                 else:
                     request._wagtail_route_for_request = None
             except Http404:
@@ -1713,6 +1721,8 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         # always check if this page is a site root, even if it's new.
         if self.is_site_root():
             Site.clear_site_root_paths_cache()
+            # The site lookup table holds a copy of each site's root page
+            site_lookup_table.clear_on_commit()
 
         # Log
         if is_new:
@@ -1857,6 +1867,47 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             else:
                 raise Http404
 
+    def _route_by_url_path(self, request, path_components):
+        """
+        Equivalent to ``self.specific.route(request, path_components)``, but
+        looks up all pages along the path with a single query on ``url_path``
+        rather than one query per path component. Only the page that ends up
+        handling the request is fetched in its specific form.
+
+        Pages whose type overrides ``route()`` (such as ``RoutablePageMixin``
+        pages) are passed the remaining path components, and routing continues
+        from there in the usual per-component way.
+        """
+        candidate_url_paths = [
+            self.url_path + "/".join(path_components[:depth]) + "/"
+            for depth in range(1, len(path_components) + 1)
+        ]
+        pages_by_url_path = {}
+        if candidate_url_paths:
+            for page in (
+                Page.objects.descendant_of(self)
+                .filter(url_path__in=candidate_url_paths)
+                .order_by("path")
+            ):
+                pages_by_url_path.setdefault(page.url_path, page)
+
+        page = self
+        for position, url_path in enumerate(candidate_url_paths):
+            specific_class = page.specific_class
+            if specific_class is not None and specific_class.route is not Page.route:
+                return page.specific.route(request, path_components[position:])
+
+            try:
+                subpage = pages_by_url_path[url_path]
+            except KeyError:
+                raise Http404
+
+            # Cache the parent page on the subpage to avoid another db query
+            setattr(subpage, "_cached_parent_obj", page)
+            page = subpage
+
+        return page.specific.route(request, [])
+
     def get_admin_display_title(self):
         """
         Return the title for this page as it should appear in the admin backend;
@@ -3056,6 +3107,60 @@ class PageRevisionsManager(RevisionsManager):
         return RevisionQuerySet(self.model, using=self._db).page_revisions()
 
 
+# Key of the dict stored as the content of revisions that are stored as a delta
+REVISION_DELTA_KEY = "__wagtail_revision_delta__"
+
+
+def is_revision_delta(content):
+    return isinstance(content, dict) and REVISION_DELTA_KEY in content
+
+
+def make_revision_delta(base_content, content):
+    """
+    Return the value to store as the content of a revision to record it as a delta
+    from ``base_content``, or None if the delta would be no smaller than the content.
+    """
+    # Compare the content as it will be stored in the database
+    content_json = json.dumps(content, cls=DjangoJSONEncoder)
+    delta = {REVISION_DELTA_KEY: make_delta(base_content, json.loads(content_json))}
+    if len(json.dumps(delta)) >= len(content_json):
+        return None
+    return delta
+
+
+class RevisionContentDescriptor(DeferredAttribute):
+    """
+    Rebuilds the full content of a revision that is stored as a delta from its base
+    revision when the content is first accessed.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        content = super().__get__(instance, cls)
+        if is_revision_delta(content):
+            content = apply_delta(
+                instance._get_base_revision_content(), content[REVISION_DELTA_KEY]
+            )
+            instance.__dict__[self.field.attname] = content
+        return content
+
+    def __set__(self, instance, value):
+        # Defining __set__ ensures __get__ is called even once the (possibly delta)
+        # value is in the instance's __dict__
+        instance.__dict__[self.field.attname] = value
+
+
+class RevisionContentField(models.JSONField):
+    descriptor_class = RevisionContentDescriptor
+
+    def pre_save(self, model_instance, add):
+        # Save the content as it is stored on the instance, rather than rebuilding
+        # the full content of a delta
+        return model_instance.__dict__[self.attname]
+
+
 class Revision(models.Model):
     content_type = models.ForeignKey(
         ContentType, on_delete=models.CASCADE, related_name="+"
@@ -3077,9 +3182,18 @@ class Revision(models.Model):
         related_name="wagtail_revisions",
     )
     object_str = models.TextField(default="")
-    content = models.JSONField(
+    content = RevisionContentField(
         verbose_name=_("content JSON"), encoder=DjangoJSONEncoder
     )
+    base_revision = models.ForeignKey(
+        "self",
+        verbose_name=_("base revision"),
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.RESTRICT,
+        related_name="delta_revisions",
+    )
     approved_go_live_at = models.DateTimeField(
         verbose_name=_("approved go live at"), null=True, blank=True, db_index=True
     )
@@ -3110,7 +3224,26 @@ class Revision(models.Model):
         if self.base_content_type_id is None:
             self.base_content_type_id = self.content_type_id
 
-        super().save(*args, **kwargs)
+        if self.pk is None:
+            # Rebuild the content from its original base revision (if this is a
+            # copy of a revision stored as a delta) before choosing a new one
+            self.content  # noqa: B018
+            self.base_revision_id = self._get_snapshot_id_for_delta()
+            self._base_revision_content = None
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            if update_fields is not None and "base_revision" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "base_revision"]
+
+            content = self.content
+            self.__dict__["content"] = self._get_stored_content(content)
+            try:
+                super().save(*args, **kwargs)
+            finally:
+                self.__dict__["content"] = content
+        else:
+            super().save(*args, **kwargs)
 
         if (
             self.approved_go_live_at is None
@@ -3137,6 +3270,91 @@ class Revision(models.Model):
                 revision=self,
             )
 
+    def _get_snapshot_id_for_delta(self):
+        """
+        Return the ID of the revision that this (new) revision should be stored as
+        a delta of, or None if it should be stored in full. Every
+        WAGTAIL_REVISION_SNAPSHOT_INTERVAL-th revision of an object is stored in
+        full, and the others as a delta of the latest full revision.
+        """
+        interval = getattr(settings, "WAGTAIL_REVISION_SNAPSHOT_INTERVAL", 0)
+        if not interval or interval < 2:
+            return None
+
+        snapshot = (
+            Revision.objects.filter(
+                base_content_type_id=self.base_content_type_id,
+                object_id=self.object_id,
+                base_revision__isnull=True,
+            )
+            .annotate(delta_count=models.Count("delta_revisions"))
+            .order_by("-created_at", "-id")
+            .values_list("pk", "delta_count")
+            .first()
+        )
+        if snapshot is None or snapshot[1] >= interval - 1:
+            return None
+        return snapshot[0]
+
+    def _get_base_revision_content(self):
+        # Base revisions are always stored in full
+        base_content = getattr(self, "_base_revision_content", None)
+        if base_content is None:
+            if "base_revision_id" in self.__dict__:
+                base_revisions = Revision.objects.filter(pk=self.base_revision_id)
+            else:
+                # Avoid a separate query to load the deferred base revision ID
+                base_revisions = Revision.objects.filter(delta_revisions=self.pk)
+            base_content = base_revisions.values_list("content", flat=True).get()
+            self._base_revision_content = base_content
+        return base_content
+
+    def _get_stored_content(self, content):
+        """
+        Return the value to store for the given content: a delta from the base
+        revision if there is one, or the content itself. Falls back on storing the
+        content in full (with no base revision) if the delta would be as large.
+        """
+        if self.base_revision_id is None:
+            return content
+
+        delta = make_revision_delta(self._get_base_revision_content(), content)
+        if delta is None:
+            self.base_revision_id = None
+            self._base_revision_content = None
+            return content
+        return delta
+
+    def _promote_delta_revisions(self):
+        """
+        Store the revisions that are deltas of this one in a form that doesn't
+        depend on it, so that it can be deleted. The first of them is stored in
+        full, and the rest as deltas of that.
+        """
+        delta_revisions = list(self.delta_revisions.order_by("created_at", "id"))
+        if not delta_revisions:
+            return
+
+        # This instance may be out of date if other revisions have been deleted
+        # since it was fetched
+        self.refresh_from_db(fields=["content", "base_revision"])
+        self._base_revision_content = None
+
+        # Rebuild the full content of each revision while this one still exists
+        content = self.content
+        for revision in delta_revisions:
+            revision._base_revision_content = content
+            revision.content  # noqa: B018
+
+        new_snapshot, *other_revisions = delta_revisions
+        new_snapshot.base_revision = None
+        new_snapshot.save(update_fields=["content", "base_revision"])
+
+        for revision in other_revisions:
+            revision.base_revision = new_snapshot
+            revision._base_revision_content = new_snapshot.content
+            revision.save(update_fields=["content", "base_revision"])
+
     def as_object(self):
         return self.content_object.with_content_json(self.content)
 
@@ -3169,6 +3387,8 @@ class Revision(models.Model):
             # move comments created on this revision to the next revision, as they may well still apply if they're unresolved
             self.created_comments.all().update(revision_created=next_revision)
 
+        self._promote_delta_revisions()
+
         return super().delete()
 
     def publish(
@@ -3283,19 +3503,18 @@ class PagePermissionTester:
         self.page_is_root = page.depth == 1  # Equivalent to page.is_root()
 
         if self.user.is_active and not self.user.is_superuser:
-            self.permissions = {
-                # Get the 'action' part of the permission codename, e.g.
-                # 'add' instead of 'add_page'
-                perm.permission.codename.rsplit("_", maxsplit=1)[0]
-                for perm in self.permission_policy.get_cached_permissions_for_user(user)
-                if self.page.path.startswith(perm.page.path)
-            }
+            tree = self.permission_policy.get_permission_tree_for_user(user)
+            self.permissions = tree.permissions_for(page)
 
     def user_has_lock(self):
         return self.page.locked_by_id == self.user.pk
 
+    @cached_property
+    def _lock(self):
+        return self.page.get_lock()
+
     def page_locked(self):
-        lock = self.page.get_lock()
+        lock = self._lock
         return lock and lock.for_user(self.user)
 
     def can_add_subpage(self):
@@ -1,4 +1,5 @@
 import uuid
+from collections import defaultdict
 
 from django.apps import apps
 from django.conf import settings
@@ -17,6 +18,7 @@ from wagtail.coreutils import (
     get_supported_content_language_variant,
 )
 from wagtail.signals import pre_validate_delete
+from wagtail.utils.process_cache import VersionedProcessCache
 
 
 def pk(obj):
@@ -26,15 +28,67 @@ def pk(obj):
         return obj
 
 
+LOCALE_REGISTRY_VERSION_CACHE_KEY = "wagtail_locale_registry_version"
+
+
 class LocaleManager(models.Manager):
     def get_for_language(self, language_code):
         """
         Gets a Locale from a language code.
         """
-        return self.get(
-            language_code=get_supported_content_language_variant(language_code)
+        language_code = get_supported_content_language_variant(language_code)
+        if getattr(settings, "WAGTAIL_LOCALE_REGISTRY", False):
+            return get_locale_registry().get_for_language(language_code)
+        return self.get(language_code=language_code)
+
+
+class LocaleRegistry:
+    """
+    An in-memory index of all Locale records by language code, used by
+    ``Locale.objects.get_for_language`` (and so ``Locale.get_active`` and
+    ``Locale.get_default``) to find locales without querying the database.
+
+    Locale instances are built afresh for each lookup, so that nothing cached
+    on an instance is shared between requests.
+    """
+
+    def __init__(self, locale_rows, field_names, db=None):
+        self.field_names = field_names
+        self.db = db
+
+        language_code_index = field_names.index("language_code")
+        self.rows_by_language_code = {
+            row[language_code_index]: row for row in locale_rows
+        }
+
+    @classmethod
+    def build(cls):
+        queryset = Locale.all_objects.all()
+        field_names = [field.attname for field in Locale._meta.concrete_fields]
+        return cls(
+            list(queryset.values_list(*field_names)), field_names, db=queryset.db
         )
 
+    def get_for_language(self, language_code):
+        row = self.rows_by_language_code.get(language_code)
+        if row is None:
+            raise Locale.DoesNotExist()
+
+        return Locale.from_db(self.db, self.field_names, row)
+
+
+locale_registry = VersionedProcessCache(
+    LOCALE_REGISTRY_VERSION_CACHE_KEY, LocaleRegistry.build
+)
+
+
+def get_locale_registry():
+    """
+    Return the process-local ``LocaleRegistry``, rebuilt whenever a Locale is
+    changed by this or another process.
+    """
+    return locale_registry.get()
+
 
 class Locale(models.Model):
     #: The language code that represents this locale
@@ -70,6 +124,14 @@ class Locale(models.Model):
         except (cls.DoesNotExist, LookupError):
             return cls.get_default()
 
+    @staticmethod
+    def clear_locale_registry():
+        """
+        Discard the in-process locale registry, and invalidate the copies
+        held by other processes by deleting the shared version key.
+        """
+        locale_registry.clear()
+
     @transaction.atomic
     def delete(self, *args, **kwargs):
         # Provide a signal like pre_delete, but sent before on_delete validation.
@@ -377,6 +439,72 @@ class TranslatableMixin(models.Model):
         return cls._meta.get_field("locale").model
 
 
+def get_localized_many(instances, include_drafts=False, queryset=None, cache=None):
+    """
+    Equivalent to ``[instance.localized for instance in instances]`` (or
+    ``localized_draft``, if ``include_drafts`` is true), but finds the translations
+    of all the instances in the active locale with a single query per
+    translation model. ``None`` items are returned unchanged.
+
+    ``queryset`` is the queryset to find the translations in, defaulting to the
+    default manager of the translation model (made specific if any of the
+    instances are specific). ``cache`` is an optional dict mapping translation keys
+    to the translations found, to share between calls.
+    """
+    from wagtail.models import DraftStateMixin
+
+    instances = list(instances)
+    if not getattr(settings, "WAGTAIL_I18N_ENABLED", False):
+        return instances
+
+    try:
+        locale = Locale.get_active()
+    except (LookupError, Locale.DoesNotExist):
+        return instances
+
+    if cache is None:
+        cache = {}
+
+    instances_by_model = defaultdict(list)
+    for instance in instances:
+        if (
+            instance is not None
+            and instance.locale_id != locale.id
+            and instance.translation_key not in cache
+        ):
+            instances_by_model[instance.get_translation_model()].append(instance)
+
+    for translation_model, model_instances in instances_by_model.items():
+        if queryset is not None and issubclass(queryset.model, translation_model):
+            translations = queryset
+        else:
+            translations = translation_model._default_manager.all()
+            if hasattr(translations, "specific") and any(
+                type(instance) is not translation_model for instance in model_instances
+            ):
+                translations = translations.specific()
+
+        translation_keys = {instance.translation_key for instance in model_instances}
+        translations = translations.filter(
+            translation_key__in=translation_keys, locale=locale
+        )
+        if not include_drafts and issubclass(translations.model, DraftStateMixin):
+            translations = translations.filter(live=True)
+
+        translations_by_key = {
+            translation.translation_key: translation for translation in translations
+        }
+        for translation_key in translation_keys:
+            cache[translation_key] = translations_by_key.get(translation_key)
+
+    return [
+        (cache.get(instance.translation_key) or instance)
+        if instance is not None and instance.locale_id != locale.id
+        else instance
+        for instance in instances
+    ]
+
+
 def bootstrap_translatable_model(model, locale):
     """
     This function populates the "translation_key", and "locale" fields on model instances that were created
@@ -422,92 +422,207 @@ class ReferenceIndex(models.Model):
         Args:
             object (Model): The model instance to create/update ReferenceIndex records for
         """
+        cls.create_or_update_for_objects([object])
+
+    @classmethod
+    def create_or_update_for_objects(cls, objects):
+        """
+        Creates or updates ReferenceIndex records for the given objects, which must
+        all be instances of the same model.
+
+        This is equivalent to calling ``create_or_update_for_object`` on each object,
+        but fetches the existing references for all of them in one query, and
+        performs a single insert and a single delete.
+
+        Note: This method must be called within a `django.db.transaction.atomic()` block.
+
+        Args:
+            objects (list[Model]): The model instances to create/update ReferenceIndex records for
+        """
+        if not objects:
+            return
+
         # For the purpose of this method, a "reference record" is a tuple of
         # (to_content_type_id, to_object_id, model_path, content_path) - the properties that
         # uniquely define a reference
 
-        # Extract new references and construct a set of reference records
-        references = set(cls._extract_references_from_object(object))
-
         # Find content types for this model and all of its ancestor classes,
         # ordered from most to least specific
+        model = type(objects[0])
         content_types = [
-            ContentType.objects.get_for_model(model_or_object, for_concrete_model=False)
-            for model_or_object in ([object] + object._meta.get_parent_list())
+            ContentType.objects.get_for_model(model_or_parent, for_concrete_model=False)
+            for model_or_parent in ([model] + model._meta.get_parent_list())
         ]
         content_type = content_types[0]
         base_content_type = content_types[-1]
         known_content_type_ids = [ct.id for ct in content_types]
 
-        # Find existing references in the database so we know what to add/delete.
-        # Construct a dict mapping reference records to the (content_type_id, id) pair that the
-        # existing database entry is found under
-        existing_references = {
-            (to_content_type_id, to_object_id, model_path, content_path): (
-                content_type_id,
-                id,
-            )
-            for id, content_type_id, to_content_type_id, to_object_id, model_path, content_path in cls.objects.filter(
-                base_content_type=base_content_type, object_id=object.pk
-            ).values_list(
-                "id",
-                "content_type_id",
-                "to_content_type",
-                "to_object_id",
-                "model_path",
-                "content_path",
-            )
+        # Extract new references and construct a set of reference records for each object
+        references_by_object_id = {
+            str(object.pk): set(cls._extract_references_from_object(object))
+            for object in objects
         }
 
-        # Construct the set of reference records that have been found on the object but are not
-        # already present in the database
-        new_references = references - set(existing_references.keys())
+        # Find existing references in the database so we know what to add/delete.
+        # Construct a dict for each object, mapping reference records to the
+        # (content_type_id, id) pair that the existing database entry is found under
+        existing_references_by_object_id = {
+            object_id: {} for object_id in references_by_object_id
+        }
+        for (
+            id,
+            content_type_id,
+            object_id,
+            to_content_type_id,
+            to_object_id,
+            model_path,
+            content_path,
+        ) in cls.objects.filter(
+            base_content_type=base_content_type,
+            object_id__in=list(references_by_object_id),
+        ).values_list(
+            "id",
+            "content_type_id",
+            "object_id",
+            "to_content_type",
+            "to_object_id",
+            "model_path",
+            "content_path",
+        ):
+            existing_references_by_object_id[object_id][
+                (to_content_type_id, to_object_id, model_path, content_path)
+            ] = (content_type_id, id)
 
-        bulk_create_kwargs = {}
-        if connection.features.supports_ignore_conflicts:
-            bulk_create_kwargs["ignore_conflicts"] = True
+        new_records = []
+        deleted_reference_ids = []
+        for object_id, references in references_by_object_id.items():
+            existing_references = existing_references_by_object_id[object_id]
 
-        # Create database records for those reference records
-        cls.objects.bulk_create(
-            [
+            # Construct database records for the reference records that have been found
+            # on the object but are not already present in the database
+            new_records.extend(
                 cls(
                     content_type=content_type,
                     base_content_type=base_content_type,
-                    object_id=object.pk,
+                    object_id=object_id,
                     to_content_type_id=to_content_type_id,
                     to_object_id=to_object_id,
                     model_path=model_path,
                     content_path=content_path,
                     content_path_hash=cls._get_content_path_hash(content_path),
                 )
-                for to_content_type_id, to_object_id, model_path, content_path in new_references
-            ],
-            **bulk_create_kwargs,
-        )
+                for to_content_type_id, to_object_id, model_path, content_path in (
+                    references - set(existing_references.keys())
+                )
+            )
 
-        # Delete removed references
-        deleted_reference_ids = []
-        # Look at the reference record and the supporting content_type / id for each existing
-        # reference in the database
-        for reference_data, (content_type_id, id) in existing_references.items():
-            if reference_data in references:
-                # Do not delete this reference, as it is still present in the new set
-                continue
-
-            if content_type_id not in known_content_type_ids:
-                # The content type for the existing record does not match the current model or any
-                # superclass. We can infer that the existing record is for a more specific subclass
-                # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
-                # the existing reference was recorded against <BlogPage id=123>. In this case, do
-                # not treat the missing reference as a deletion - it likely still exists, but on a
-                # relation which can only be seen on the more specific model.
-                continue
-
-            # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
-            deleted_reference_ids.append(id)
+            # Look at the reference record and the supporting content_type / id for each existing
+            # reference in the database
+            for reference_data, (content_type_id, id) in existing_references.items():
+                if reference_data in references:
+                    # Do not delete this reference, as it is still present in the new set
+                    continue
+
+                if content_type_id not in known_content_type_ids:
+                    # The content type for the existing record does not match the current model or any
+                    # superclass. We can infer that the existing record is for a more specific subclass
+                    # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
+                    # the existing reference was recorded against <BlogPage id=123>. In this case, do
+                    # not treat the missing reference as a deletion - it likely still exists, but on a
+                    # relation which can only be seen on the more specific model.
+                    continue
+
+                # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
+                deleted_reference_ids.append(id)
+
+        bulk_create_kwargs = {}
+        if connection.features.supports_ignore_conflicts:
+            bulk_create_kwargs["ignore_conflicts"] = True
+
+        # Create database records for the new references
+        cls.objects.bulk_create(new_records, **bulk_create_kwargs)
 
         # Perform the deletion
-        cls.objects.filter(id__in=deleted_reference_ids).delete()
+        if deleted_reference_ids:
+            cls.objects.filter(id__in=deleted_reference_ids).delete()
+
+    @classmethod
+    def create_for_objects(cls, objects):
+        """
+        Creates ReferenceIndex records for the given objects, which must all be
+        instances of the same model, in a single ``bulk_create``.
+
+        Unlike ``create_or_update_for_object``, this does not compare against the
+        references already recorded for the objects, so it should only be used to
+        populate an index that has no records for them yet - such as one that has
+        just been cleared by the ``rebuild_references_index`` command. The only
+        existing records taken into account are ones for the same objects that
+        have been recorded as instances of a superclass.
+
+        Args:
+            objects (list[Model]): The model instances to create ReferenceIndex records for
+
+        Returns:
+            The number of ReferenceIndex records created
+        """
+        if not objects:
+            return 0
+
+        model = type(objects[0])
+        content_types = [
+            ContentType.objects.get_for_model(model_or_parent, for_concrete_model=False)
+            for model_or_parent in ([model] + model._meta.get_parent_list())
+        ]
+        content_type = content_types[0]
+        base_content_type = content_types[-1]
+
+        # If the objects' superclass is indexed too, references from its fields
+        # may have been recorded already. Fetch these in one query so that they
+        # aren't inserted twice.
+        existing_references = set()
+        if len(content_types) > 1:
+            existing_references = set(
+                cls.objects.filter(
+                    base_content_type=base_content_type,
+                    object_id__in=[str(object.pk) for object in objects],
+                ).values_list(
+                    "object_id", "to_content_type", "to_object_id", "content_path"
+                )
+            )
+
+        references = []
+        for object in objects:
+            object_id = str(object.pk)
+            for to_content_type_id, to_object_id, model_path, content_path in set(
+                cls._extract_references_from_object(object)
+            ):
+                if (
+                    object_id,
+                    to_content_type_id,
+                    to_object_id,
+                    content_path,
+                ) in existing_references:
+                    continue
+
+                references.append(
+                    cls(
+                        content_type=content_type,
+                        base_content_type=base_content_type,
+                        object_id=object_id,
+                        to_content_type_id=to_content_type_id,
+                        to_object_id=to_object_id,
+                        model_path=model_path,
+                        content_path=content_path,
+                        content_path_hash=cls._get_content_path_hash(content_path),
+                    )
+                )
+
+        bulk_create_kwargs = {}
+        if connection.features.supports_ignore_conflicts:
+            bulk_create_kwargs["ignore_conflicts"] = True
+
+        cls.objects.bulk_create(references, **bulk_create_kwargs)
+        return len(references)
 
     @classmethod
     def remove_for_object(cls, object):
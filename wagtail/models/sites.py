@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 from django.apps import apps
 from django.conf import settings
@@ -10,6 +10,8 @@ from django.db.models.functions import Lower
 from django.http.request import split_domain_port
 from django.utils.translation import gettext_lazy as _
 
+from wagtail.utils.process_cache import VersionedProcessCache
+
 MATCH_HOSTNAME_PORT = 0
 MATCH_HOSTNAME_DEFAULT = 1
 MATCH_DEFAULT = 2
@@ -20,6 +22,9 @@ def get_site_for_hostname(hostname, port):
     """Return the wagtailcore.Site object for the given hostname and port."""
     Site = apps.get_model("wagtailcore.Site")
 
+    if getattr(settings, "WAGTAIL_SITE_LOOKUP_TABLE", False):
+        return get_site_lookup_table().find_for_hostname(hostname, port)
+
     sites = list(
         Site.objects.annotate(
             match=Case(
@@ -61,6 +66,105 @@ def get_site_for_hostname(hostname, port):
     raise Site.DoesNotExist()
 
 
+class SiteLookupTable:
+    """
+    An in-memory index of all Site records, used by ``get_site_for_hostname``
+    to find the site for a hostname and port without querying the database.
+    Matches are chosen with the same precedence as the database lookup.
+
+    The fields of each site's root page are held alongside it, so that the root
+    page is attached as ``select_related("root_page")`` would. Site and Page
+    instances are built afresh for each lookup, so that they (and anything else
+    cached on them) are never shared between requests.
+    """
+
+    def __init__(self, site_rows, field_names, root_page_field_names=(), db=None):
+        self.field_names = field_names
+        self.root_page_field_names = root_page_field_names
+        self.db = db
+        self.rows_by_hostname_port = {}
+        self.rows_by_hostname = defaultdict(list)
+        self.default_row = None
+
+        hostname_index = field_names.index("hostname")
+        port_index = field_names.index("port")
+        is_default_site_index = field_names.index("is_default_site")
+
+        for row in site_rows:
+            hostname = row[hostname_index]
+            self.rows_by_hostname_port[(hostname, row[port_index])] = row
+            self.rows_by_hostname[hostname].append(row)
+            if row[is_default_site_index]:
+                self.default_row = row
+
+        self.default_hostname = (
+            self.default_row[hostname_index] if self.default_row else None
+        )
+
+    @classmethod
+    def build(cls):
+        Site = apps.get_model("wagtailcore.Site")
+        Page = apps.get_model("wagtailcore.Page")
+        queryset = Site.objects.all()
+        field_names = [field.attname for field in Site._meta.concrete_fields]
+        root_page_field_names = [field.attname for field in Page._meta.concrete_fields]
+        return cls(
+            list(
+                queryset.values_list(
+                    *field_names,
+                    *(f"root_page__{name}" for name in root_page_field_names),
+                )
+            ),
+            field_names,
+            root_page_field_names,
+            db=queryset.db,
+        )
+
+    def _get_row(self, hostname, port):
+        try:
+            port = int(port)
+        except (TypeError, ValueError):
+            port = None
+
+        # exact hostname+port match first
+        if row := self.rows_by_hostname_port.get((hostname, port)):
+            return row
+
+        # then hostname+default
+        if self.default_row and self.default_hostname == hostname:
+            return self.default_row
+
+        # then a unique hostname match, falling back on the default
+        hostname_rows = self.rows_by_hostname.get(hostname, [])
+        if len(hostname_rows) == 1:
+            return hostname_rows[0]
+        return self.default_row
+
+    def find_for_hostname(self, hostname, port):
+        Site = apps.get_model("wagtailcore.Site")
+
+        row = self._get_row(hostname, port)
+        if row is None:
+            raise Site.DoesNotExist()
+
+        site_field_count = len(self.field_names)
+        site = Site.from_db(self.db, self.field_names, row[:site_field_count])
+        if self.root_page_field_names:
+            Page = apps.get_model("wagtailcore.Page")
+            site._state.fields_cache["root_page"] = Page.from_db(
+                self.db, self.root_page_field_names, row[site_field_count:]
+            )
+        return site
+
+
+def get_site_lookup_table():
+    """
+    Return the process-local ``SiteLookupTable``, rebuilt whenever a Site is changed
+    by this or another process.
+    """
+    return site_lookup_table.get()
+
+
 class SiteManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().order_by(Lower("hostname"))
@@ -75,6 +179,12 @@ SITE_ROOT_PATHS_CACHE_KEY = "wagtail_site_root_paths"
 # Increase the cache version whenever the structure SiteRootPath tuple changes
 SITE_ROOT_PATHS_CACHE_VERSION = 2
 
+SITE_LOOKUP_TABLE_VERSION_CACHE_KEY = "wagtail_site_lookup_table_version"
+
+site_lookup_table = VersionedProcessCache(
+    SITE_LOOKUP_TABLE_VERSION_CACHE_KEY, SiteLookupTable.build
+)
+
 
 class Site(models.Model):
     hostname = models.CharField(
@@ -268,3 +378,11 @@ class Site(models.Model):
     @staticmethod
     def clear_site_root_paths_cache():
         cache.delete(SITE_ROOT_PATHS_CACHE_KEY, version=SITE_ROOT_PATHS_CACHE_VERSION)
+
+    @staticmethod
+    def clear_site_lookup_table():
+        """
+        Discard the in-process site lookup table, and invalidate the copies
+        held by other processes by deleting the shared version key.
+        """
+        site_lookup_table.clear()
@@ -5,9 +5,54 @@ from wagtail.models import GroupPagePermission, Page
 from wagtail.permission_policies.base import OwnershipPermissionPolicy
 
 
+class PagePermissionTree:
+    """
+    A user's page permissions, compiled into a trie keyed by the segments of each page's
+    treebeard path. The permissions that apply to a page (those granted on the page or
+    any of its ancestors) are found by walking down the trie along the page's path, in
+    time proportional to the page's depth rather than the number of permissions.
+    """
+
+    class Node:
+        __slots__ = ("actions", "children")
+
+        def __init__(self):
+            self.actions = set()
+            self.children = {}
+
+    def __init__(self, permissions, steplen=Page.steplen):
+        self.steplen = steplen
+        self.root = self.Node()
+        for perm in permissions:
+            node = self.root
+            for segment in self._get_segments(perm.page.path):
+                node = node.children.setdefault(segment, self.Node())
+            # Get the 'action' part of the permission codename, e.g.
+            # 'add' instead of 'add_page'
+            node.actions.add(perm.permission.codename.rsplit("_", maxsplit=1)[0])
+
+    def _get_segments(self, path):
+        return (path[i : i + self.steplen] for i in range(0, len(path), self.steplen))
+
+    def permissions_for(self, page):
+        """
+        Return the set of actions (e.g. 'add', 'change') that the user has permission
+        to perform on the given page.
+        """
+        actions = set()
+        node = self.root
+        for segment in self._get_segments(page.path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            actions |= node.actions
+        return actions
+
+
 class PagePermissionPolicy(OwnershipPermissionPolicy):
     permission_cache_name = "_page_permission_cache"
     _explorable_root_instance_cache_name = "_explorable_root_page_cache"
+    _permission_tree_cache_name = "_page_permission_tree_cache"
 
     def __init__(self, model=Page):
         super().__init__(model=model)
@@ -19,6 +64,30 @@ class PagePermissionPolicy(OwnershipPermissionPolicy):
             "page", "permission"
         )
 
+    def get_permission_tree_for_user(self, user):
+        """
+        Return a PagePermissionTree for the user's page permissions. This is used by
+        every PagePermissionTester built for the user, so cache the result on the user
+        for the duration of the request.
+        """
+        if hasattr(user, self._permission_tree_cache_name):
+            return getattr(user, self._permission_tree_cache_name)
+        tree = PagePermissionTree(
+            self.get_cached_permissions_for_user(user), steplen=self.model.steplen
+        )
+        setattr(user, self._permission_tree_cache_name, tree)
+        return tree
+
+    def testers_for_pages(self, user, pages):
+        """
+        Return a dict mapping the ID of each of the given pages to a
+        PagePermissionTester for the user, for use when listing many pages.
+        """
+        # Compile the user's permissions once, up front
+        if user.is_active and not user.is_superuser:
+            self.get_permission_tree_for_user(user)
+        return {page.pk: page.permissions_for_user(user) for page in pages}
+
     def _base_user_has_permission(self, user):
         if not user.is_active:
             return False
@@ -6,13 +6,13 @@ from typing import Any
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import CharField, Prefetch, Q
+from django.db.models import CharField, Model, Prefetch, Q, QuerySet
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Cast, Length, Substr
 from django.db.models.query import ModelIterable
 from treebeard.mp_tree import MP_NodeQuerySet
 
-from wagtail.models.i18n import Locale
+from wagtail.models.i18n import Locale, get_localized_many
 from wagtail.models.sites import Site
 from wagtail.search.queryset import SearchableQuerySetMixin
 
@@ -317,7 +317,136 @@ class SpecificQuerySetMixin:
         return clone
 
 
-class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet):
+class TranslatableQuerySetMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # set by localized()
+        self._localized = False
+        self._localized_include_drafts = False
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._localized = self._localized
+        clone._localized_include_drafts = self._localized_include_drafts
+        return clone
+
+    def _fetch_all(self):
+        localize = self._localized and self._result_cache is None
+        super()._fetch_all()
+        if localize and self._result_cache and isinstance(self._result_cache[0], Model):
+            self._result_cache = get_localized_many(
+                self._result_cache,
+                include_drafts=self._localized_include_drafts,
+                queryset=self._get_translations_queryset(),
+            )
+
+    def localized(self, include_drafts=False):
+        """
+        Swaps each result for its translation in the active locale when the
+        queryset is evaluated, like the ``localized`` attribute of each result (or
+        ``localized_draft`` if ``include_drafts`` is true). The translations of all
+        of the results are found with a single query.
+        """
+        clone = self._chain()
+        clone._localized = True
+        clone._localized_include_drafts = include_drafts
+        return clone
+
+    def _get_translations_queryset(self):
+        return self.model._default_manager.all()
+
+
+class TranslatableQuerySet(TranslatableQuerySetMixin, QuerySet):
+    """
+    A queryset for models that use ``TranslatableMixin``, providing the
+    ``localized()`` method.
+    """
+
+    pass
+
+
+class PageQuerySet(
+    SearchableQuerySetMixin,
+    SpecificQuerySetMixin,
+    TranslatableQuerySetMixin,
+    TreeQuerySet,
+):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # set by PageQuerySet.prefetch_stream_blocks()
+        self._prefetch_stream_block_fields = ()
+        self._prefetch_stream_block_renditions = ()
+        self._stream_blocks_prefetched = False
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._prefetch_stream_block_fields = self._prefetch_stream_block_fields
+        clone._prefetch_stream_block_renditions = self._prefetch_stream_block_renditions
+        return clone
+
+    def _fetch_all(self):
+        super()._fetch_all()
+        if self._prefetch_stream_block_fields and not self._stream_blocks_prefetched:
+            self._do_prefetch_stream_blocks()
+            self._stream_blocks_prefetched = True
+
+    def prefetch_stream_blocks(self, *field_names, renditions=()):
+        """
+        Performance optimisation for listing pages.
+        Converts the blocks in the given StreamFields of all pages in this queryset
+        together when it is evaluated, so that the objects referenced by chooser
+        blocks are fetched with one query per block type across all of the pages,
+        rather than separately for each page. Pages that do not have one of the
+        fields (e.g. in a specific queryset of mixed page types), or where it has
+        been deferred, are skipped.
+
+        If ``renditions`` is given as a list of filter specs, the renditions for
+        those filters are also prefetched for all images found in the blocks.
+        """
+        clone = self._clone()
+        clone._prefetch_stream_block_fields = (
+            clone._prefetch_stream_block_fields + field_names
+        )
+        clone._prefetch_stream_block_renditions = (
+            clone._prefetch_stream_block_renditions + tuple(renditions)
+        )
+        return clone
+
+    def _do_prefetch_stream_blocks(self):
+        from wagtail.blocks import StreamValue
+
+        stream_values = []
+        for page in self._result_cache:
+            if not isinstance(page, Model):
+                # e.g. results of values() or values_list()
+                return
+            deferred_fields = page.get_deferred_fields()
+            for field_name in self._prefetch_stream_block_fields:
+                if field_name in deferred_fields:
+                    continue
+                value = getattr(page, field_name, None)
+                if isinstance(value, StreamValue):
+                    stream_values.append(value)
+
+        StreamValue.bulk_prefetch_blocks(stream_values)
+
+        if self._prefetch_stream_block_renditions and apps.is_installed(
+            "wagtail.images"
+        ):
+            from wagtail.images.models import (
+                AbstractImage,
+                prefetch_renditions_for_images,
+            )
+
+            images = [
+                value
+                for value in _iter_block_values(stream_values)
+                if isinstance(value, AbstractImage)
+            ]
+            prefetch_renditions_for_images(
+                images, *self._prefetch_stream_block_renditions
+            )
+
     def live_q(self):
         return Q(live=True)
 
@@ -559,6 +688,18 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
             return clone
         return clone.defer(*streamfield_names)
 
+    def _get_translations_queryset(self):
+        # Find the translations in the same form as the results: specific (or
+        # deferred specific) pages, and with StreamFields deferred if they are
+        queryset = super()._get_translations_queryset()
+        if self._defer_streamfields:
+            queryset = queryset.defer_streamfields()
+        if self.is_specific:
+            queryset = queryset.specific(
+                defer=self._iterable_class is DeferredSpecificIterable
+            )
+        return queryset
+
     def in_site(self, site):
         """
         This filters the QuerySet to only contain pages within the specified site.
@@ -658,6 +799,24 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
         )
 
 
+def _iter_block_values(values):
+    """
+    Recursively yield the native values of all blocks within the given list of block
+    values, descending into StreamValues, StructValues and ListValues.
+    """
+    from wagtail.blocks import StreamValue, StructValue
+    from wagtail.blocks.list_block import ListValue
+
+    for value in values:
+        yield value
+        if isinstance(value, StreamValue):
+            yield from _iter_block_values(child.value for child in value)
+        elif isinstance(value, StructValue):
+            yield from _iter_block_values(value.values())
+        elif isinstance(value, ListValue):
+            yield from _iter_block_values(value)
+
+
 class SpecificIterable(ModelIterable):
     def __iter__(self):
         """
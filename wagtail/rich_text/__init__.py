@@ -1,12 +1,15 @@
 import re
+from contextlib import contextmanager
 from functools import lru_cache
 from html import unescape
 
+from asgiref.local import Local
 from django.core.validators import MaxLengthValidator
 from django.db.models import Model
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 
 from wagtail.rich_text.feature_registry import FeatureRegistry
 from wagtail.rich_text.rewriters import EmbedRewriter, LinkRewriter, MultiRuleRewriter
@@ -49,6 +52,64 @@ def get_rewriter():
     )
 
 
+# Model instances looked up by entity handlers while rendering rich text, so that entities
+# referenced repeatedly (such as a page linked from several rich text fields) are only
+# fetched once. The cache is enabled for the duration of each request (see
+# wagtail.signal_handlers) and within the entity_cache() context manager, and is
+# cleared whenever an instance of one of their models is saved or deleted.
+_entity_cache = Local()
+
+
+def enable_entity_cache():
+    _entity_cache.value = {}
+
+
+def clear_entity_cache():
+    """
+    Discard the instances cached so far, if the entity cache is enabled.
+    """
+    if getattr(_entity_cache, "value", None) is not None:
+        _entity_cache.value = {}
+
+
+def disable_entity_cache():
+    try:
+        del _entity_cache.value
+    except AttributeError:
+        pass
+
+
+@contextmanager
+def entity_cache():
+    """
+    Context manager that caches the model instances resolved by entity handlers within
+    the block, for use outside of a request (e.g. when rendering many pages in a
+    management command).
+    """
+    if getattr(_entity_cache, "value", None) is not None:
+        # Already enabled by an outer request or context
+        yield
+        return
+
+    enable_entity_cache()
+    try:
+        yield
+    finally:
+        disable_entity_cache()
+
+
+def get_entity_cache(key):
+    """
+    Return the dict used to cache instances for the given key, or None if the entity
+    cache is not currently enabled. The active language forms part of the key, as
+    handlers may resolve entities differently for each language.
+    """
+    cache = getattr(_entity_cache, "value", None)
+    if cache is None:
+        return None
+    return cache.setdefault((key, get_language()), {})
+
+
 def expand_db_html(html):
     """
     Expand database-representation HTML into proper HTML usable on front-end templates
@@ -132,12 +193,31 @@ class EntityHandler:
 
     @classmethod
     def get_many(cls, attrs_list: list[dict]) -> list[Model]:
-        model = cls.get_model()
         instance_ids = [attrs.get("id") for attrs in attrs_list]
-        instances_by_id = model._default_manager.in_bulk(instance_ids)
-        instances_by_str_id = {str(k): v for k, v in instances_by_id.items()}
+        cache = get_entity_cache(cls)
+        if cache is None:
+            instances_by_str_id = cls.fetch_many(instance_ids)
+        else:
+            missing_ids = {
+                str(id_): id_ for id_ in instance_ids if str(id_) not in cache
+            }
+            if missing_ids:
+                instances = cls.fetch_many(list(missing_ids.values()))
+                for str_id in missing_ids:
+                    cache[str_id] = instances.get(str_id)
+            instances_by_str_id = cache
         return [instances_by_str_id.get(str(id_)) for id_ in instance_ids]
 
+    @classmethod
+    def fetch_many(cls, instance_ids: list) -> dict[str, Model]:
+        """
+        Fetch the instances with the given ids from the database, returning a dict
+        keyed by the string representation of each id.
+        """
+        model = cls.get_model()
+        instances_by_id = model._default_manager.in_bulk(instance_ids)
+        return {str(k): v for k, v in instances_by_id.items()}
+
     @staticmethod
     def expand_db_attributes(attrs: dict) -> str:
         """
@@ -2,7 +2,8 @@ from django.db.models import Model
 from django.utils.html import escape
 
 from wagtail.models import Page
-from wagtail.rich_text import LinkHandler
+from wagtail.models.i18n import get_localized_many
+from wagtail.rich_text import LinkHandler, get_entity_cache
 
 
 class PageLinkHandler(LinkHandler):
@@ -13,13 +14,23 @@ class PageLinkHandler(LinkHandler):
         return Page
 
     @classmethod
-    def get_many(cls, attrs_list: list[dict]) -> list[Model]:
-        # Override LinkHandler.get_many to reduce database queries through the
+    def fetch_many(cls, instance_ids: list) -> dict[str, Model]:
+        # Override LinkHandler.fetch_many to reduce database queries through the
         # use of PageQuerySet.specific() instead of QuerySet.in_bulk().
-        instance_ids = [attrs.get("id") for attrs in attrs_list]
         qs = Page.objects.filter(id__in=instance_ids).defer_streamfields().specific()
-        pages_by_str_id = {str(page.id): page for page in qs}
-        return [pages_by_str_id.get(str(id_)) for id_ in instance_ids]
+        return {str(page.id): page for page in qs}
+
+    @classmethod
+    def get_localized_many(cls, pages: list[Page]) -> list[Page]:
+        """
+        Equivalent to ``[page.localized for page in pages]``, but finds the live
+        translations of all the pages in the active locale with a single query.
+        """
+        return get_localized_many(
+            pages,
+            queryset=Page.objects.defer_streamfields().specific(),
+            cache=get_entity_cache("localized_pages"),
+        )
 
     @classmethod
     def expand_db_attributes(cls, attrs: dict) -> str:
@@ -28,8 +39,8 @@ class PageLinkHandler(LinkHandler):
     @classmethod
     def expand_db_attributes_many(cls, attrs_list: list[dict]) -> list[str]:
         return [
-            '<a href="%s">' % escape(page.localized.url) if page else "<a>"
-            for page in cls.get_many(attrs_list)
+            '<a href="%s">' % escape(page.url) if page else "<a>"
+            for page in cls.get_localized_many(cls.get_many(attrs_list))
         ]
 
     @classmethod
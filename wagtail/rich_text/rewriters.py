@@ -49,6 +49,31 @@ class TagMatch:
         return self.match.end()
 
 
+def replace_tag_matches(html: str, matches: list[TagMatch]) -> str:
+    """
+    Return a copy of the HTML string with each of the given TagMatch objects replaced by
+    its `replacement` string. The output is assembled from a list of chunks in a single
+    pass, so the cost stays linear in the length of the string however many tags are
+    replaced.
+    """
+    chunks = []
+    position = 0
+    # Replace the tags in order of appearance in the string
+    for match in sorted(matches, key=lambda match: match.start):
+        if match.start < position:
+            # Overlaps a tag that has already been replaced
+            continue
+        chunks.append(html[position : match.start])
+        chunks.append(match.replacement)
+        position = match.end
+
+    if not chunks:
+        return html
+
+    chunks.append(html[position:])
+    return "".join(chunks)
+
+
 class TagRewriter:
     def __init__(self, rules=None, bulk_rules=None, reference_extractors=None):
         self.rules = rules or {}
@@ -71,6 +96,12 @@ class TagRewriter:
         raise NotImplementedError
 
     def __call__(self, html: str) -> str:
+        return replace_tag_matches(html, self.get_replacement_matches(html))
+
+    def get_replacement_matches(self, html: str) -> list[TagMatch]:
+        """Return the TagMatch objects for all tags in the HTML that are to be replaced,
+        with their `replacement` attribute filled in.
+        """
         matches_by_tag_type = self.extract_tags(html)
         matches_to_replace = []
 
@@ -86,20 +117,7 @@ class TagRewriter:
                 match.replacement = replacement
                 matches_to_replace.append(match)
 
-        # Replace the tags in order of appearance in the string, so that offsets remain valid
-        matches_to_replace.sort(key=lambda match: match.start)
-
-        offset = 0
-        for match in matches_to_replace:
-            html = (
-                html[: match.start + offset]
-                + match.replacement
-                + html[match.end + offset :]
-            )
-
-            offset += len(match.replacement) - match.end + match.start
-
-        return html
+        return matches_to_replace
 
     def extract_tags(self, html: str) -> dict[str, list[TagMatch]]:
         """Helper method to extract and group HTML tags and their attributes.
@@ -233,6 +251,18 @@ class MultiRuleRewriter:
         self.rewriters = rewriters
 
     def __call__(self, html):
+        if all(
+            type(rewriter).__call__ is TagRewriter.__call__
+            for rewriter in self.rewriters
+        ):
+            # The tags matched by each TagRewriter can be found in the original string,
+            # so collect the replacements from all of them and rewrite the HTML in a
+            # single pass. Rewriters that override __call__ are applied in turn instead.
+            matches = []
+            for rewriter in self.rewriters:
+                matches.extend(rewriter.get_replacement_matches(html))
+            return replace_tag_matches(html, matches)
+
         for rewrite in self.rewriters:
             html = rewrite(html)
         return html
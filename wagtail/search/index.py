@@ -1,5 +1,6 @@
 import inspect
 import logging
+from collections import defaultdict
 
 from django.apps import apps
 from django.core import checks
@@ -189,6 +190,53 @@ def insert_or_update_object(instance):
                     raise
 
 
+def insert_or_update_objects(objects):
+    """
+    Insert or update a batch of objects in the search index. This is equivalent to
+    calling ``insert_or_update_object`` on each object, but checks which objects are
+    indexable with one query per model, and sends each model's objects to the
+    backends in a single ``add_bulk`` call.
+    """
+    indexed_instances_by_model = defaultdict(list)
+    for obj in objects:
+        indexed_instance = obj.get_indexed_instance()
+        if indexed_instance is not None:
+            indexed_instances_by_model[type(indexed_instance)].append(indexed_instance)
+
+    for model, indexed_instances in indexed_instances_by_model.items():
+        # Make sure that the instances are in their class's indexed objects
+        indexed_pks = set(
+            model.get_indexed_objects()
+            .filter(pk__in=[obj.pk for obj in indexed_instances])
+            .values_list("pk", flat=True)
+        )
+        indexed_instances = [obj for obj in indexed_instances if obj.pk in indexed_pks]
+        if not indexed_instances:
+            continue
+
+        for backend_name, backend in get_search_backends_with_name(
+            with_auto_update=True
+        ):
+            try:
+                if len(indexed_instances) == 1:
+                    backend.add(indexed_instances[0])
+                else:
+                    backend.add_bulk(model, indexed_instances)
+            except Exception:
+                # Log all errors
+                logger.exception(
+                    "Exception raised while adding %d %s objects into the '%s' search backend",
+                    len(indexed_instances),
+                    model.__name__,
+                    backend_name,
+                )
+
+                # Only catch the exception if the backend requires this
+                # See the comments in insert_or_update_object for an explanation
+                if not backend.catch_indexing_errors:
+                    raise
+
+
 def remove_object(instance):
     indexed_instance = get_indexed_instance(instance, check_exists=False)
 
@@ -1,11 +1,18 @@
 import collections
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+from django.apps import apps
 from django.conf import settings
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
 
 from wagtail.search.backends import get_search_backend
 from wagtail.search.index import get_indexed_models
+from wagtail.utils.executors import get_pk_ranges, setup_worker
 
 DEFAULT_CHUNK_SIZE = 1000
 
@@ -53,6 +60,45 @@ def group_models_by_index(backend, models):
     )
 
 
+def get_index_by_name(backend, model, index_name):
+    """
+    Return the index named ``index_name`` that ``model`` is indexed into. This is
+    normally the backend's index for the model, but may be a differently-named index
+    when the backend rebuilds indexes atomically (such as Elasticsearch with
+    ``ATOMIC_REBUILD``).
+    """
+    index = backend.get_index_for_model(model)
+    if index.name != index_name:
+        index = type(index)(backend, index_name)
+    return index
+
+
+def index_pk_range(backend_name, index_name, model_label, first_pk, last_pk):
+    """
+    Add the indexed objects of the given model with primary keys between
+    ``first_pk`` and ``last_pk`` (inclusive) to the index. This runs in a worker
+    process, so only receives picklable arguments. Returns the number of objects
+    indexed.
+    """
+    model = apps.get_model(model_label)
+    backend = get_search_backend(backend_name)
+    index = get_index_by_name(backend, model, index_name)
+
+    items = list(
+        model.get_indexed_objects()
+        .filter(pk__gte=first_pk, pk__lte=last_pk)
+        .order_by("pk")
+    )
+    index.add_items(model, items)
+    return len(items)
+
+
+def rebuilder_uses_transaction(rebuilder):
+    # The atomic rebuilders of the database backends perform the whole rebuild in
+    # one transaction, which can't be shared with other processes or resumed
+    return isinstance(getattr(rebuilder, "transaction", None), transaction.Atomic)
+
+
 class Command(BaseCommand):
     def write(self, *args, **kwargs):
         """Helper function that respects verbosity when printing."""
@@ -60,7 +106,12 @@ class Command(BaseCommand):
             self.stdout.write(*args, **kwargs)
 
     def update_backend(
-        self, backend_name, schema_only=False, chunk_size=DEFAULT_CHUNK_SIZE
+        self,
+        backend_name,
+        schema_only=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        workers=1,
+        resume=False,
     ):
         self.write("Updating backend: " + backend_name)
 
@@ -76,12 +127,36 @@ class Command(BaseCommand):
         if not models_grouped_by_index:
             self.write(backend_name + ": No indices to rebuild")
 
+        backend_checkpoint = self.checkpoint.setdefault(backend_name, {})
+
         for index, models in models_grouped_by_index:
             self.write(backend_name + ": Rebuilding index %s" % index.name)
 
-            # Start rebuild
             rebuilder = backend.rebuilder_class(index)
-            index = rebuilder.start()
+            uses_transaction = rebuilder_uses_transaction(rebuilder)
+            if workers > 1 and uses_transaction:
+                raise CommandError(
+                    "Backend '%s' rebuilds indexes within a single database transaction, "
+                    "so cannot be updated with multiple workers" % backend_name
+                )
+
+            index_checkpoint = backend_checkpoint.get(index.name)
+            if resume and index_checkpoint and not uses_transaction:
+                # Continue adding objects to the index that was being rebuilt
+                index = get_index_by_name(backend, models[0], index_checkpoint["index"])
+                rebuilder.index = index
+                self.write(
+                    backend_name + ": Resuming rebuild into index %s" % index.name
+                )
+            else:
+                # Start rebuild
+                index_checkpoint = backend_checkpoint[index.name] = {
+                    "index": None,
+                    "models": {},
+                }
+                index = rebuilder.start()
+                index_checkpoint["index"] = index.name
+                self.save_checkpoint()
 
             # Add models
             for model in models:
@@ -98,23 +173,139 @@ class Command(BaseCommand):
                         ending="",
                     )
 
-                    # Add items (chunk_size at a time)
-                    for chunk in self.print_iter_progress(
-                        self.queryset_chunks(
-                            model.get_indexed_objects().order_by("pk"), chunk_size
+                    model_label = model._meta.label_lower
+                    model_checkpoint = index_checkpoint["models"].setdefault(
+                        model_label, {"last_pk": None, "finished": False}
+                    )
+                    start_time = time.monotonic()
+                    model_count = 0
+
+                    if not model_checkpoint["finished"]:
+                        queryset = model.get_indexed_objects()
+                        if model_checkpoint["last_pk"] is not None:
+                            queryset = queryset.filter(
+                                pk__gt=model_checkpoint["last_pk"]
+                            )
+
+                        if workers > 1:
+                            chunks = self.index_chunks_in_workers(
+                                backend_name,
+                                index.name,
+                                model,
+                                queryset,
+                                chunk_size,
+                                workers,
+                            )
+                        else:
+                            chunks = self.index_chunks(
+                                index, model, queryset, chunk_size
+                            )
+
+                        for count, last_pk in self.print_iter_progress(chunks):
+                            model_count += count
+                            model_checkpoint["last_pk"] = last_pk
+                            self.save_checkpoint()
+
+                        model_checkpoint["finished"] = True
+                        self.save_checkpoint()
+
+                    object_count += model_count
+                    self.summary.append(
+                        (
+                            backend_name,
+                            model,
+                            model_count,
+                            time.monotonic() - start_time,
                         )
-                    ):
-                        index.add_items(model, chunk)
-                        object_count += len(chunk)
+                    )
 
                     self.print_newline()
 
             # Finish rebuild
             rebuilder.finish()
+            del backend_checkpoint[index.name]
+            self.save_checkpoint()
 
             self.write(backend_name + ": indexed %d objects" % object_count)
             self.print_newline()
 
+    def index_chunks(self, index, model, queryset, chunk_size):
+        """
+        Add the objects in ``queryset`` to the index, ``chunk_size`` at a time,
+        yielding the number of objects and the last primary key of each chunk
+        once it has been indexed.
+        """
+        for chunk in self.queryset_chunks(queryset.order_by("pk"), chunk_size):
+            index.add_items(model, chunk)
+            yield len(chunk), chunk[-1].pk
+
+    def index_chunks_in_workers(
+        self, backend_name, index_name, model, queryset, chunk_size, workers
+    ):
+        """
+        Equivalent to ``index_chunks``, but splits the objects into ranges of
+        primary keys that are indexed by a pool of worker processes. Chunks are
+        yielded in order, so that a chunk is only reported as done once all the
+        chunks before it are.
+        """
+        with self.get_executor(workers) as executor:
+            futures = [
+                (
+                    executor.submit(
+                        index_pk_range,
+                        backend_name,
+                        index_name,
+                        model._meta.label_lower,
+                        first_pk,
+                        last_pk,
+                    ),
+                    last_pk,
+                )
+                for first_pk, last_pk in get_pk_ranges(queryset, chunk_size)
+            ]
+
+            for future, last_pk in futures:
+                yield future.result(), last_pk
+
+    def get_executor(self, workers):
+        # Close database connections so that they aren't shared with forked workers
+        connections.close_all()
+        return ProcessPoolExecutor(max_workers=workers, initializer=setup_worker)
+
+    def load_checkpoint(self, resume):
+        self.checkpoint = {}
+        if resume and self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                self.checkpoint = json.load(f)
+
+    def save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+
+        # Write to a temporary file first, so that the checkpoint file is never
+        # left half-written if the command is interrupted
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.checkpoint, f, cls=DjangoJSONEncoder)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def print_summary(self):
+        if not self.summary:
+            return
+
+        self.write("Indexing summary:")
+        for backend_name, model, count, duration in self.summary:
+            self.write(
+                "{}: {}.{} {} objects in {:.1f}s ({:.1f} objects/sec)".format(
+                    backend_name,
+                    model._meta.app_label,
+                    model.__name__,
+                    count,
+                    duration,
+                    count / duration if duration else 0,
+                )
+            )
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--backend",
@@ -138,10 +329,44 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            default=1,
+            type=int,
+            help="Number of worker processes to index objects with",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store",
+            dest="checkpoint_path",
+            default=None,
+            help="Record progress in the given file, so that an interrupted rebuild can be continued with --resume",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            dest="resume",
+            default=False,
+            help="Continue the rebuild recorded in the --checkpoint file",
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
 
+        workers = options.get("workers", 1)
+        if workers < 1:
+            raise CommandError("--workers must be at least 1")
+
+        resume = options.get("resume", False)
+        self.checkpoint_path = options.get("checkpoint_path")
+        if resume and not self.checkpoint_path:
+            raise CommandError("--resume requires a --checkpoint file")
+
+        self.load_checkpoint(resume)
+        self.summary = []
+
         # Get list of backends to index
         if options["backend_name"]:
             # index only the passed backend
@@ -159,8 +384,16 @@ class Command(BaseCommand):
                 backend_name,
                 schema_only=options.get("schema_only", False),
                 chunk_size=options.get("chunk_size"),
+                workers=workers,
+                resume=resume,
             )
 
+        self.print_summary()
+
+        # The rebuild has completed, so there is nothing to resume
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
     def print_newline(self):
         self.write("")
 
@@ -187,19 +420,18 @@ class Command(BaseCommand):
 
             self.stdout.flush()
 
-    # Atomic so the count of models doesn't change as it is iterated
-    @transaction.atomic
     def queryset_chunks(self, qs, chunk_size=DEFAULT_CHUNK_SIZE):
         """
-        Yield a queryset in chunks of at most ``chunk_size``. The chunk yielded
-        will be a list, not a queryset. Iterating over the chunks is done in a
-        transaction so that the order and count of items in the queryset
-        remains stable.
+        Yield a queryset, ordered by primary key, in chunks of at most
+        ``chunk_size``. The chunk yielded will be a list, not a queryset. Each
+        chunk is fetched by filtering on the last primary key of the previous
+        chunk, rather than by offset, so that fetching later chunks doesn't get
+        slower as the command progresses.
         """
-        i = 0
-        while True:
-            items = list(qs[i * chunk_size :][:chunk_size])
-            if not items:
-                break
+        qs = qs.order_by("pk")
+        items = list(qs[:chunk_size])
+        while items:
             yield items
-            i += 1
+            if len(items) < chunk_size:
+                break
+            items = list(qs.filter(pk__gt=items[-1].pk)[:chunk_size])
@@ -1,13 +1,20 @@
 from django.db.models.signals import post_delete, post_save
 
+from wagtail.utils.batching import ObjectTaskBatcher
+
 from . import index
-from .tasks import insert_or_update_object_task
+from .tasks import insert_or_update_objects_task
+
+# The maximum number of objects to pass to a single indexing task
+INDEX_UPDATE_BATCH_SIZE = 1000
+
+index_update_batcher = ObjectTaskBatcher(
+    insert_or_update_objects_task, batch_size=INDEX_UPDATE_BATCH_SIZE
+)
 
 
-def post_save_signal_handler(instance, **kwargs):
-    insert_or_update_object_task.enqueue(
-        instance._meta.app_label, instance._meta.model_name, instance.pk
-    )
+def post_save_signal_handler(instance, using=None, **kwargs):
+    index_update_batcher.add(instance, using=using)
 
 
 def post_delete_signal_handler(instance, **kwargs):
@@ -8,3 +8,9 @@ from wagtail.search import index
 def insert_or_update_object_task(app_label, model_name, pk):
     model = apps.get_model(app_label, model_name)
     index.insert_or_update_object(model.objects.get(pk=pk))
+
+
+@task()
+def insert_or_update_objects_task(app_label, model_name, pks):
+    model = apps.get_model(app_label, model_name)
+    index.insert_or_update_objects(model.objects.filter(pk__in=pks))
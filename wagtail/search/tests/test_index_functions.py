@@ -104,6 +104,102 @@ class TestInsertOrUpdateObject(WagtailTestUtils, TestCase):
         self.assertIn("ValueError: Test", cm.output[0])
 
 
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    }
+)
+class TestInsertOrUpdateObjects(WagtailTestUtils, TestCase):
+    def test_inserts_objects(self, backend):
+        books = [
+            models.Book.objects.create(
+                title=f"Test {i}",
+                publication_date=date(2017, 10, 18),
+                number_of_pages=100,
+            )
+            for i in range(3)
+        ]
+        backend().reset_mock()
+
+        index.insert_or_update_objects(books)
+
+        backend().add_bulk.assert_called_once_with(models.Book, books)
+        self.assertFalse(backend().add.mock_calls)
+
+    def test_inserts_single_object(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        backend().reset_mock()
+
+        index.insert_or_update_objects([obj])
+
+        backend().add.assert_called_once_with(obj)
+        self.assertFalse(backend().add_bulk.mock_calls)
+
+    def test_groups_objects_by_specific_class(self, backend):
+        book = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        novels = [
+            models.Novel.objects.create(
+                title=f"Test novel {i}",
+                publication_date=date(2017, 10, 18),
+                number_of_pages=100,
+                setting="Middle-earth",
+            )
+            for i in range(2)
+        ]
+        backend().reset_mock()
+
+        index.insert_or_update_objects(
+            models.Book.objects.filter(pk__in=[book.pk] + [n.pk for n in novels])
+        )
+
+        backend().add.assert_called_once_with(book)
+        backend().add_bulk.assert_called_once_with(models.Novel, novels)
+
+    def test_skips_objects_not_in_indexed_objects(self, backend):
+        books = [
+            models.Novel.objects.create(
+                title=title,
+                publication_date=date(2017, 10, 18),
+                number_of_pages=100,
+                setting="Middle-earth",
+            )
+            for title in ["Index me", "Don't index me!", "Index me too"]
+        ]
+        backend().reset_mock()
+
+        index.insert_or_update_objects(books)
+
+        backend().add_bulk.assert_called_once_with(models.Novel, [books[0], books[2]])
+
+    def test_catches_index_error(self, backend):
+        books = [
+            models.Book.objects.create(
+                title=f"Test {i}",
+                publication_date=date(2017, 10, 18),
+                number_of_pages=100,
+            )
+            for i in range(2)
+        ]
+
+        backend().add_bulk.side_effect = ValueError("Test")
+        backend().reset_mock()
+
+        with self.assertLogs("wagtail.search.index", level="ERROR") as cm:
+            index.insert_or_update_objects(books)
+
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn(
+            "Exception raised while adding 2 Book objects into the 'default' search backend",
+            cm.output[0],
+        )
+        self.assertIn("ValueError: Test", cm.output[0])
+
+
 @mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
 @override_settings(
     WAGTAILSEARCH_BACKENDS={
@@ -190,6 +286,23 @@ class TestSignalHandlers(WagtailTestUtils, TestCase):
             obj.delete()
         backend().delete.assert_called_with(obj)
 
+    def test_index_updates_batched_per_transaction(self, backend):
+        backend().reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            books = [
+                models.Book.objects.create(
+                    title=f"Test {i}",
+                    publication_date=date(2017, 10, 18),
+                    number_of_pages=100,
+                )
+                for i in range(3)
+            ]
+            # saving an object again should not index it twice
+            books[0].save()
+
+        self.assertFalse(backend().add.mock_calls)
+        backend().add_bulk.assert_called_once_with(models.Book, books)
+
     def test_do_not_index_fields_omitted_from_update_fields(self, backend):
         obj = models.Book.objects.create(
             title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core import management
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from wagtail.search.management.commands.update_index import Command
+from wagtail.test.search import models
+from wagtail.utils.executors import InlineExecutor
+
+
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    }
+)
+class TestUpdateIndexCommand(TestCase):
+    fixtures = ["search"]
+
+    def setUp(self):
+        self.checkpoint_path = os.path.join(tempfile.mkdtemp(), "checkpoint.json")
+        self.addCleanup(self.remove_checkpoint)
+
+    def remove_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def setup_backend(self, backend):
+        backend.reset_mock()
+        index = backend().get_index_for_model.return_value
+        index.name = "test_index"
+        backend().rebuilder_class.return_value.start.return_value = index
+        return index
+
+    def get_indexed_authors(self, index):
+        return [
+            [author.pk for author in call.args[1]]
+            for call in index.add_items.call_args_list
+            if call.args[0] is models.Author
+        ]
+
+    def call_command(self, **kwargs):
+        stdout = StringIO()
+        management.call_command("update_index", stdout=stdout, **kwargs)
+        return stdout.getvalue()
+
+    def test_indexes_in_chunks(self, backend):
+        index = self.setup_backend(backend)
+        author_pks = list(
+            models.Author.objects.order_by("pk").values_list("pk", flat=True)
+        )
+
+        output = self.call_command(chunk_size=2)
+
+        self.assertEqual(
+            self.get_indexed_authors(index),
+            [author_pks[i : i + 2] for i in range(0, len(author_pks), 2)],
+        )
+        self.assertIn("Indexing summary:", output)
+        self.assertIn(
+            "default: searchtests.Author %d objects in" % len(author_pks), output
+        )
+
+    # Worker processes can't see data created in a test transaction
+    @mock.patch.object(Command, "get_executor", lambda self, workers: InlineExecutor())
+    def test_indexes_with_workers(self, backend):
+        index = self.setup_backend(backend)
+        author_pks = list(
+            models.Author.objects.order_by("pk").values_list("pk", flat=True)
+        )
+
+        self.call_command(chunk_size=2, workers=2)
+
+        self.assertEqual(
+            self.get_indexed_authors(index),
+            [author_pks[i : i + 2] for i in range(0, len(author_pks), 2)],
+        )
+
+    def test_cannot_use_workers_with_transactional_rebuilder(self, backend):
+        self.setup_backend(backend)
+        backend().rebuilder_class.return_value.transaction = transaction.atomic()
+
+        with self.assertRaisesMessage(
+            CommandError, "cannot be updated with multiple workers"
+        ):
+            self.call_command(workers=2)
+
+    def test_resume_requires_checkpoint(self, backend):
+        self.setup_backend(backend)
+
+        with self.assertRaisesMessage(CommandError, "--resume requires a --checkpoint"):
+            self.call_command(resume=True)
+
+    def test_resume_from_checkpoint(self, backend):
+        index = self.setup_backend(backend)
+        author_pks = list(
+            models.Author.objects.order_by("pk").values_list("pk", flat=True)
+        )
+
+        # Fail while indexing the second chunk of authors
+        def add_items(model, items):
+            if model is models.Author and items[0].pk == author_pks[2]:
+                raise ValueError("Interrupted")
+
+        index.add_items.side_effect = add_items
+        with self.assertRaisesMessage(ValueError, "Interrupted"):
+            self.call_command(chunk_size=2, checkpoint_path=self.checkpoint_path)
+
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        self.assertEqual(
+            checkpoint["default"]["test_index"]["models"]["searchtests.author"],
+            {"last_pk": author_pks[1], "finished": False},
+        )
+
+        # Resuming should continue from the failed chunk, without restarting the rebuild
+        index.add_items.reset_mock()
+        index.add_items.side_effect = None
+        rebuilder = backend().rebuilder_class.return_value
+        rebuilder.start.reset_mock()
+
+        self.call_command(
+            chunk_size=2, checkpoint_path=self.checkpoint_path, resume=True
+        )
+
+        rebuilder.start.assert_not_called()
+        rebuilder.finish.assert_called_once()
+        self.assertEqual(
+            self.get_indexed_authors(index),
+            [author_pks[i : i + 2] for i in range(2, len(author_pks), 2)],
+        )
+        self.assertFalse(os.path.exists(self.checkpoint_path))
@@ -2,7 +2,9 @@ import logging
 from contextlib import contextmanager
 
 from asgiref.local import Local
+from django.apps import apps
 from django.core.cache import cache
+from django.core.signals import request_finished, request_started
 from django.db import transaction
 from django.db.models.signals import (
     post_delete,
@@ -13,19 +15,30 @@ from django.db.models.signals import (
 )
 
 from wagtail.models import Locale, Page, ReferenceIndex, Site
+from wagtail.models.i18n import locale_registry
+from wagtail.models.sites import site_lookup_table
+from wagtail.rich_text import (
+    clear_entity_cache,
+    disable_entity_cache,
+    enable_entity_cache,
+)
+from wagtail.utils.batching import ObjectTaskBatcher
 
-from .tasks import update_reference_index_task
+from .tasks import update_reference_index_for_objects_task
 
 logger = logging.getLogger("wagtail")
 
 
-# Clear the wagtail_site_root_paths from the cache whenever Site records are updated.
+# Clear the wagtail_site_root_paths and site lookup table from the cache whenever
+# Site records are updated.
 def post_save_site_signal_handler(instance, update_fields=None, **kwargs):
     Site.clear_site_root_paths_cache()
+    site_lookup_table.clear_on_commit()
 
 
 def post_delete_site_signal_handler(instance, **kwargs):
     Site.clear_site_root_paths_cache()
+    site_lookup_table.clear_on_commit()
 
 
 def pre_delete_page_unpublish(sender, instance, **kwargs):
@@ -43,8 +56,20 @@ def reset_locales_display_names_cache(sender, instance, **kwargs):
     cache.delete("wagtail_locales_display_name")
 
 
+def clear_locale_registry(sender, instance, **kwargs):
+    locale_registry.clear_on_commit()
+
+
 reference_index_auto_update_disabled = Local()
 
+# The maximum number of objects to pass to a single reference index update task
+REFERENCE_INDEX_UPDATE_BATCH_SIZE = 1000
+
+reference_index_update_batcher = ObjectTaskBatcher(
+    update_reference_index_for_objects_task,
+    batch_size=REFERENCE_INDEX_UPDATE_BATCH_SIZE,
+)
+
 
 @contextmanager
 def disable_reference_index_auto_update():
@@ -63,7 +88,7 @@ def disable_reference_index_auto_update():
         del reference_index_auto_update_disabled.value
 
 
-def update_reference_index_on_save(instance, **kwargs):
+def update_reference_index_on_save(instance, using=None, **kwargs):
     # Don't populate reference index while loading fixtures as referenced objects may not be populated yet
     if kwargs.get("raw", False):
         return
@@ -71,9 +96,9 @@ def update_reference_index_on_save(instance, **kwargs):
     if getattr(reference_index_auto_update_disabled, "value", False):
         return
 
-    update_reference_index_task.enqueue(
-        instance._meta.app_label, instance._meta.model_name, instance.pk
-    )
+    # All objects saved within the current transaction are indexed together
+    # once it is committed
+    reference_index_update_batcher.add(instance, using=using)
 
 
 def remove_reference_index_on_delete(instance, **kwargs):
@@ -104,6 +129,32 @@ def disconnect_reference_index_signal_handlers(**kwargs):
         disconnect_reference_index_signal_handlers_for_model(model)
 
 
+# Cache the entities resolved when rendering rich text for the duration of each request
+def request_started_enable_entity_cache(**kwargs):
+    enable_entity_cache()
+
+
+def request_finished_disable_entity_cache(**kwargs):
+    disable_entity_cache()
+
+
+# Discard the cached entities whenever an object is saved or deleted during the request,
+# so that it isn't rendered stale (or as missing, if it has just been created)
+def clear_entity_cache_on_change(**kwargs):
+    clear_entity_cache()
+
+
+def connect_entity_cache_signal_handlers(model):
+    """
+    Clear the rich text entity cache whenever an instance of ``model``, or of one of
+    its subclasses, is saved or deleted.
+    """
+    for sender in apps.get_models():
+        if issubclass(sender, model):
+            post_save.connect(clear_entity_cache_on_change, sender=sender)
+            post_delete.connect(clear_entity_cache_on_change, sender=sender)
+
+
 def register_signal_handlers():
     post_save.connect(post_save_site_signal_handler, sender=Site)
     post_delete.connect(post_delete_site_signal_handler, sender=Site)
@@ -113,6 +164,12 @@ def register_signal_handlers():
 
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
+    post_save.connect(clear_locale_registry, sender=Locale)
+    post_delete.connect(clear_locale_registry, sender=Locale)
+
+    request_started.connect(request_started_enable_entity_cache)
+    request_finished.connect(request_finished_disable_entity_cache)
+    connect_entity_cache_signal_handlers(Page)
 
     # Disconnect reference index signals while migrations are running
     # (we don't want to log references in migrations as the ReferenceIndex model might not exist)
@@ -33,6 +33,41 @@ def update_reference_index_task(app_label, model_name, pk):
             ReferenceIndex.create_or_update_for_object(instance)
 
 
+@task()
+def update_reference_index_for_objects_task(app_label, model_name, pks):
+    """
+    Update the reference index for the objects of the given model with the given
+    primary keys, batching together the objects of each indexed model.
+    """
+    model = apps.get_model(app_label, model_name)
+    instances = list(model.objects.filter(pk__in=pks))
+
+    # If the model is a child model, find the parent instances and index those instead
+    while instances:
+        parental_keys = list(
+            filter(
+                lambda field: isinstance(field, ParentalKey),
+                model._meta.get_fields(),
+            )
+        )
+        if not parental_keys:
+            break
+
+        # Instances whose parent is null have no valid object to record references against
+        parental_key = parental_keys[0]
+        parent_pks = {
+            getattr(instance, parental_key.attname)
+            for instance in instances
+            if getattr(instance, parental_key.attname) is not None
+        }
+        model = parental_key.related_model
+        instances = list(model.objects.filter(pk__in=parent_pks))
+
+    if instances and ReferenceIndex.is_indexed(model):
+        with transaction.atomic():
+            ReferenceIndex.create_or_update_for_objects(instances)
+
+
 @task()
 def delete_file_from_storage_task(deconstructed_storage, path):
     storage_module, storage_args, storage_kwargs = deconstructed_storage
@@ -3,6 +3,7 @@ from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
 
 from wagtail.models import Orderable, Page, TranslatableMixin
+from wagtail.query import TranslatableQuerySet
 
 
 class TestPage(Page):
@@ -12,6 +13,8 @@ class TestPage(Page):
 class TestModel(TranslatableMixin):
     title = models.CharField(max_length=255)
 
+    objects = TranslatableQuerySet.as_manager()
+
 
 class InheritedTestModel(TestModel):
     class Meta:
@@ -35,6 +35,7 @@ urlpatterns = [
     path("images/", include(wagtailimages_urls)),
     path("api/main/", api_router.urls),
     path("sitemap.xml", sitemaps_views.sitemap),
+    path("streaming-sitemap.xml", sitemaps_views.streaming_sitemap),
     path(
         "sitemap-index.xml",
         sitemaps_views.index,
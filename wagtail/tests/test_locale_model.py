@@ -1,9 +1,11 @@
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.models import Locale, Page
+from wagtail.models.i18n import LOCALE_REGISTRY_VERSION_CACHE_KEY
 from wagtail.test.i18n.models import TestPage
 
 
@@ -166,3 +168,58 @@ class TestLocaleModel(TestCase):
         self.assertEqual(Page.get_first_root_node().locale.language_code, "en")
         Locale.objects.get(language_code="en").delete()
         self.assertEqual(Page.get_first_root_node().locale.language_code, "fr")
+
+
+@override_settings(
+    WAGTAIL_LOCALE_REGISTRY=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestLocaleModelWithRegistry(TestLocaleModel):
+    # This inherits from TestLocaleModel so contains all the same test cases
+
+    def setUp(self):
+        super().setUp()
+        # The registry is normally kept in sync by the Locale signal handlers,
+        # but these are bypassed when the database is rolled back between tests
+        Locale.clear_locale_registry()
+
+    def test_no_queries_once_built(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(Locale.get_active().language_code, "en")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Locale.get_default().language_code, "en")
+            with translation.override("fr"):
+                self.assertEqual(Locale.get_active().language_code, "fr")
+
+    def test_locale_instances_are_not_shared(self):
+        locale_1 = Locale.get_default()
+        locale_2 = Locale.get_default()
+        self.assertEqual(locale_1, locale_2)
+        self.assertIsNot(locale_1, locale_2)
+
+    def test_unknown_language(self):
+        Locale.objects.filter(language_code="fr").delete()
+
+        with self.assertRaises(Locale.DoesNotExist):
+            Locale.objects.get_for_language("fr")
+
+    def test_invalidated_on_delete(self):
+        self.assertEqual(Locale.objects.get_for_language("fr").language_code, "fr")
+
+        Locale.objects.get(language_code="fr").delete()
+
+        with translation.override("fr"):
+            # Falls back on the default locale
+            self.assertEqual(Locale.get_active().language_code, "en")
+
+    def test_invalidated_by_version_key(self):
+        self.assertEqual(Locale.objects.get_for_language("fr").language_code, "fr")
+
+        # Simulate another process changing the locale and clearing the version key,
+        # without the signal handlers running in this process
+        Locale.objects.filter(language_code="fr").update(language_code="fr-ca")
+        cache.delete(LOCALE_REGISTRY_VERSION_CACHE_KEY)
+
+        with self.assertRaises(Locale.DoesNotExist):
+            Locale.objects.get_for_language("fr")
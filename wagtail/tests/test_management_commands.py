@@ -28,6 +28,7 @@ from wagtail.test.testapp.models import (
     PurgeRevisionsProtectedTestModel,
     SecretPage,
     SimplePage,
+    StreamPage,
 )
 from wagtail.test.utils import WagtailTestUtils
 
@@ -736,6 +737,51 @@ class TestPurgeRevisionsCommandForPages(TestCase):
         # Any other revisions are deleted
         self.assertRevisionNotExists(revision_purged)
 
+    def test_live_revision_not_purged(self):
+        live_revision = self.object.save_revision()
+        live_revision.publish()
+        old_revision = self.object.save_revision()
+        self.object.save_revision()
+
+        self.run_command()
+
+        # the live revision is kept even though it is not the latest
+        self.assertRevisionExists(live_revision)
+        self.assertRevisionNotExists(old_revision)
+
+    def test_purge_revisions_in_batches(self):
+        revisions = [self.object.save_revision() for i in range(4)]
+
+        self.run_command(batch_size=1)
+
+        for revision in revisions[:3]:
+            self.assertRevisionNotExists(revision)
+        self.assertRevisionExists(revisions[3])
+
+    def test_dry_run(self):
+        revisions = [self.object.save_revision() for i in range(3)]
+        PurgeRevisionsProtectedTestModel.objects.create(revision=revisions[0])
+        label = type(self.object)._meta.label
+
+        output = StringIO()
+        management.call_command(
+            "purge_revisions",
+            **{**self.base_options, "dry_run": True},
+            stdout=output,
+        )
+
+        for revision in revisions:
+            self.assertRevisionExists(revision)
+
+        self.run_command()
+        if Revision.objects.filter(id=revisions[1].id).exists():
+            self.assertNotIn(label, output.getvalue())
+            self.assertIn("0 revisions would be deleted", output.getvalue())
+        else:
+            self.assertIn(f"{label}: 1\n", output.getvalue())
+            self.assertIn("1 revisions would be deleted", output.getvalue())
+            self.assertIn("1 revisions would be ignored", output.getvalue())
+
 
 class TestPurgeRevisionsCommandForSnippets(TestPurgeRevisionsCommandForPages):
     def get_object(self):
@@ -772,6 +818,42 @@ class TestPurgeRevisionsCommandForSnippetsWithPagesOnly(
         return self.assertRevisionExists(revision)
 
 
+@override_settings(WAGTAIL_REVISION_SNAPSHOT_INTERVAL=3)
+class TestPurgeRevisionsCommandWithDeltaRevisions(TestCase):
+    def setUp(self):
+        self.page = StreamPage(
+            title="Stream page",
+            slug="stream-page",
+            body=[("text", "Paragraph %d " % i + "x" * 100) for i in range(10)],
+        )
+        Page.objects.get(id=2).add_child(instance=self.page)
+
+    def test_purge_delta_revisions(self):
+        revisions = []
+        for i in range(5):
+            self.page.body[i] = ("text", "Edited paragraph %d" % i)
+            revisions.append(self.page.save_revision())
+        self.assertEqual(
+            [revision.base_revision_id for revision in revisions],
+            [None, revisions[0].pk, revisions[0].pk, None, revisions[3].pk],
+        )
+        PurgeRevisionsProtectedTestModel.objects.create(revision=revisions[0])
+
+        management.call_command("purge_revisions", stdout=StringIO())
+
+        self.assertEqual(
+            list(
+                Revision.objects.filter(object_id=str(self.page.pk))
+                .order_by("created_at", "id")
+                .values_list("pk", "base_revision_id")
+            ),
+            [(revisions[0].pk, None), (revisions[4].pk, None)],
+        )
+        page = Revision.objects.get(pk=revisions[4].pk).as_object()
+        self.assertEqual(page.body[4].value, "Edited paragraph 4")
+        self.assertEqual(page.body[5].value, "Paragraph 5 " + "x" * 100)
+
+
 class TestPurgeEmbedsCommand(TestCase):
     fixtures = ["test.json"]
 
@@ -901,6 +901,43 @@ class TestServeView(TestCase):
         self.assertContains(response, "bad googlebot no cookie")
 
 
+@override_settings(WAGTAIL_SINGLE_QUERY_ROUTING=True)
+class TestServeViewWithSingleQueryRouting(TestServeView):
+    # This inherits from TestServeView so contains all the same test cases
+
+    def test_route_for_request_query_count(self):
+        site = Site.objects.get(is_default_site=True)
+        request = get_dummy_request(path="/secret-plans/steal-underpants/", site=site)
+        # expect queries for site, the pages along the path, and the
+        # specific form of the matched page
+        with self.assertNumQueries(3):
+            page, args, kwargs = Page.route_for_request(request, request.path)
+
+        self.assertEqual(
+            page, EventPage.objects.get(url_path="/home/secret-plans/steal-underpants/")
+        )
+        self.assertIsInstance(page, EventPage)
+
+        # the parent page should be cached on the result
+        with self.assertNumQueries(0):
+            parent = page.get_parent(update=False)
+        self.assertEqual(parent.url_path, "/home/secret-plans/")
+
+    def test_route_for_request_with_custom_route_method(self):
+        # EventIndex overrides route(), so routing should be handed over to it
+        site = Site.objects.get(is_default_site=True)
+        request = get_dummy_request(path="/events/2/", site=site)
+        request.user = AnonymousUser()
+        response = Page.route_for_request(request, request.path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data["events"].number, 1)
+
+    def test_route_for_request_with_unknown_intermediate_page(self):
+        site = Site.objects.get(is_default_site=True)
+        request = get_dummy_request(path="/no-such-page/steal-underpants/", site=site)
+        self.assertIsNone(Page.route_for_request(request, request.path))
+
+
 class TestMovePage(TestCase):
     fixtures = ["test.json"]
 
@@ -179,6 +179,49 @@ class TestPagePermissionPolicy(PermissionPolicyTestCase):
         with self.assertNumQueries(0):
             self._test_get_all_permissions_for_user()
 
+    def test_get_permission_tree_for_user(self):
+        tree = self.policy.get_permission_tree_for_user(self.report_editor)
+        self.assertEqual(tree.permissions_for(self.root_page), set())
+        self.assertEqual(tree.permissions_for(self.editor_page), set())
+        self.assertEqual(tree.permissions_for(self.reports_page), {"change"})
+        self.assertEqual(tree.permissions_for(self.editor_report), {"change"})
+
+        tree = self.policy.get_permission_tree_for_user(self.root_editor)
+        self.assertEqual(tree.permissions_for(Page.get_first_root_node()), set())
+        self.assertEqual(tree.permissions_for(self.root_page), {"change"})
+        self.assertEqual(tree.permissions_for(self.editor_report), {"change"})
+
+        # The tree is cached on the user
+        with self.assertNumQueries(0):
+            self.assertIs(
+                self.policy.get_permission_tree_for_user(self.root_editor), tree
+            )
+
+    def test_get_permission_tree_for_user_in_multiple_groups(self):
+        self.report_editor.groups.add(Group.objects.get(name="Report adders"))
+        tree = self.policy.get_permission_tree_for_user(self.report_editor)
+        self.assertEqual(tree.permissions_for(self.editor_page), set())
+        self.assertEqual(tree.permissions_for(self.reports_page), {"add", "change"})
+        self.assertEqual(tree.permissions_for(self.adder_report), {"add", "change"})
+
+    def test_testers_for_pages(self):
+        pages = [self.root_page, self.reports_page, self.editor_report]
+        # Compiling the permissions takes a single query
+        with self.assertNumQueries(1):
+            testers = self.policy.testers_for_pages(self.report_editor, pages)
+
+        self.assertEqual(set(testers), {page.pk for page in pages})
+        self.assertEqual(testers[self.root_page.pk].permissions, set())
+        self.assertEqual(testers[self.reports_page.pk].permissions, {"change"})
+        self.assertEqual(testers[self.editor_report.pk].permissions, {"change"})
+        self.assertFalse(testers[self.root_page.pk].can_edit())
+        self.assertTrue(testers[self.editor_report.pk].can_edit())
+
+    def test_testers_for_pages_superuser(self):
+        with self.assertNumQueries(0):
+            testers = self.policy.testers_for_pages(self.superuser, [self.root_page])
+        self.assertTrue(testers[self.root_page.pk].can_edit())
+
     def test_user_has_permission(self):
         self.assertUserPermissionMatrix(
             [
@@ -5,12 +5,16 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
 from django.db.models import Count, Q
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import translation
 
+from wagtail.blocks import StreamValue
+from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Locale, Page, PageViewRestriction, Site, Workflow
 from wagtail.search.query import MATCH_ALL
 from wagtail.signals import page_unpublished
 from wagtail.test.testapp.models import (
+    DefaultStreamPage,
     EventPage,
     SimplePage,
     SingleEventPage,
@@ -648,6 +652,199 @@ class TestPageQuerySet(TestCase):
                         )
 
 
+class TestPrefetchStreamBlocks(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        from wagtail.images import get_image_model
+
+        image_model = get_image_model()
+        self.images = [
+            image_model.objects.create(
+                title=f"Test image {i}", file=get_test_image_file()
+            )
+            for i in range(3)
+        ]
+        for image in self.images:
+            image.get_rendition("fill-10x10")
+
+        home = Page.objects.get(url_path="/home/")
+        for i in range(3):
+            home.add_child(
+                instance=StreamPage(
+                    title=f"Stream page {i}",
+                    body=[
+                        ("text", "Some text"),
+                        ("image", self.images[i]),
+                        ("image", self.images[(i + 1) % 3]),
+                    ],
+                )
+            )
+
+    def get_images(self, pages):
+        return [
+            block.value
+            for page in pages
+            for block in page.body
+            if block.block_type == "image"
+        ]
+
+    def test_without_prefetch_stream_blocks(self):
+        pages = list(StreamPage.objects.all())
+        # One query per page to fetch its images
+        with self.assertNumQueries(3):
+            self.get_images(pages)
+
+    def test_prefetch_stream_blocks(self):
+        # One query for the pages, one for the images on all pages
+        with self.assertNumQueries(2):
+            pages = list(StreamPage.objects.prefetch_stream_blocks("body"))
+
+        with self.assertNumQueries(0):
+            images = self.get_images(pages)
+
+        self.assertEqual(
+            [image.id for image in images],
+            [
+                self.images[0].id,
+                self.images[1].id,
+                self.images[1].id,
+                self.images[2].id,
+                self.images[2].id,
+                self.images[0].id,
+            ],
+        )
+
+    # Disable the rendition cache, so that only the prefetched renditions are used
+    @override_settings(
+        CACHES={
+            "renditions": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+            },
+        }
+    )
+    def test_prefetch_stream_blocks_with_renditions(self):
+        # One query for the pages, one for the images and one for their renditions
+        with self.assertNumQueries(3):
+            pages = list(
+                StreamPage.objects.prefetch_stream_blocks(
+                    "body", renditions=["fill-10x10"]
+                )
+            )
+
+        with self.assertNumQueries(0):
+            for image in self.get_images(pages):
+                image.get_rendition("fill-10x10")
+
+    def test_prefetch_stream_blocks_on_specific_queryset(self):
+        # Pages without a body field are skipped
+        queryset = (
+            Page.objects.filter(depth__gt=1).specific().prefetch_stream_blocks("body")
+        )
+        pages = [page for page in queryset if isinstance(page, StreamPage)]
+        self.assertEqual(len(pages), 3)
+
+        with self.assertNumQueries(0):
+            self.get_images(pages)
+
+    def test_prefetch_stream_blocks_across_page_types(self):
+        home = Page.objects.get(url_path="/home/")
+        home.add_child(
+            instance=DefaultStreamPage(
+                title="Default stream page",
+                body=[("image", self.images[0])],
+            )
+        )
+        pages = list(StreamPage.objects.all()) + list(DefaultStreamPage.objects.all())
+
+        # The image chooser blocks of both page types are fetched in one query
+        with self.assertNumQueries(1):
+            StreamValue.bulk_prefetch_blocks([page.body for page in pages])
+
+        with self.assertNumQueries(0):
+            images = self.get_images(pages)
+
+        self.assertEqual(
+            [image.id for image in images],
+            [
+                self.images[0].id,
+                self.images[1].id,
+                self.images[1].id,
+                self.images[2].id,
+                self.images[2].id,
+                self.images[0].id,
+                self.images[0].id,
+            ],
+        )
+
+    def test_prefetch_stream_blocks_with_deferred_streamfields(self):
+        pages = list(
+            StreamPage.objects.defer_streamfields().prefetch_stream_blocks("body")
+        )
+        self.assertEqual(len(pages), 3)
+        self.assertIn("body", pages[0].get_deferred_fields())
+
+
+@override_settings(WAGTAIL_I18N_ENABLED=True)
+class TestLocalizedPageQuerySet(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.events_index = Page.objects.get(url_path="/home/events/")
+        self.events = list(self.events_index.get_children().order_by("path").specific())
+
+        # Translate all but the last event, and publish all but the first
+        # translation
+        self.fr_events = [
+            event.copy_for_translation(self.fr_locale, copy_parents=True)
+            for event in self.events[:-1]
+        ]
+        for fr_event in self.fr_events[1:]:
+            fr_event.save_revision().publish()
+
+    def get_queryset(self):
+        return self.events_index.get_children().order_by("path")
+
+    def test_localized(self):
+        with translation.override("fr"):
+            # One query for the results, one for the active locale and one for
+            # all of the translations
+            with self.assertNumQueries(3):
+                pages = list(self.get_queryset().localized())
+
+        self.assertEqual(
+            [page.pk for page in pages],
+            [self.events[0].pk]
+            + [fr_event.pk for fr_event in self.fr_events[1:]]
+            + [self.events[-1].pk],
+        )
+        self.assertIs(type(pages[1]), Page)
+
+    def test_localized_include_drafts(self):
+        with translation.override("fr"):
+            pages = list(self.get_queryset().localized(include_drafts=True))
+
+        self.assertEqual(
+            [page.pk for page in pages],
+            [fr_event.pk for fr_event in self.fr_events] + [self.events[-1].pk],
+        )
+
+    def test_localized_specific(self):
+        with translation.override("fr"):
+            pages = list(self.get_queryset().specific().localized())
+
+        self.assertEqual(pages[1], self.fr_events[1])
+        self.assertIsInstance(pages[1], EventPage)
+        self.assertEqual(pages[1].title, self.fr_events[1].title)
+
+    def test_localized_same_language(self):
+        with self.assertNumQueries(2):
+            pages = list(self.get_queryset().localized())
+
+        self.assertEqual(pages, [event.page_ptr for event in self.events])
+
+
 class TestPageQueryInSite(TestCase):
     fixtures = ["test.json"]
 
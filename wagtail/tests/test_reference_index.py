@@ -1,4 +1,5 @@
 from io import StringIO
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
@@ -10,6 +11,7 @@ from wagtail.documents import get_document_model
 from wagtail.documents.tests.utils import get_test_document_file
 from wagtail.images import get_image_model
 from wagtail.images.tests.utils import get_test_image_file
+from wagtail.management.commands.rebuild_references_index import Command
 from wagtail.models import Page, ReferenceIndex
 from wagtail.rich_text import RichText
 from wagtail.test.testapp.models import (
@@ -24,6 +26,7 @@ from wagtail.test.testapp.models import (
     ModelWithNullableParentalKey,
     VariousOnDeleteModel,
 )
+from wagtail.utils.executors import InlineExecutor
 
 
 class TestCreateOrUpdateForObject(TestCase):
@@ -168,6 +171,102 @@ class TestCreateOrUpdateForObject(TestCase):
             },
         )
 
+    def test_create_or_update_for_objects(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other_page = EventPage(
+                title="Other event page",
+                slug="other-event-page",
+                location="the moon",
+                audience="public",
+                cost="free",
+                date_from="2001-01-01",
+                feed_image=self.test_image_2,
+            )
+            self.root_page.add_child(instance=other_page)
+
+        ReferenceIndex.objects.all().delete()
+        reference_to_remove = ReferenceIndex.objects.create(
+            base_content_type=ReferenceIndex._get_base_content_type(other_page),
+            content_type=ContentType.objects.get_for_model(other_page),
+            object_id=other_page.pk,
+            to_content_type=self.image_content_type,
+            to_object_id=self.test_image_1.pk,
+            model_path="hero_image",  # Field doesn't exist
+            content_path="hero_image",
+            content_path_hash=ReferenceIndex._get_content_path_hash("hero_image"),
+        )
+
+        ReferenceIndex.create_or_update_for_objects([self.event_page, other_page])
+
+        self.assertFalse(
+            ReferenceIndex.objects.filter(id=reference_to_remove.id).exists()
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(other_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            {
+                (
+                    self.image_content_type.id,
+                    str(self.test_image_2.pk),
+                    "feed_image",
+                    "feed_image",
+                ),
+            },
+        )
+
+    def test_updates_batched_per_transaction(self):
+        with mock.patch.object(
+            ReferenceIndex,
+            "create_or_update_for_objects",
+            wraps=ReferenceIndex.create_or_update_for_objects,
+        ) as create_or_update_for_objects:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.event_page.feed_image = self.test_image_2
+                self.event_page.save()
+                carousel_item = self.event_page.carousel_items.get(sort_order=1)
+                carousel_item.image = self.test_image_2
+                carousel_item.save()
+                self.test_image_1.save()
+                self.test_image_2.save()
+
+        indexed_objects = [
+            call.args[0] for call in create_or_update_for_objects.call_args_list
+        ]
+        # One update for the images, and one each for the page and its carousel
+        # item (which is indexed against the page)
+        self.assertCountEqual(
+            indexed_objects,
+            [
+                [self.test_image_1, self.test_image_2],
+                [self.event_page],
+                [self.event_page],
+            ],
+        )
+        self.assertIn(
+            (
+                self.image_content_type.id,
+                str(self.test_image_2.pk),
+                "carousel_items.item.image",
+                f"carousel_items.{carousel_item.id}.image",
+            ),
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+        )
+
     def test_saving_base_model_does_not_remove_references(self):
         with self.captureOnCommitCallbacks(execute=True):
             page = Page.objects.get(pk=self.event_page.pk)
@@ -250,6 +349,86 @@ class TestCreateOrUpdateForObject(TestCase):
         refs = ReferenceIndex.get_references_to(content_type)
         self.assertEqual(refs.count(), 0)
 
+    def test_create_for_objects(self):
+        ReferenceIndex.objects.all().delete()
+
+        ReferenceIndex.create_for_objects([self.event_page])
+
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+
+    def test_create_for_objects_skips_references_recorded_for_superclass(self):
+        ReferenceIndex.objects.all().delete()
+        # Record references from the base Page fields first, as the rebuild does
+        ReferenceIndex.create_for_objects([Page.objects.get(pk=self.event_page.pk)])
+        base_references = set(
+            ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                "id", "content_type"
+            )
+        )
+
+        ReferenceIndex.create_for_objects([self.event_page])
+
+        # The existing records are kept as they were
+        self.assertTrue(
+            base_references.issubset(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "id", "content_type"
+                )
+            )
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+
+    def get_all_references(self):
+        return set(
+            ReferenceIndex.objects.values_list(
+                "content_type",
+                "base_content_type",
+                "object_id",
+                "to_content_type",
+                "to_object_id",
+                "model_path",
+                "content_path",
+            )
+        )
+
+    def test_rebuild_references_index(self):
+        references = self.get_all_references()
+        ReferenceIndex.objects.all().delete()
+
+        management.call_command(
+            "rebuild_references_index", chunk_size=2, stdout=StringIO()
+        )
+
+        self.assertSetEqual(self.get_all_references(), references)
+
+    # Worker processes can't see data created in a test transaction
+    @mock.patch.object(Command, "get_executor", lambda self, workers: InlineExecutor())
+    def test_rebuild_references_index_with_workers(self):
+        references = self.get_all_references()
+        ReferenceIndex.objects.all().delete()
+
+        stdout = StringIO()
+        management.call_command(
+            "rebuild_references_index", chunk_size=2, workers=2, stdout=stdout
+        )
+
+        self.assertSetEqual(self.get_all_references(), references)
+        self.assertIn("Indexed", stdout.getvalue())
+
     def test_rebuild_references_index_no_verbosity(self):
         stdout = StringIO()
         management.call_command(
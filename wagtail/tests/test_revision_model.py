@@ -1,15 +1,25 @@
 import datetime
+import json
+from io import StringIO
 
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.core import management
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import TestCase, override_settings
 from freezegun import freeze_time
 
-from wagtail.models import Page, Revision, get_default_page_content_type
+from wagtail.models import (
+    Page,
+    Revision,
+    get_default_page_content_type,
+    is_revision_delta,
+)
 from wagtail.test.testapp.models import (
     FullFeaturedSnippet,
     RevisableGrandChildModel,
     RevisableModel,
     SimplePage,
+    StreamPage,
 )
 
 
@@ -218,3 +228,147 @@ class TestRevisableModel(TestCase):
                 self.assertEqual(Revision.objects.filter(**query).first(), revision)
                 instance.delete()
                 self.assertIs(Revision.objects.filter(**query).exists(), not cascades)
+
+
+@override_settings(WAGTAIL_REVISION_SNAPSHOT_INTERVAL=3)
+class TestRevisionDeltaStorage(TestCase):
+    def setUp(self):
+        self.homepage = Page.objects.get(url_path="/home/")
+        self.page = StreamPage(
+            title="Stream page",
+            slug="stream-page",
+            body=[("text", "Paragraph %d " % i + "x" * 100) for i in range(10)],
+        )
+        self.homepage.add_child(instance=self.page)
+
+    def save_revisions(self, count):
+        revisions = []
+        for i in range(count):
+            self.page.title = "Stream page %d" % i
+            self.page.body[i] = ("text", "Edited paragraph %d" % i)
+            revisions.append(self.page.save_revision())
+        return revisions
+
+    def get_stored(self, revision):
+        return Revision.objects.filter(pk=revision.pk).values_list(
+            "base_revision_id", "content"
+        )[0]
+
+    def assertContentEqual(self, revision, expected_revision):
+        # Compare with the content as it is stored in the database
+        self.assertEqual(
+            Revision.objects.get(pk=revision.pk).content,
+            json.loads(json.dumps(expected_revision.content, cls=DjangoJSONEncoder)),
+        )
+
+    def test_revisions_are_stored_as_deltas(self):
+        revisions = self.save_revisions(6)
+        first = revisions[0]
+
+        self.assertEqual(
+            [revision.base_revision_id for revision in revisions],
+            [None, first.pk, first.pk, None, revisions[3].pk, revisions[3].pk],
+        )
+
+        base_revision_id, stored_content = self.get_stored(revisions[2])
+        self.assertEqual(base_revision_id, first.pk)
+        self.assertTrue(is_revision_delta(stored_content))
+        self.assertLess(len(json.dumps(stored_content)), len(json.dumps(first.content)))
+
+        for revision in revisions:
+            self.assertContentEqual(revision, revision)
+
+        page = Revision.objects.get(pk=revisions[2].pk).as_object()
+        self.assertEqual(page.title, "Stream page 2")
+        self.assertEqual(page.body[2].value, "Edited paragraph 2")
+        self.assertEqual(page.body[3].value, "Paragraph 3 " + "x" * 100)
+
+    def test_deferred_content(self):
+        revision = self.save_revisions(2)[1]
+        revision_from_db = Revision.objects.defer("content").get(pk=revision.pk)
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                revision_from_db.content["title"], revision.content["title"]
+            )
+
+    def test_update_delta_revision(self):
+        revision = Revision.objects.get(pk=self.save_revisions(2)[1].pk)
+        revision.content["title"] = "Updated"
+        revision.save()
+
+        revision_from_db = Revision.objects.get(pk=revision.pk)
+        self.assertEqual(revision_from_db.base_revision_id, revision.base_revision_id)
+        self.assertEqual(revision_from_db.content["title"], "Updated")
+
+    @override_settings(WAGTAIL_REVISION_SNAPSHOT_INTERVAL=0)
+    def test_disabled(self):
+        revisions = self.save_revisions(2)
+        self.assertEqual(
+            [self.get_stored(revision)[0] for revision in revisions], [None, None]
+        )
+
+    def test_small_content_is_stored_in_full(self):
+        instance = RevisableModel.objects.create(text="foo")
+        instance.save_revision()
+        instance.text = "bar"
+        revision = instance.save_revision()
+
+        self.assertIsNone(revision.base_revision_id)
+        self.assertFalse(is_revision_delta(self.get_stored(revision)[1]))
+
+    def test_delete_base_revision(self):
+        revisions = self.save_revisions(3)
+
+        revisions[0].delete()
+
+        self.assertEqual(self.get_stored(revisions[1])[0], None)
+        self.assertEqual(self.get_stored(revisions[2])[0], revisions[1].pk)
+        self.assertTrue(is_revision_delta(self.get_stored(revisions[2])[1]))
+        self.assertContentEqual(revisions[1], revisions[1])
+        self.assertContentEqual(revisions[2], revisions[2])
+
+    def test_delete_object(self):
+        self.save_revisions(4)
+        self.page.delete()
+        self.assertFalse(Revision.objects.filter(object_id=str(self.page.pk)).exists())
+
+    def test_copy_page_with_revisions(self):
+        revisions = self.save_revisions(2)
+        page_copy = self.page.copy(
+            to=self.homepage, update_attrs={"slug": "stream-page-copy"}
+        )
+
+        copied_revisions = page_copy.revisions.order_by("created_at", "id")
+        self.assertEqual(len(copied_revisions), 3)
+        self.assertEqual(
+            [revision.base_revision_id for revision in copied_revisions],
+            [None, copied_revisions[0].pk, copied_revisions[0].pk],
+        )
+        for revision, copied_revision in zip(revisions, copied_revisions):
+            self.assertEqual(
+                copied_revision.content["title"], revision.content["title"]
+            )
+            self.assertEqual(copied_revision.content["pk"], page_copy.pk)
+
+    def test_convert_revision_storage(self):
+        with override_settings(WAGTAIL_REVISION_SNAPSHOT_INTERVAL=0):
+            revisions = self.save_revisions(5)
+
+        management.call_command(
+            "convert_revision_storage", snapshot_interval=2, stdout=StringIO()
+        )
+        self.assertEqual(
+            [self.get_stored(revision)[0] for revision in revisions],
+            [None, revisions[0].pk, None, revisions[2].pk, None],
+        )
+        for revision in revisions:
+            self.assertContentEqual(revision, revision)
+
+        output = StringIO()
+        management.call_command(
+            "convert_revision_storage", snapshot_interval=0, stdout=output
+        )
+        self.assertIn("Updated 2 revisions of 1 objects", output.getvalue())
+        for revision in revisions:
+            self.assertIsNone(self.get_stored(revision)[0])
+            self.assertContentEqual(revision, revision)
@@ -1,15 +1,30 @@
 from unittest.mock import patch
 
+from django.core.files.base import ContentFile
+from django.core.signals import request_finished, request_started
 from django.forms.models import modelform_factory
 from django.test import TestCase, override_settings
 from django.utils import translation
 
+from wagtail.documents import get_document_model
 from wagtail.fields import RichTextField
 from wagtail.models import Locale, Page, Site
-from wagtail.rich_text import RichText, RichTextMaxLengthValidator, expand_db_html
+from wagtail.rich_text import (
+    RichText,
+    RichTextMaxLengthValidator,
+    entity_cache,
+    expand_db_html,
+    get_entity_cache,
+)
 from wagtail.rich_text.feature_registry import FeatureRegistry
 from wagtail.rich_text.pages import PageLinkHandler
-from wagtail.rich_text.rewriters import LinkRewriter, extract_attrs
+from wagtail.rich_text.rewriters import (
+    EmbedRewriter,
+    LinkRewriter,
+    MultiRuleRewriter,
+    TagRewriter,
+    extract_attrs,
+)
 from wagtail.test.testapp.models import EventIndex, EventPage
 from wagtail.test.utils.form_data import rich_text
 
@@ -73,6 +88,31 @@ class TestPageLinktypeHandlerWithI18N(TestCase):
             result = PageLinkHandler.expand_db_attributes({"id": self.event_page.id})
             self.assertEqual(result, '<a href="/en/events/christmas/">')
 
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        }
+    )
+    def test_expand_db_attributes_many_localizes_in_bulk(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        attrs_list = [{"id": self.event_page.id}, {"id": events_index.id}]
+
+        Site.clear_site_root_paths_cache()
+        Site.get_site_root_paths()
+
+        with translation.override("fr"):
+            # 3 queries for the pages and their specific types, 1 for the
+            # active locale and 3 for the translations and their specific types
+            with self.assertNumQueries(7):
+                result = PageLinkHandler.expand_db_attributes_many(attrs_list)
+
+        self.assertEqual(
+            result,
+            ['<a href="/fr/events/noel/">', '<a href="/fr/events/">'],
+        )
+
 
 class TestExtractAttrs(TestCase):
     def test_extract_attr(self):
@@ -213,6 +253,92 @@ This is another image: <embed embedtype="image" id="2" format="left" />
             ),
         )
 
+    def test_expand_db_html_with_entity_cache(self):
+        html = '<a linktype="document" id="1">foo</a>'
+        with entity_cache():
+            with self.assertNumQueries(1):
+                expand_db_html(html)
+            with self.assertNumQueries(0):
+                result = expand_db_html(html)
+
+        self.assertEqual(result, '<a href="/documents/1/test.pdf">foo</a>')
+
+        # The cache is discarded on leaving the block
+        with self.assertNumQueries(1):
+            expand_db_html(html)
+
+    def test_entity_cache_caches_missing_instances(self):
+        html = '<a linktype="document" id="9999">foo</a>'
+        with entity_cache():
+            with self.assertNumQueries(1):
+                expand_db_html(html)
+            with self.assertNumQueries(0):
+                result = expand_db_html(html)
+
+        self.assertEqual(result, "<a>foo</a>")
+
+
+class TestEntityCache(TestCase):
+    fixtures = ["test.json"]
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_entity_cache(PageLinkHandler))
+
+    def test_enabled_for_duration_of_request(self):
+        request_started.send(sender=self.__class__)
+        try:
+            cache = get_entity_cache(PageLinkHandler)
+            self.assertEqual(cache, {})
+            self.assertIs(get_entity_cache(PageLinkHandler), cache)
+        finally:
+            request_finished.send(sender=self.__class__)
+
+        self.assertIsNone(get_entity_cache(PageLinkHandler))
+
+    def test_cleared_when_object_is_created(self):
+        html = '<a linktype="document" id="9999">foo</a>'
+        with entity_cache():
+            with self.assertNumQueries(1):
+                self.assertEqual(expand_db_html(html), "<a>foo</a>")
+
+            get_document_model().objects.create(
+                id=9999, title="Created", file=ContentFile(b"Hello", name="new.pdf")
+            )
+            self.assertEqual(
+                expand_db_html(html), '<a href="/documents/9999/new.pdf">foo</a>'
+            )
+
+    def test_cleared_when_object_is_deleted(self):
+        html = '<a linktype="document" id="1">foo</a>'
+        with entity_cache():
+            self.assertEqual(
+                expand_db_html(html), '<a href="/documents/1/test.pdf">foo</a>'
+            )
+            get_document_model().objects.get(id=1).delete()
+            self.assertEqual(expand_db_html(html), "<a>foo</a>")
+
+    def test_cleared_when_page_subclass_is_saved(self):
+        with entity_cache():
+            cache = get_entity_cache(PageLinkHandler)
+            cache["1"] = None
+            page = EventPage.objects.get(url_path="/home/events/christmas/")
+            page.title = "Christmas"
+            page.save()
+            self.assertEqual(get_entity_cache(PageLinkHandler), {})
+
+    def test_not_cleared_when_other_objects_are_saved(self):
+        with entity_cache():
+            cache = get_entity_cache(PageLinkHandler)
+            cache["1"] = None
+            Site.objects.get(is_default_site=True).save()
+            self.assertIs(get_entity_cache(PageLinkHandler), cache)
+
+    def test_keyed_by_active_language(self):
+        with entity_cache():
+            cache = get_entity_cache(PageLinkHandler)
+            with translation.override("fr"):
+                self.assertIsNot(get_entity_cache(PageLinkHandler), cache)
+
 
 class TestRichTextValue(TestCase):
     fixtures = ["test.json"]
@@ -354,6 +480,78 @@ class TestLinkRewriterTagReplacing(TestCase):
         )
 
 
+class TestMultiRuleRewriter(TestCase):
+    def test_tag_rewriters_applied_in_single_pass(self):
+        rewriter = MultiRuleRewriter(
+            [
+                LinkRewriter(
+                    rules={"page": lambda attrs: '<a href="/%s/">' % attrs["id"]}
+                ),
+                EmbedRewriter(rules={"thing": lambda attrs: "[%s]" % attrs["id"]}),
+            ]
+        )
+        with patch.object(TagRewriter, "__call__", side_effect=AssertionError):
+            result = rewriter(
+                '<p><a linktype="page" id="1">one</a><embed embedtype="thing" id="2" />'
+                '<a linktype="page" id="3">three</a> <embed embedtype="thing" id="4" /></p>'
+            )
+
+        self.assertEqual(
+            result,
+            '<p><a href="/1/">one</a>[2]<a href="/3/">three</a> [4]</p>',
+        )
+
+    def test_other_rewriters_applied_in_sequence(self):
+        rewriter = MultiRuleRewriter(
+            [
+                LinkRewriter(
+                    rules={"page": lambda attrs: '<a href="/%s/">' % attrs["id"]}
+                ),
+                lambda html: html.upper(),
+            ]
+        )
+        self.assertEqual(
+            rewriter('<a linktype="page" id="foo">foo</a>'),
+            '<A HREF="/FOO/">FOO</A>',
+        )
+
+    def test_rewriter_overriding_call_applied_in_sequence(self):
+        class UpperCaseLinkRewriter(LinkRewriter):
+            def __call__(self, html):
+                return super().__call__(html).upper()
+
+        rewriter = MultiRuleRewriter(
+            [
+                EmbedRewriter(rules={"thing": lambda attrs: "[%s]" % attrs["id"]}),
+                UpperCaseLinkRewriter(
+                    rules={"page": lambda attrs: '<a href="/%s/">' % attrs["id"]}
+                ),
+            ]
+        )
+        self.assertEqual(
+            rewriter(
+                '<a linktype="page" id="foo">foo</a><embed embedtype="thing" id="bar" />'
+            ),
+            '<A HREF="/FOO/">FOO</A>[BAR]',
+        )
+
+    def test_long_string(self):
+        rewriter = MultiRuleRewriter(
+            [
+                LinkRewriter(
+                    rules={"page": lambda attrs: '<a href="/%s/">' % attrs["id"]}
+                )
+            ]
+        )
+        html = "".join(
+            '<p><a linktype="page" id="%d">%d</a></p>' % (i, i) for i in range(1000)
+        )
+        self.assertEqual(
+            rewriter(html),
+            "".join('<p><a href="/%d/">%d</a></p>' % (i, i) for i in range(1000)),
+        )
+
+
 class TestRichTextField(TestCase):
     fixtures = ["test.json"]
 
@@ -1,8 +1,10 @@
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
+from wagtail.models.sites import SITE_LOOKUP_TABLE_VERSION_CACHE_KEY
 
 
 class TestSiteNaturalKey(TestCase):
@@ -152,6 +154,131 @@ class TestFindSiteForRequest(TestCase):
         self.assertEqual(Site.find_for_request(request), self.default_site)
 
 
+@override_settings(
+    WAGTAIL_SITE_LOOKUP_TABLE=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestFindSiteForRequestWithLookupTable(TestFindSiteForRequest):
+    # This inherits from TestFindSiteForRequest so contains all the same test cases
+
+    def setUp(self):
+        super().setUp()
+        # The lookup table is normally kept in sync by the Site signal handlers,
+        # but these are bypassed when the database is rolled back between tests
+        Site.clear_site_lookup_table()
+
+    def test_no_queries_once_built(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        with self.assertNumQueries(1):
+            self.assertEqual(Site.find_for_request(request), self.site)
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "unknown.com", "SERVER_PORT": 80})
+        with self.assertNumQueries(0):
+            self.assertEqual(Site.find_for_request(request), self.default_site)
+
+    def test_root_page_is_attached(self):
+        root_page = Page.objects.get(pk=2)
+        # Build the lookup table
+        Site.find_for_request(get_dummy_request(site=self.site))
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        with self.assertNumQueries(0):
+            site = Site.find_for_request(request)
+            self.assertEqual(site.root_page, root_page)
+            self.assertEqual(Page.route_for_request(request, "/")[0], root_page)
+
+    def test_root_page_changes_are_picked_up(self):
+        request = get_dummy_request(site=self.site)
+        Site.find_for_request(request)
+
+        root_page = Page.objects.get(pk=2)
+        root_page.title = "New title"
+        with self.captureOnCommitCallbacks(execute=True):
+            root_page.save()
+
+        request = get_dummy_request(site=self.site)
+        self.assertEqual(Site.find_for_request(request).root_page.title, "New title")
+
+    def test_site_instances_are_not_shared(self):
+        request_1 = get_dummy_request(site=self.site)
+        request_2 = get_dummy_request(site=self.site)
+        site_1 = Site.find_for_request(request_1)
+        site_2 = Site.find_for_request(request_2)
+        self.assertEqual(site_1, site_2)
+        self.assertIsNot(site_1, site_2)
+
+    def test_precedence(self):
+        self.default_site.hostname = "default.com"
+        self.default_site.save()
+        alternate_port_site = Site.objects.create(
+            hostname="example.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+        Site.objects.create(
+            hostname="other.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+        Site.objects.create(
+            hostname="other.com", port=8081, root_page=Page.objects.get(pk=2)
+        )
+        unique_site = Site.objects.create(
+            hostname="unique.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+
+        for hostname, port, expected_site in [
+            # hostname and port match
+            ("example.com", "8080", alternate_port_site),
+            # hostname matches the default site
+            ("default.com", "8000", self.default_site),
+            # hostname is not unique, so falls back on the default site
+            ("example.com", "8000", self.default_site),
+            ("other.com", "8000", self.default_site),
+            # hostname is unique
+            ("unique.com", "8000", unique_site),
+            # unknown hostname
+            ("unknown.com", "8080", self.default_site),
+        ]:
+            with self.subTest(hostname=hostname, port=port):
+                request = get_dummy_request()
+                request.META.update({"HTTP_HOST": hostname, "SERVER_PORT": port})
+                self.assertEqual(Site.find_for_request(request), expected_site)
+
+    def test_no_default_site(self):
+        self.default_site.delete()
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "unknown.com", "SERVER_PORT": 80})
+        self.assertIsNone(Site.find_for_request(request))
+
+    def test_invalidated_on_save(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "unknown.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.default_site)
+
+        new_site = Site.objects.create(
+            hostname="unknown.com", port=80, root_page=Page.objects.get(pk=2)
+        )
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "unknown.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), new_site)
+
+    def test_invalidated_by_version_key(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.site)
+
+        # Simulate another process changing the site and clearing the version key,
+        # without the signal handlers running in this process
+        Site.objects.filter(pk=self.site.pk).update(hostname="example.org")
+        cache.delete(SITE_LOOKUP_TABLE_VERSION_CACHE_KEY)
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.default_site)
+
+
 class TestDefaultSite(TestCase):
     def test_create_default_site(self):
         Site.objects.all().delete()
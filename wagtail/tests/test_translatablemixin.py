@@ -4,8 +4,9 @@ from django.conf import settings
 from django.core import checks
 from django.db import models
 from django.test import TestCase, override_settings
+from django.utils import translation
 
-from wagtail.models import Locale
+from wagtail.models import Locale, get_localized_many
 from wagtail.test.i18n.models import (
     ClusterableTestModel,
     ClusterableTestModelChild,
@@ -187,6 +188,85 @@ class TestLocalized(TestCase):
 
         self.assertEqual(instance, self.en_instance)
 
+    @override_settings(
+        WAGTAIL_LOCALE_REGISTRY=True,
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        },
+    )
+    def test_localized_same_language_with_locale_registry(self):
+        Locale.clear_locale_registry()
+        Locale.get_active()
+
+        with self.assertNumQueries(0):
+            instance = self.en_instance.localized
+
+        self.assertEqual(instance, self.en_instance)
+
+
+@override_settings(WAGTAIL_I18N_ENABLED=True)
+class TestLocalizedQuerySet(TestCase):
+    def setUp(self):
+        self.en_locale = Locale.objects.get()
+        self.fr_locale = Locale.objects.create(language_code="fr")
+
+        self.en_instances = [
+            make_test_instance(locale=self.en_locale, title=f"Model {i}")
+            for i in range(3)
+        ]
+        self.fr_instances = [
+            make_test_instance(
+                locale=self.fr_locale,
+                translation_key=en_instance.translation_key,
+                title=f"Modèle {i}",
+            )
+            for i, en_instance in enumerate(self.en_instances[:2])
+        ]
+
+    def test_localized(self):
+        queryset = TestModel.objects.filter(locale=self.en_locale).order_by("pk")
+
+        with translation.override("fr"):
+            # One query for the results, one for the active locale and one for
+            # all of the translations
+            with self.assertNumQueries(3):
+                instances = list(queryset.localized())
+
+        # The instance without a translation is left as it is
+        self.assertEqual(instances, self.fr_instances + self.en_instances[2:])
+
+    def test_localized_same_language(self):
+        queryset = TestModel.objects.filter(locale=self.en_locale).order_by("pk")
+
+        with self.assertNumQueries(2):
+            instances = list(queryset.localized())
+
+        self.assertEqual(instances, self.en_instances)
+
+    def test_localized_values(self):
+        queryset = TestModel.objects.filter(locale=self.en_locale).order_by("pk")
+
+        with translation.override("fr"):
+            titles = list(queryset.localized().values_list("title", flat=True))
+
+        self.assertEqual(titles, ["Model 0", "Model 1", "Model 2"])
+
+    @override_settings(WAGTAIL_I18N_ENABLED=False)
+    def test_localized_with_i18n_disabled(self):
+        queryset = TestModel.objects.filter(locale=self.en_locale).order_by("pk")
+
+        with translation.override("fr"):
+            with self.assertNumQueries(1):
+                instances = list(queryset.localized())
+
+        self.assertEqual(instances, self.en_instances)
+
+    def test_get_localized_many(self):
+        with translation.override("fr"):
+            instances = get_localized_many([self.en_instances[0], None])
+
+        self.assertEqual(instances, [self.fr_instances[0], None])
+
 
 class TestSystemChecks(TestCase):
     def test_unique_together_raises_no_error(self):
@@ -1,4 +1,5 @@
 import hashlib
+import json
 import os
 import pickle
 import tempfile
@@ -9,8 +10,10 @@ from pathlib import Path
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DEFAULT_DB_ALIAS, transaction
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils.text import slugify
 from django.utils.translation import _trans
@@ -31,8 +34,11 @@ from wagtail.coreutils import (
     string_to_ascii,
 )
 from wagtail.models import Page, Site
+from wagtail.utils.batching import ObjectTaskBatcher
 from wagtail.utils.deprecation import RemovedInWagtail70Warning
 from wagtail.utils.file import hash_filelike
+from wagtail.utils.json_delta import apply_delta, make_delta
+from wagtail.utils.process_cache import VersionedProcessCache
 from wagtail.utils.templates import template_is_overridden
 from wagtail.utils.utils import deep_update, flatten_choices
 from wagtail.utils.version import get_main_version
@@ -677,3 +683,166 @@ class TestWidgetWithScript(TestCase):
             category=RemovedInWagtail70Warning,
             stacklevel=3,
         )
+
+
+class TestJSONDelta(SimpleTestCase):
+    def assertRoundTrip(self, base, new):
+        delta = make_delta(base, new)
+        # Deltas must survive being stored as JSON
+        delta = json.loads(json.dumps(delta))
+        result = apply_delta(base, delta)
+        self.assertEqual(result, new)
+        if isinstance(new, dict):
+            self.assertEqual(list(result), list(new))
+        return delta
+
+    def test_equal(self):
+        self.assertIsNone(make_delta({"a": [1, 2]}, {"a": [1, 2]}))
+        self.assertEqual(apply_delta({"a": 1}, None), {"a": 1})
+
+    def test_types_are_preserved(self):
+        self.assertEqual(make_delta(True, 1), ["r", 1])
+        self.assertRoundTrip({"a": 1}, {"a": 1.0})
+
+    def test_dict(self):
+        delta = self.assertRoundTrip({"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 4, "d": 5})
+        self.assertEqual(delta, ["d", {"b": ["r", 4], "d": ["r", 5]}, ["c"], None])
+
+    def test_dict_key_order(self):
+        self.assertRoundTrip({"a": 1, "b": 2}, {"c": 3, "a": 1, "b": 2})
+
+    def test_json_string_key_order(self):
+        base = json.dumps([{"a": i, "b": "x" * 10} for i in range(20)])
+        new = json.dumps([{"b": "x" * 10, "a": i} for i in range(20)])
+        self.assertEqual(make_delta(base, new), ["r", new])
+
+    def test_list(self):
+        base = [{"id": str(i), "value": i} for i in range(10)]
+        new = base[:2] + [{"id": "x", "value": "new"}] + base[3:8]
+        new[4] = {"id": "4", "value": "changed"}
+        delta = self.assertRoundTrip(base, new)
+        self.assertEqual(
+            delta,
+            [
+                "l",
+                [
+                    ["c", 0, 2],
+                    [
+                        "p",
+                        2,
+                        ["d", {"id": ["r", "x"], "value": ["r", "new"]}, [], None],
+                    ],
+                    ["c", 3, 4],
+                    ["p", 4, ["d", {"value": ["r", "changed"]}, [], None]],
+                    ["c", 5, 8],
+                ],
+            ],
+        )
+
+    def test_json_string(self):
+        blocks = [
+            {"type": "text", "value": "Block %d" % i, "id": str(i)} for i in range(20)
+        ]
+        base = {"body": json.dumps(blocks)}
+        blocks[5]["value"] = "Changed"
+        new = {"body": json.dumps(blocks)}
+
+        delta = self.assertRoundTrip(base, new)
+        self.assertEqual(delta[1]["body"][0], "j")
+        self.assertLess(len(json.dumps(delta)), len(json.dumps(new)))
+
+    def test_json_string_with_other_formatting(self):
+        blocks = [{"type": "text", "value": "Block %d" % i} for i in range(20)]
+        base = json.dumps(blocks, separators=(",", ":"))
+        blocks[5]["value"] = "Changed"
+        new = json.dumps(blocks, separators=(",", ":"))
+
+        # The string can't be rebuilt exactly from its decoded value
+        delta = self.assertRoundTrip(base, new)
+        self.assertEqual(delta, ["r", new])
+
+
+class TestVersionedProcessCache(TestCase):
+    def setUp(self):
+        self.builds = []
+        self.cache = VersionedProcessCache(
+            "wagtail_test_process_cache_version", self.build
+        )
+        self.addCleanup(self.cache.clear)
+
+    def build(self):
+        self.builds.append(object())
+        return self.builds[-1]
+
+    def test_value_is_built_once(self):
+        value = self.cache.get()
+        self.assertIs(self.cache.get(), value)
+        self.assertEqual(len(self.builds), 1)
+
+    def test_clear(self):
+        value = self.cache.get()
+        self.cache.clear()
+        self.assertIsNot(self.cache.get(), value)
+        self.assertEqual(len(self.builds), 2)
+
+    def test_rebuilt_when_cleared_by_another_process(self):
+        value = self.cache.get()
+        # Another process clears its copy by deleting the shared version key
+        cache.delete("wagtail_test_process_cache_version")
+        self.assertIsNot(self.cache.get(), value)
+        self.assertEqual(len(self.builds), 2)
+
+    def test_clear_on_commit(self):
+        self.cache.get()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.cache.clear_on_commit()
+        self.cache.get()
+        self.assertEqual(len(self.builds), 2)
+
+        # A copy rebuilt before the commit is cleared again after it
+        for callback in callbacks:
+            callback()
+        self.cache.get()
+        self.assertEqual(len(self.builds), 3)
+
+
+class TestObjectTaskBatcher(TestCase):
+    def setUp(self):
+        self.task = unittest.mock.Mock()
+        self.batcher = ObjectTaskBatcher(self.task, batch_size=2)
+        self.content_types = list(ContentType.objects.order_by("pk")[:3])
+
+    def test_objects_batched_per_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for content_type in self.content_types:
+                self.batcher.add(content_type)
+
+        pks = [content_type.pk for content_type in self.content_types]
+        self.assertEqual(
+            self.task.enqueue.call_args_list,
+            [
+                unittest.mock.call("contenttypes", "contenttype", pks[:2]),
+                unittest.mock.call("contenttypes", "contenttype", pks[2:]),
+            ],
+        )
+
+    def test_batch_discarded_on_rollback(self):
+        rolled_back, saved = self.content_types[:2]
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.batcher.add(rolled_back)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            self.batcher.add(saved)
+            # Objects saved after the rollback are collected in a new batch
+            self.assertEqual(
+                self.batcher.get_batch(DEFAULT_DB_ALIAS).objects,
+                [("contenttypes", "contenttype", saved.pk)],
+            )
+
+        self.task.enqueue.assert_called_once_with(
+            "contenttypes", "contenttype", [saved.pk]
+        )
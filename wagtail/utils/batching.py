@@ -0,0 +1,112 @@
+from functools import partial
+
+from asgiref.local import Local
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+
+class ObjectTaskBatch:
+    """
+    Collects the objects saved within a transaction, so that once it is committed,
+    a task is enqueued once per model (with a list of primary keys) rather than
+    once per object.
+
+    A commit callback is registered for every object added to the batch, but only
+    the first of these to run does any work: it enqueues the tasks for its own object
+    and all objects added after it. This may include objects saved within a savepoint
+    that was later rolled back, whose own callbacks were discarded. That is safe, as
+    the task must re-read the objects from the database: those whose creation was
+    rolled back are not found, and the rest are processed in their committed state.
+
+    If all of the callbacks are discarded, because the transaction (or the savepoint
+    the batch was started in) was rolled back, the batch is abandoned and objects saved
+    afterwards are collected in a new one.
+    """
+
+    def __init__(self, task, batch_size):
+        self.task = task
+        self.batch_size = batch_size
+        self.objects = []
+        self.is_flushed = False
+        # The position in the connection's list of commit callbacks where this batch's
+        # first callback was registered, and the callback itself
+        self.first_callback_index = None
+        self.first_callback = None
+
+    def add(self, instance, connection):
+        self.objects.append(
+            (instance._meta.app_label, instance._meta.model_name, instance.pk)
+        )
+        position = len(self.objects) - 1
+        callback = partial(self.flush, position)
+
+        if self.first_callback is None:
+            self.first_callback_index = len(connection.run_on_commit)
+            self.first_callback = callback
+
+        # Outside of a transaction, this flushes the batch immediately
+        connection.on_commit(callback)
+
+    def is_discarded(self, connection):
+        """
+        Return True if the batch's first commit callback has been discarded by a
+        rollback. Rolling back a savepoint only discards the callbacks registered
+        after it, so the later callbacks of the batch must have been discarded too.
+        """
+        if self.first_callback is None:
+            return False
+        run_on_commit = connection.run_on_commit
+        return not (
+            len(run_on_commit) > self.first_callback_index
+            and run_on_commit[self.first_callback_index][1] is self.first_callback
+        )
+
+    def flush(self, position):
+        if self.is_flushed:
+            return
+        self.is_flushed = True
+
+        # dicts are used rather than sets to de-duplicate the primary keys, so that
+        # objects are processed in the order they were first saved
+        pks_by_model = {}
+        for app_label, model_name, pk in self.objects[position:]:
+            pks_by_model.setdefault((app_label, model_name), {})[pk] = None
+
+        for (app_label, model_name), pks in pks_by_model.items():
+            pks = list(pks)
+            for start in range(0, len(pks), self.batch_size):
+                self.task.enqueue(
+                    app_label, model_name, pks[start : start + self.batch_size]
+                )
+
+
+class ObjectTaskBatcher:
+    """
+    Enqueues ``task`` for objects as they are saved, batching together all of the
+    objects saved in the current transaction on each database. The task must
+    accept the arguments ``app_label``, ``model_name`` and ``pks``, and is given at
+    most ``batch_size`` primary keys at a time.
+    """
+
+    def __init__(self, task, batch_size=1000):
+        self.task = task
+        self.batch_size = batch_size
+        self.current_batches = Local()
+
+    def get_batch(self, using):
+        if not hasattr(self.current_batches, "value"):
+            self.current_batches.value = {}
+
+        batch = self.current_batches.value.get(using)
+        if (
+            batch is None
+            or batch.is_flushed
+            or batch.is_discarded(transaction.get_connection(using))
+        ):
+            batch = self.current_batches.value[using] = ObjectTaskBatch(
+                self.task, self.batch_size
+            )
+        return batch
+
+    def add(self, instance, using=None):
+        using = using or DEFAULT_DB_ALIAS
+        self.get_batch(using).add(instance, transaction.get_connection(using))
@@ -0,0 +1,62 @@
+from concurrent.futures import Executor, Future
+
+import django
+from django.apps import apps
+from django.db import connections
+
+
+class InlineExecutor(Executor):
+    """
+    An executor that runs each task in the current process as soon as it is
+    submitted, for use where a pool of workers is optional.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # noqa: BLE001
+            future.set_exception(e)
+        return future
+
+
+def get_pk_ranges(queryset, chunk_size):
+    """
+    Split ``queryset`` into chunks of at most ``chunk_size`` objects, ordered by
+    primary key, and yield the first and last primary key of each chunk.
+    """
+    first_pk = last_pk = None
+    count = 0
+    for pk in queryset.order_by("pk").values_list("pk", flat=True).iterator(chunk_size):
+        if count == 0:
+            first_pk = pk
+        last_pk = pk
+        count += 1
+        if count == chunk_size:
+            yield first_pk, last_pk
+            count = 0
+
+    if count:
+        yield first_pk, last_pk
+
+
+# Database connections inherited from the parent of a forked worker process
+_inherited_connections = []
+
+
+def setup_worker():
+    """
+    Initializer for worker processes. Workers that are spawned rather than forked
+    start without Django set up.
+
+    Forked workers inherit the database connections of the parent process, which
+    share its sockets. They are set aside, without being closed (which would end the
+    parent's sessions), so that the worker opens its own connections if it needs any.
+    """
+    if not apps.ready:
+        django.setup()
+        return
+
+    for connection in connections.all(initialized_only=True):
+        _inherited_connections.append(connection)
+        del connections[connection.alias]
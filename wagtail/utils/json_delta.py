@@ -0,0 +1,159 @@
+"""
+Compact deltas between JSON-compatible values, as used for revision content.
+
+A delta is a JSON-compatible list that rebuilds the new value from the base value:
+
+* ``["r", value]`` replaces the value outright.
+* ``["d", changes, removed, keys]`` patches a dict: ``changes`` maps keys to the
+  deltas of their values (new keys use ``"r"``), ``removed`` lists the keys that
+  are dropped, and ``keys`` gives the order of the keys if it has changed (else
+  ``None``).
+* ``["l", segments]`` rebuilds a list from segments: ``["c", start, end]`` copies
+  ``base[start:end]``, ``["p", index, delta]`` patches ``base[index]``, and
+  ``["i", values]`` inserts new values.
+* ``["j", delta]`` patches a string holding JSON (such as the value of a
+  StreamField), by decoding it, applying the delta and encoding it again.
+"""
+
+import json
+from difflib import SequenceMatcher
+
+# Strings shorter than this aren't worth decoding as JSON
+MIN_JSON_STRING_LENGTH = 200
+
+
+def make_delta(base, new):
+    """
+    Return the delta that rebuilds ``new`` from ``base``, or None if they are equal.
+    """
+    if type(base) is type(new) and base == new:
+        return None
+
+    if isinstance(base, dict) and isinstance(new, dict):
+        return _make_dict_delta(base, new)
+
+    if isinstance(base, list) and isinstance(new, list):
+        return _make_list_delta(base, new)
+
+    if isinstance(base, str) and isinstance(new, str):
+        delta = _make_json_string_delta(base, new)
+        if delta is not None:
+            return delta
+
+    return ["r", new]
+
+
+def apply_delta(base, delta):
+    """
+    Return the value given by applying ``delta`` (as returned by ``make_delta``) to
+    ``base``.
+    """
+    if delta is None:
+        return base
+
+    kind = delta[0]
+    if kind == "r":
+        return delta[1]
+
+    if kind == "d":
+        changes, removed, keys = delta[1:]
+        removed = set(removed)
+        value = {key: item for key, item in base.items() if key not in removed}
+        for key, item_delta in changes.items():
+            value[key] = apply_delta(base.get(key), item_delta)
+        if keys is not None:
+            value = {key: value[key] for key in keys}
+        return value
+
+    if kind == "l":
+        value = []
+        for segment in delta[1]:
+            if segment[0] == "c":
+                value.extend(base[segment[1] : segment[2]])
+            elif segment[0] == "p":
+                value.append(apply_delta(base[segment[1]], segment[2]))
+            else:
+                value.extend(segment[1])
+        return value
+
+    if kind == "j":
+        return json.dumps(apply_delta(json.loads(base), delta[1]))
+
+    raise ValueError(f"Unknown delta type: {kind!r}")
+
+
+def _make_dict_delta(base, new):
+    changes = {}
+    for key, item in new.items():
+        if key in base:
+            item_delta = make_delta(base[key], item)
+            if item_delta is not None:
+                changes[key] = item_delta
+        else:
+            changes[key] = ["r", item]
+
+    removed = [key for key in base if key not in new]
+
+    # Applying the changes keeps the base's keys in place and appends new ones
+    expected_keys = [key for key in base if key in new] + [
+        key for key in new if key not in base
+    ]
+    keys = list(new) if expected_keys != list(new) else None
+
+    return ["d", changes, removed, keys]
+
+
+def _make_list_delta(base, new):
+    matcher = SequenceMatcher(
+        None,
+        [json.dumps(item, sort_keys=True) for item in base],
+        [json.dumps(item, sort_keys=True) for item in new],
+        autojunk=False,
+    )
+
+    segments = []
+    for tag, base_start, base_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            segments.append(["c", base_start, base_end])
+        elif tag == "replace" and base_end - base_start == new_end - new_start:
+            # Items changed in place, such as edited blocks, are patched
+            for offset in range(base_end - base_start):
+                segments.append(
+                    [
+                        "p",
+                        base_start + offset,
+                        make_delta(base[base_start + offset], new[new_start + offset]),
+                    ]
+                )
+        elif tag in ("replace", "insert"):
+            segments.append(["i", new[new_start:new_end]])
+
+    return ["l", segments]
+
+
+def _make_json_string_delta(base, new):
+    if (
+        len(base) < MIN_JSON_STRING_LENGTH
+        or len(new) < MIN_JSON_STRING_LENGTH
+        or base[0] not in "[{"
+        or new[0] not in "[{"
+    ):
+        return None
+
+    try:
+        base_value = json.loads(base)
+        new_value = json.loads(new)
+    except ValueError:
+        return None
+
+    # Only use a delta if encoding the value again gives exactly the same string
+    if json.dumps(base_value) != base or json.dumps(new_value) != new:
+        return None
+
+    # Dicts that only differ in the order of their keys are equal, so check that
+    # the delta gives exactly the same string too
+    delta = make_delta(base_value, new_value)
+    if json.dumps(apply_delta(base_value, delta)) != new:
+        return None
+
+    return ["j", delta]
@@ -0,0 +1,60 @@
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class VersionedProcessCache:
+    """
+    Holds a value built from the database, such as an index of all records of a
+    model, in the memory of each process.
+
+    A version key is held in the Django cache, so that clearing the value in one
+    process (when the records change) makes every other process rebuild its copy
+    on its next use. This relies on the Django cache being shared between
+    processes; with a per-process cache, copies are only rebuilt when they are
+    cleared in the same process.
+    """
+
+    def __init__(self, version_cache_key, build):
+        self.version_cache_key = version_cache_key
+        self.build = build
+        self._current = None
+
+    def get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def get(self):
+        """
+        Return the value, building it if it has been cleared in this process or if
+        the version has changed since it was built.
+        """
+        version = self.get_version()
+
+        current = self._current
+        if current is None or current[0] != version:
+            current = (version, self.build())
+            self._current = current
+
+        return current[1]
+
+    def clear(self):
+        """
+        Discard the value in this process, and invalidate the copies held by other
+        processes by deleting the shared version key.
+        """
+        self._current = None
+        cache.delete(self.version_cache_key)
+
+    def clear_on_commit(self):
+        """
+        Clear the value now, and again once the current transaction is committed,
+        in case another process rebuilt its copy from the database before the
+        change was visible.
+        """
+        self.clear()
+        transaction.on_commit(self.clear)